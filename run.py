@@ -10,16 +10,19 @@ import logging
 import os
 import pstats
 import sys
-import tkinter as tk
+import time
 from pstats import SortKey
 
+_START_TIME = time.perf_counter()
+
 # Proje kök dizinini sys.path'e ekle
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Modülleri import et
+# Hafif modülleri import et; arayüz ve model modülleri run_app() içinde
+# yüklenir, böylece --help gibi komutlar anında yanıt verir
 from src import setup_logging
-from src.main_app import SignLanguageApp
-from ui_design import AppUI  # Mevcut UI tasarımı kullanılıyor
+from src.config import Config
+from src.exceptions import ConfigurationException
 
 
 def parse_arguments():
@@ -38,18 +41,49 @@ def parse_arguments():
     parser.add_argument(
         "--profile", action="store_true", help="Performans profillemesini etkinleştir"
     )
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Yapılandırma dosyası yolu (varsayılan: config.yaml)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Alt sistem başına import ve servis başlatma sürelerini göster",
+    )
 
     return parser.parse_args()
 
 
-def run_app():
-    """Uygulamayı çalıştırır."""
+def run_app(startup_report=None):
+    """Uygulamayı çalıştırır.
+
+    Args:
+        startup_report: Doluysa import ve servis süreleri bu rapora yazılır
+            ve servisler hazır olunca rapor yazdırılır
+    """
+    import tkinter as tk
+
+    if startup_report is not None:
+        # Alt sistemleri sırayla yükle ki süreler doğru alt sisteme yazılsın
+        startup_report.preload_subsystems()
+        with startup_report.measure_import("src.main_app"):
+            from src.main_app import SignLanguageApp
+        with startup_report.measure_import("ui_design"):
+            from ui_design import AppUI  # Mevcut UI tasarımı kullanılıyor
+    else:
+        from src.main_app import SignLanguageApp
+        from ui_design import AppUI  # Mevcut UI tasarımı kullanılıyor
+
     # Ana pencereyi oluştur
     root = tk.Tk()
 
     # Uygulamayı başlat
     app = SignLanguageApp(root, AppUI)
 
+    if startup_report is not None:
+        _print_report_when_ready(root, app, startup_report)
+
     # Pencereyi odağa al
     root.focus_force()
 
@@ -57,10 +91,26 @@ def run_app():
     root.mainloop()
 
 
+def _print_report_when_ready(root, app, startup_report):
+    """Servisler hazır olduğunda başlangıç raporunu yazdırır."""
+    if not app.service_loader.all_ready():
+        root.after(100, _print_report_when_ready, root, app, startup_report)
+        return
+
+    startup_report.add_services(app.service_loader.get_timings())
+    print(startup_report.format())
+
+
 def main():
     """Ana fonksiyon."""
     args = parse_arguments()
 
+    startup_report = None
+    if args.startup_report:
+        from src.startup_report import StartupReport
+
+        startup_report = StartupReport(start_time=_START_TIME)
+
     # Log seviyesini belirle
     log_level = logging.DEBUG if args.debug else logging.INFO
 
@@ -73,6 +123,12 @@ def main():
     logger = logging.getLogger("SignLanguageApp")
     logger.info("İşaret Dili Çevirici Uygulaması başlatılıyor...")
 
+    # Yapılandırmayı yükle (dosya yoksa varsayılanlar kullanılır)
+    try:
+        Config().load_config(args.config)
+    except ConfigurationException as e:
+        logger.warning(f"Yapılandırma yüklenemedi, varsayılanlar kullanılıyor: {e}")
+
     try:
         if args.profile:
             # Profiling başlat
@@ -80,7 +136,7 @@ def main():
             profiler.enable()
 
             # Uygulamayı çalıştır
-            run_app()
+            run_app(startup_report)
 
             # Profiling sonlandır
             profiler.disable()
@@ -95,7 +151,7 @@ def main():
             stats.print_stats(20)  # En yavaş 20 fonksiyonu göster
         else:
             # Normal çalıştır
-            run_app()
+            run_app(startup_report)
 
     except Exception as e:
         logger.critical(f"Uygulama başlatılamadı: {e}", exc_info=True)
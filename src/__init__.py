@@ -47,6 +47,26 @@ __all__ = [
     "sign_language_service",
     "app_state",
     "main_app",
+    "frame_capture",
+    "frame_pipeline",
+    "frame_scheduler",
+    "motion_gate",
+    "landmark_flow",
+    "hand_tracker",
+    "forest_compiler",
+    "prediction_cache",
+    "model_artifact",
+    "service_loader",
+    "lazy_import",
+    "startup_report",
+    "stability_tracker",
+    "gesture_matcher",
+    "detection_worker",
+    "stream_pool",
+    "batch_transcriber",
+    "recognition_server",
+    "landmark_codec",
+    "inference_batcher",
 ]
 
 # Version info
@@ -21,6 +21,7 @@ class AppState:
             "current_text": "",
             "translated_text": "",
             "last_added_letter": None,
+            "letter_count": 0,  # Letters added so far (display refresh key)
             "cap": None,
             "last_detection_time": time.time(),
             "word_timeout": 1.0,  # 1 second gap = new word
@@ -67,6 +68,7 @@ class AppState:
             "current_text": "",
             "translated_text": "",
             "last_added_letter": None,
+            "letter_count": 0,
             "cap": None,
             "last_detection_time": time.time(),
             "word_timeout": 1.0,
@@ -99,10 +101,34 @@ class AppState:
         self._state["current_word"] += letter
         self._state["last_detection_time"] = time.time()
         self._state["last_added_letter"] = letter
+        self._state["letter_count"] += 1
         logger.debug(
             f"Letter added: {letter}, new word: {self._state['current_word']}"
         )
 
+    def commit_prediction(self, letter, is_stable):
+        """Adds a stable predicted letter unless it was just added.
+
+        The same letter can only be added again after a space (or at the
+        start of a word), so a held sign is not repeated.
+
+        Args:
+            letter: Most frequently predicted letter
+            is_stable: Whether the prediction is stable
+
+        Returns:
+            bool: True if the letter was added
+        """
+        is_new_letter = (
+            letter != self._state["last_added_letter"]
+            or self._state["current_word"] == ""
+        )
+        if not (letter and is_stable and is_new_letter):
+            return False
+
+        self.add_letter(letter)
+        return True
+
     def add_space(self):
         """Adds a space to the text."""
         if self._state["current_word"]:
@@ -0,0 +1,378 @@
+"""
+Batch Transcriber
+Headless transcription of recorded videos and image sequences.
+
+Every input is run through SignLanguageService in video (tracking) mode with
+the same stability and commit rules as the application; the committed
+letters and words are written with their frame timestamps as JSON lines or
+SRT subtitles. Inputs are processed in parallel in a pool of processes.
+
+Usage::
+
+    python -m src.batch_transcriber session1.mp4 session2.mp4 frames_dir/ \\
+        --format srt --workers 4
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+from src.app_state import AppState
+from src.config import Config
+from src.exceptions import ConfigurationException, SignLanguageError
+from src.lazy_import import lazy_import
+from src.sign_language_service import SignLanguageService
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".bmp", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp")
+OUTPUT_FORMATS = ("jsonl", "srt")
+
+
+def iter_frames(path, image_fps=30.0):
+    """Yields the frames of a video file or an image directory.
+
+    Args:
+        path: Video file or directory of images (sorted by name)
+        image_fps: Frame rate assigned to image sequences
+
+    Yields:
+        tuple: (frame index, timestamp in seconds, BGR frame)
+
+    Raises:
+        SignLanguageError: If the input cannot be read
+    """
+    if os.path.isdir(path):
+        names = sorted(
+            name for name in os.listdir(path) if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        for index, name in enumerate(names):
+            frame = cv2.imread(os.path.join(path, name))
+            if frame is None:
+                logger.warning(f"Image could not be read: {name}")
+                continue
+            yield index, index / image_fps, frame
+        return
+
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise SignLanguageError(f"Video could not be opened: {path}")
+    fps = capture.get(cv2.CAP_PROP_FPS) or image_fps
+    try:
+        index = 0
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            yield index, index / fps, frame
+            index += 1
+    finally:
+        capture.release()
+
+
+class Transcript:
+    """Turns per-frame predictions into committed letters and words.
+
+    Letters are committed like in the application (``update_prediction`` and
+    ``AppState.commit_prediction``); a word ends when no hand has been seen
+    for ``AppState``'s word timeout of video time.
+    """
+
+    def __init__(self, service):
+        """Initializes the transcript.
+
+        Args:
+            service: SignLanguageService rating the frames
+        """
+        self.service = service
+        self.state = AppState()
+        self.word_timeout = self.state.get("word_timeout")
+        self.events = []
+        self._word_start = None
+        self._last_hand_time = None
+
+    def add_frame(self, index, timestamp, letter):
+        """Applies the prediction of one frame.
+
+        Args:
+            index: Frame index
+            timestamp: Frame time in seconds
+            letter: Letter of the active hand ("" if none)
+        """
+        if letter:
+            self._last_hand_time = timestamp
+        elif (
+            self._word_start is not None
+            and timestamp - self._last_hand_time >= self.word_timeout
+        ):
+            self.end_word(index, timestamp)
+
+        predicted_letter, _, count, is_stable = self.service.update_prediction(
+            letter, self.service.last_confidence, timestamp
+        )
+        if not (predicted_letter and count > 0):
+            return
+        if self.state.commit_prediction(predicted_letter, is_stable):
+            self.service.clear_predictions()
+            if self._word_start is None:
+                self._word_start = timestamp
+            self.events.append(
+                {
+                    "type": "letter",
+                    "letter": predicted_letter,
+                    "frame": index,
+                    "time": round(timestamp, 3),
+                }
+            )
+
+    def end_word(self, index, timestamp):
+        """Closes the current word (if any).
+
+        Args:
+            index: Frame index of the word end
+            timestamp: Time of the word end in seconds
+        """
+        word = self.state.get("current_word")
+        if word:
+            self.events.append(
+                {
+                    "type": "word",
+                    "word": word,
+                    "frame": index,
+                    "start": round(self._word_start, 3),
+                    "end": round(timestamp, 3),
+                }
+            )
+            self.state.add_space()
+        self._word_start = None
+
+    def get_text(self):
+        """Returns the transcribed text."""
+        return self.state.get_display_text().strip()
+
+
+def format_srt_time(seconds):
+    """Formats seconds as an SRT timestamp (HH:MM:SS,mmm)."""
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def write_events(events, output_path, output_format):
+    """Writes transcript events to a file.
+
+    Args:
+        events: Letter and word events
+        output_path: Output file
+        output_format: "jsonl" (every event) or "srt" (one cue per word)
+    """
+    with open(output_path, "w", encoding="utf-8") as f:
+        if output_format == "jsonl":
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            return
+
+        words = [event for event in events if event["type"] == "word"]
+        for number, word in enumerate(words, start=1):
+            f.write(
+                f"{number}\n"
+                f"{format_srt_time(word['start'])} --> "
+                f"{format_srt_time(word['end'])}\n"
+                f"{word['word']}\n\n"
+            )
+
+
+def transcribe_file(
+    input_path, output_path, output_format="jsonl", service_options=None, image_fps=30.0
+):
+    """Transcribes one video file or image directory.
+
+    Runs in a pool process; the service is created per input so every file
+    starts with fresh hand tracks.
+
+    Args:
+        input_path: Video file or image directory
+        output_path: Output file
+        output_format: "jsonl" or "srt"
+        service_options: Keyword arguments of SignLanguageService
+        image_fps: Frame rate assigned to image sequences
+
+    Returns:
+        dict: Input, output, frame count, processing time, worker pid, text
+    """
+    start = time.perf_counter()
+    service = SignLanguageService(**(service_options or {}))
+    try:
+        transcript = Transcript(service)
+        frames = 0
+        index, timestamp = 0, 0.0
+        for index, timestamp, frame in iter_frames(input_path, image_fps):
+            _, letter, _ = service.process_frame(frame, timestamp)
+            transcript.add_frame(index, timestamp, letter)
+            frames += 1
+        transcript.end_word(index, timestamp)
+    finally:
+        service.release_resources()
+
+    write_events(transcript.events, output_path, output_format)
+    return {
+        "input": input_path,
+        "output": output_path,
+        "frames": frames,
+        "seconds": time.perf_counter() - start,
+        "pid": os.getpid(),
+        "text": transcript.get_text(),
+    }
+
+
+def _output_path(input_path, output_dir, output_format):
+    """Returns the output file of an input (next to it by default)."""
+    base = os.path.basename(os.path.normpath(input_path))
+    directory = output_dir or os.path.dirname(os.path.abspath(input_path))
+    return os.path.join(directory, f"{os.path.splitext(base)[0]}.{output_format}")
+
+
+def transcribe_all(
+    inputs,
+    output_dir=None,
+    output_format="jsonl",
+    workers=None,
+    service_options=None,
+    image_fps=30.0,
+):
+    """Transcribes several inputs in parallel.
+
+    Args:
+        inputs: Video files and/or image directories
+        output_dir: Output directory (default: next to every input)
+        output_format: "jsonl" or "srt"
+        workers: Number of pool processes (default: CPU count)
+        service_options: Keyword arguments of SignLanguageService
+        image_fps: Frame rate assigned to image sequences
+
+    Returns:
+        tuple: (list of results, list of (input, error message))
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    results, failures = [], []
+    workers = min(workers or os.cpu_count() or 1, len(inputs)) or 1
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+        futures = {
+            pool.submit(
+                transcribe_file,
+                path,
+                _output_path(path, output_dir, output_format),
+                output_format,
+                service_options,
+                image_fps,
+            ): path
+            for path in inputs
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                failures.append((futures[future], str(e)))
+    return results, failures
+
+
+def summarize_workers(results):
+    """Sums frames and processing time per worker process.
+
+    Args:
+        results: Results of ``transcribe_file``
+
+    Returns:
+        dict: Worker pid -> {"files", "frames", "seconds", "fps"}
+    """
+    workers = {}
+    for result in results:
+        worker = workers.setdefault(
+            result["pid"], {"files": 0, "frames": 0, "seconds": 0.0}
+        )
+        worker["files"] += 1
+        worker["frames"] += result["frames"]
+        worker["seconds"] += result["seconds"]
+
+    for worker in workers.values():
+        worker["fps"] = (
+            worker["frames"] / worker["seconds"] if worker["seconds"] else 0.0
+        )
+    return workers
+
+
+def main(argv=None):
+    """Command line tool: transcribes videos without the user interface."""
+    parser = argparse.ArgumentParser(
+        description="Transcribe sign language videos without the user interface"
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="Video files and/or directories of images"
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="jsonl",
+        help="Output format (default: jsonl)",
+    )
+    parser.add_argument(
+        "--output-dir", help="Output directory (default: next to every input)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Number of parallel processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--image-fps",
+        type=float,
+        default=30.0,
+        help="Frame rate of image directories (default: 30)",
+    )
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Configuration file (default: config.yaml)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    try:
+        Config().load_config(args.config)
+    except ConfigurationException as e:
+        logger.warning(f"Configuration could not be loaded, using defaults: {e}")
+
+    results, failures = transcribe_all(
+        args.inputs,
+        args.output_dir,
+        args.format,
+        args.workers,
+        SignLanguageService.options_from_config(),
+        args.image_fps,
+    )
+
+    for result in results:
+        print(f"{result['input']} -> {result['output']}: {result['text']}")
+    for path, error in failures:
+        print(f"{path}: failed ({error})", file=sys.stderr)
+    for pid, worker in summarize_workers(results).items():
+        print(
+            f"Worker {pid}: {worker['files']} files, {worker['frames']} frames, "
+            f"{worker['fps']:.1f} FPS"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,497 @@
+"""
+Detection Worker
+Runs hand detection and letter classification in a separate process.
+
+Frames travel through a ring of preallocated shared memory slots, so only
+small messages (slot numbers, letters, stability values) cross the process
+boundary; nothing large is pickled. The worker process owns its own
+interpreter and GIL, so MediaPipe and the model never compete with the UI.
+"""
+
+import logging
+import multiprocessing
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.exceptions import ProcessingError, SignLanguageError
+from src.sign_language_service import MODEL_OPTIONS, SignLanguageService
+
+logger = logging.getLogger(__name__)
+
+
+class SharedFrameRing:
+    """Fixed number of equally sized frame slots in one shared memory block."""
+
+    def __init__(self, shape, dtype=np.uint8, slots=3, name=None):
+        """Creates the ring or attaches to an existing one.
+
+        Args:
+            shape: Frame shape (e.g. (480, 640, 3))
+            dtype: Frame dtype
+            slots: Number of frame slots
+            name: Shared memory block to attach to (a new one is created if
+                None)
+        """
+        if slots < 1:
+            raise ValueError("Frame ring needs at least one slot")
+
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = slots
+        self.owner = name is None
+
+        frame_size = int(np.prod(self.shape)) * self.dtype.itemsize
+        if self.owner:
+            self._memory = shared_memory.SharedMemory(
+                create=True, size=frame_size * slots
+            )
+        else:
+            # Worker processes are spawned with the creator's resource
+            # tracker, so attaching does not hand the block over to them
+            self._memory = shared_memory.SharedMemory(name=name)
+
+        self._frames = np.ndarray(
+            (slots,) + self.shape, dtype=self.dtype, buffer=self._memory.buf
+        )
+
+    @property
+    def name(self):
+        """Name of the shared memory block."""
+        return self._memory.name
+
+    def get_spec(self):
+        """Returns the arguments another process needs to attach."""
+        return {
+            "shape": self.shape,
+            "dtype": self.dtype.str,
+            "slots": self.slots,
+            "name": self.name,
+        }
+
+    def frame(self, slot):
+        """Returns the frame stored in a slot (a view, not a copy)."""
+        return self._frames[slot]
+
+    def close(self):
+        """Detaches from the shared memory; the owner also frees it."""
+        self._frames = None
+        self._memory.close()
+        if self.owner:
+            try:
+                self._memory.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _worker_main(service_class, service_options, stream_ids, requests, results):
+    """Entry point of the worker process.
+
+    The model is loaded once and shared by the services of all streams; every
+    stream keeps its own detector, hand tracks and stability window. The
+    services of the given streams are created at startup, so loading errors
+    are reported right away and no stream stalls the others on its first
+    frame.
+
+    Args:
+        service_class: Class of the service to run (SignLanguageService)
+        service_options: Keyword arguments of the service
+        stream_ids: Streams served by the worker
+        requests: Queue of commands from the application
+        results: Queue of results to the application
+    """
+    model_options = {
+        name: value for name, value in service_options.items() if name in MODEL_OPTIONS
+    }
+    try:
+        model = service_class.load_model(**model_options)
+        services = {
+            stream_id: service_class(**service_options, model=model)
+            for stream_id in stream_ids
+        }
+    except Exception as e:
+        results.put(("error", str(e)))
+        return
+
+    service = next(iter(services.values()))
+    results.put(("ready", service.required_stable_frames))
+    ring = None
+
+    try:
+        while True:
+            message = requests.get()
+            if message is None:
+                break
+
+            kind = message[0]
+            if kind == "ring":
+                if ring is not None:
+                    ring.close()
+                ring = SharedFrameRing(**message[1])
+            elif kind == "warm_up":
+                for service in services.values():
+                    service.warm_up(message[1])
+                results.put(("warmed_up",))
+            elif kind == "clear":
+                if message[1] in services:
+                    services[message[1]].clear_predictions()
+            elif kind == "frame":
+                _, sequence, slot, stream_id = message
+                try:
+                    service = services.get(stream_id)
+                    if service is None:
+                        service = services[stream_id] = service_class(
+                            **service_options, model=model
+                        )
+
+                    frame = ring.frame(slot)
+                    processed_frame, letter, stability = service.process_frame(frame)
+                    if processed_frame is not frame:
+                        frame[...] = processed_frame
+
+                    # Stability is tracked here, next to the hand tracks
+                    prediction = service.update_prediction(
+                        letter, service.last_confidence
+                    )
+                    results.put(
+                        (
+                            "frame",
+                            sequence,
+                            slot,
+                            letter,
+                            stability,
+                            service.last_confidence,
+                            prediction,
+                        )
+                    )
+                except Exception as e:
+                    results.put(("frame_error", sequence, slot, str(e)))
+    finally:
+        if ring is not None:
+            ring.close()
+        for service in services.values():
+            service.release_resources()
+
+
+class DetectionWorker:
+    """Sign language service running in a separate process.
+
+    ``submit`` copies a frame into a free ring slot and returns at once;
+    ``poll`` collects the finished frames. A frame is dropped when every slot
+    is still being processed. The worker also tracks letter stability, so
+    every result carries the ``update_prediction`` output of its frame.
+
+    One worker can serve several streams; each stream id has its own service
+    state in the worker, and all of them share one loaded model. All frames
+    must have the same shape.
+    """
+
+    def __init__(
+        self, service_options=None, slots=3, start_timeout=120.0, stream_ids=None
+    ):
+        """Initializes the worker (the process is started by ``start``).
+
+        Args:
+            service_options: Keyword arguments of SignLanguageService
+            slots: Number of frame slots (frames in flight)
+            start_timeout: Seconds to wait for the service to load
+            stream_ids: Streams whose services are created at startup
+                (default: only the default stream None)
+        """
+        self.service_options = service_options or {}
+        self.stream_ids = list(stream_ids) if stream_ids else [None]
+        self.slots = slots
+        self.start_timeout = start_timeout
+        self.required_stable_frames = None
+        self.last_confidence = None
+
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._ring = None
+        self._free_slots = deque()
+        self._submit_times = {}
+        self._submit_streams = {}
+        self._completed = {}
+        self._next_sequence = 0
+
+        # Statistics
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.errors = 0
+        self._total_latency = 0.0
+
+    def start(self, service_class=SignLanguageService):
+        """Starts the worker process and waits until its service is loaded.
+
+        Args:
+            service_class: Service class to run in the worker
+
+        Returns:
+            DetectionWorker: self
+
+        Raises:
+            SignLanguageError: If the service could not be created in time
+        """
+        self._requests = self._context.Queue()
+        self._results = self._context.Queue()
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(
+                service_class,
+                self.service_options,
+                self.stream_ids,
+                self._requests,
+                self._results,
+            ),
+            name="DetectionWorker",
+            daemon=True,
+        )
+        self._process.start()
+
+        message = self._wait_for(("ready", "error"), self.start_timeout)
+        if message[0] == "error":
+            self._process.join(timeout=1.0)
+            raise SignLanguageError(f"Detection worker could not start: {message[1]}")
+
+        self.required_stable_frames = message[1]
+        logger.info(f"Detection worker started (pid {self._process.pid})")
+        return self
+
+    def _receive(self, deadline):
+        """Returns the next message from the worker.
+
+        Raises:
+            SignLanguageError: If nothing arrives before the deadline
+        """
+        try:
+            return self._results.get(timeout=max(deadline - time.monotonic(), 0.0))
+        except queue.Empty:
+            raise SignLanguageError("Detection worker did not respond")
+
+    def _wait_for(self, kinds, timeout):
+        """Handles results until a message of one of the given kinds arrives."""
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self._receive(deadline)
+            if message[0] in kinds:
+                return message
+            self._handle_message(message)
+
+    def warm_up(self, frame_size=(640, 480)):
+        """Warms the detectors and the model of the worker up on a dummy frame.
+
+        Args:
+            frame_size: (width, height) of the dummy frame
+        """
+        self._requests.put(("warm_up", frame_size))
+        self._wait_for(("warmed_up",), self.start_timeout)
+
+    def submit(self, frame, stream_id=None):
+        """Hands a frame to the worker without waiting for the result.
+
+        Args:
+            frame: Frame to process (copied into shared memory)
+            stream_id: Stream the frame belongs to
+
+        Returns:
+            bool: False if the frame was dropped because every slot is busy
+
+        Raises:
+            ProcessingError: If the frame shape differs from earlier frames
+        """
+        if self._try_submit(frame, stream_id):
+            return True
+        self.dropped += 1
+        return False
+
+    def _try_submit(self, frame, stream_id=None):
+        """Copies a frame into a free slot; returns False if none is free."""
+        if self._ring is None:
+            self._ring = SharedFrameRing(frame.shape, frame.dtype, self.slots)
+            self._free_slots.extend(range(self.slots))
+            self._requests.put(("ring", self._ring.get_spec()))
+        elif frame.shape != self._ring.shape or frame.dtype != self._ring.dtype:
+            raise ProcessingError(
+                f"Frame shape {frame.shape} does not match the frame ring "
+                f"{self._ring.shape}"
+            )
+
+        if not self._free_slots:
+            return False
+
+        slot = self._free_slots.popleft()
+        np.copyto(self._ring.frame(slot), frame)
+
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._submit_times[sequence] = time.perf_counter()
+        self._submit_streams[sequence] = stream_id
+        self._requests.put(("frame", sequence, slot, stream_id))
+        self.submitted += 1
+        return True
+
+    def _handle_message(self, message):
+        """Copies a finished frame out of its slot and frees the slot."""
+        kind = message[0]
+        if kind == "frame":
+            _, sequence, slot, letter, stability, confidence, prediction = message
+            self._completed[sequence] = {
+                "sequence": sequence,
+                "stream_id": self._submit_streams.pop(sequence),
+                "frame": self._ring.frame(slot).copy(),
+                "letter": letter,
+                "stability": stability,
+                "confidence": confidence,
+                "prediction": prediction,
+            }
+            self.completed += 1
+        elif kind == "frame_error":
+            _, sequence, slot, error = message
+            self._submit_streams.pop(sequence)
+            logger.error(f"Detection worker frame error: {error}")
+            self.errors += 1
+        else:
+            logger.warning(f"Unexpected detection worker message: {kind}")
+            return
+
+        self._free_slots.append(slot)
+        self._total_latency += time.perf_counter() - self._submit_times.pop(sequence)
+
+    def poll(self, timeout=0.0):
+        """Returns the frames finished since the last call.
+
+        Args:
+            timeout: Seconds to wait for a result if none is ready
+
+        Returns:
+            list: Result dicts ("stream_id", "frame", "letter", "stability",
+            "confidence", "prediction") in submission order
+        """
+        if self._results is None:
+            return []
+
+        if not self._completed and timeout > 0:
+            try:
+                self._handle_message(self._results.get(timeout=timeout))
+            except queue.Empty:
+                pass
+
+        while True:
+            try:
+                self._handle_message(self._results.get_nowait())
+            except queue.Empty:
+                break
+
+        results = [self._completed.pop(s) for s in sorted(self._completed)]
+        if results:
+            self.last_confidence = results[-1]["confidence"]
+        return results
+
+    def process_frame(self, frame, timeout=5.0):
+        """Processes a frame and waits for its result.
+
+        Args:
+            frame: Frame to process
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            tuple: (processed frame, detected letter, stability value)
+
+        Raises:
+            ProcessingError: If the frame was not processed in time
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            # Wait for a free slot, then for the result of this frame
+            while not self._try_submit(frame):
+                self._handle_message(self._receive(deadline))
+            sequence = self._next_sequence - 1
+
+            while sequence not in self._completed:
+                if sequence not in self._submit_times:
+                    raise ProcessingError("Frame could not be processed by the worker")
+                self._handle_message(self._receive(deadline))
+        except SignLanguageError:
+            raise ProcessingError("Detection worker did not respond in time")
+
+        result = self._completed.pop(sequence)
+        self.last_confidence = result["confidence"]
+        return result["frame"], result["letter"], result["stability"]
+
+    def clear_predictions(self, stream_id=None):
+        """Clears the prediction history of a stream in the worker.
+
+        Args:
+            stream_id: Stream whose history is cleared
+        """
+        if self._requests is not None:
+            self._requests.put(("clear", stream_id))
+
+    def get_in_flight_streams(self):
+        """Returns the ids of the streams that have frames in the worker."""
+        return set(self._submit_streams.values())
+
+    def get_free_slots(self):
+        """Returns the number of slots available for new frames."""
+        if self._ring is None:
+            return self.slots
+        return len(self._free_slots)
+
+    def is_alive(self):
+        """Returns whether the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def get_stats(self):
+        """Returns worker statistics.
+
+        Returns:
+            dict: Frame counts and average round-trip latency
+        """
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "in_flight": len(self._submit_times),
+            "avg_latency_ms": (
+                self._total_latency / (self.completed + self.errors) * 1000
+                if self.completed + self.errors
+                else 0.0
+            ),
+        }
+
+    def release_resources(self, timeout=2.0):
+        """Stops the worker process and frees the frame ring.
+
+        Args:
+            timeout: Seconds to wait for the process to exit
+        """
+        if self._process is not None:
+            if self._process.is_alive():
+                self._requests.put(None)
+                self._process.join(timeout)
+            if self._process.is_alive():
+                logger.warning("Detection worker did not stop, terminating")
+                self._process.terminate()
+                self._process.join(timeout)
+            self._process = None
+
+        for worker_queue in (self._requests, self._results):
+            if worker_queue is not None:
+                worker_queue.close()
+                worker_queue.cancel_join_thread()
+        self._requests = self._results = None
+
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        self._free_slots.clear()
+        self._submit_times.clear()
+        self._submit_streams.clear()
+        self._completed.clear()
@@ -60,6 +60,13 @@ class ConfigurationException(YasminBaseException):
         super().__init__(message)
 
 
+class ModelException(YasminBaseException):
+    """Exception class for model file related errors"""
+
+    def __init__(self, message="An error occurred while loading the model"):
+        super().__init__(message)
+
+
 """
 Custom error classes for Sign Language Translator.
 """
@@ -0,0 +1,259 @@
+"""
+Forest Compiler
+Flattens a fitted scikit-learn random forest into contiguous NumPy arrays
+for fast prediction of small batches.
+"""
+
+import logging
+from importlib.metadata import version
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Trees fitted with scikit-learn >= 1.4 store class fractions in their leaves,
+# older versions store (weighted) counts that predict_proba normalizes
+# (read from the package metadata: importing sklearn itself is slow)
+_SKLEARN_VERSION = tuple(int(v) for v in version("scikit-learn").split(".")[:2])
+_LEAVES_NORMALIZED = _SKLEARN_VERSION >= (1, 4)
+
+
+class CompiledForest:
+    """Array-backed random forest evaluator.
+
+    All trees share one set of node arrays. Leaves point to themselves, so a
+    traversal can advance every (tree, sample) pair in lockstep until all of
+    them sit in a leaf. Thresholds are stored as the largest float32 not
+    above the original float64 threshold, which keeps the ``x <= threshold``
+    decisions on float32 inputs identical to scikit-learn. Leaf
+    probabilities are summed in tree order like ``predict_proba``, so the
+    results match scikit-learn bit for bit.
+    """
+
+    def __init__(
+        self,
+        feature,
+        threshold,
+        left,
+        right,
+        leaf_index,
+        leaf_values,
+        roots,
+        classes,
+        max_depth,
+        n_features=None,
+    ):
+        """Initializes the evaluator from prepared arrays.
+
+        Args:
+            feature: Split feature per node (int16)
+            threshold: Split threshold per node (float32)
+            left: Left child per node, leaves point to themselves (int32)
+            right: Right child per node, leaves point to themselves (int32)
+            leaf_index: Row of ``leaf_values`` per node, -1 for split nodes
+            leaf_values: Class probabilities per leaf (float64)
+            roots: Root node of every tree (int32)
+            classes: Class labels of the forest
+            max_depth: Depth of the deepest tree
+            n_features: Number of input features (if known)
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.leaf_index = leaf_index
+        self.leaf_values = leaf_values
+        self.roots = roots
+        self.classes = classes
+        self.max_depth = max_depth
+        self.n_features = n_features
+
+    @property
+    def n_trees(self):
+        """Number of trees in the forest."""
+        return len(self.roots)
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        """Compiles a fitted ``RandomForestClassifier``.
+
+        Args:
+            forest: Fitted single-output scikit-learn forest classifier
+
+        Returns:
+            CompiledForest: Compiled evaluator
+
+        Raises:
+            ValueError: If the model is not a supported forest
+        """
+        estimators = getattr(forest, "estimators_", None)
+        if not estimators or getattr(forest, "n_outputs_", 1) != 1:
+            raise ValueError(
+                "Only fitted single-output forest classifiers can be compiled"
+            )
+
+        n_classes = int(forest.n_classes_)
+        features, thresholds, lefts, rights = [], [], [], []
+        leaf_indices, leaf_values, roots = [], [], []
+        node_offset = leaf_offset = 0
+        max_depth = 0
+
+        for estimator in estimators:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            is_leaf = tree.children_left == -1
+            node_ids = np.arange(n_nodes, dtype=np.int32) + node_offset
+
+            threshold = tree.threshold.astype(np.float32)
+            # Round down so that x32 <= t32 exactly when x32 <= t64
+            above = threshold.astype(np.float64) > tree.threshold
+            threshold[above] = np.nextafter(threshold[above], np.float32(-np.inf))
+
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int16))
+            thresholds.append(np.where(is_leaf, np.float32(0), threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + node_offset))
+            rights.append(
+                np.where(is_leaf, node_ids, tree.children_right + node_offset)
+            )
+
+            proba = tree.value[is_leaf, 0, :n_classes].astype(np.float64)
+            if not _LEAVES_NORMALIZED:
+                normalizer = proba.sum(axis=1)[:, np.newaxis]
+                normalizer[normalizer == 0.0] = 1.0
+                proba /= normalizer
+            leaf_values.append(proba)
+
+            leaf_index = np.full(n_nodes, -1, dtype=np.int32)
+            leaf_index[is_leaf] = np.arange(is_leaf.sum()) + leaf_offset
+            leaf_indices.append(leaf_index)
+
+            roots.append(node_offset)
+            node_offset += n_nodes
+            leaf_offset += int(is_leaf.sum())
+            max_depth = max(max_depth, int(tree.max_depth))
+
+        compiled = cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts).astype(np.int32),
+            right=np.concatenate(rights).astype(np.int32),
+            leaf_index=np.concatenate(leaf_indices),
+            leaf_values=np.concatenate(leaf_values),
+            roots=np.asarray(roots, dtype=np.int32),
+            classes=np.asarray(forest.classes_),
+            max_depth=max_depth,
+            n_features=getattr(forest, "n_features_in_", None),
+        )
+        logger.info(
+            f"Forest compiled: {compiled.n_trees} trees, {node_offset} nodes, "
+            f"depth {max_depth}"
+        )
+        return compiled
+
+    def apply(self, X, trees=None):
+        """Finds the leaf reached by every sample in every tree.
+
+        Args:
+            X: (n_samples, n_features) input, evaluated as float32
+            trees: Optional slice or index array selecting the trees
+
+        Returns:
+            numpy.ndarray: (n_trees, n_samples) leaf node ids
+        """
+        X = np.asarray(X, dtype=np.float32)
+        roots = self.roots if trees is None else self.roots[trees]
+        nodes = np.repeat(roots[:, np.newaxis], X.shape[0], axis=1)
+        samples = np.arange(X.shape[0])
+
+        for _ in range(self.max_depth):
+            go_left = X[samples, self.feature[nodes]] <= self.threshold[nodes]
+            next_nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+            if np.array_equal(next_nodes, nodes):
+                break
+            nodes = next_nodes
+
+        return nodes
+
+    def predict_proba(self, X):
+        """Predicts class probabilities like ``RandomForestClassifier``.
+
+        Args:
+            X: (n_samples, n_features) input
+
+        Returns:
+            numpy.ndarray: (n_samples, n_classes) probabilities
+        """
+        tree_proba = self.leaf_values[self.leaf_index[self.apply(X)]]
+        # Sequential sum in tree order (matches scikit-learn's accumulation)
+        return np.add.accumulate(tree_proba, axis=0)[-1] / self.n_trees
+
+    def predict_proba_anytime(self, X, block_size=10, confidence=None):
+        """Predicts class probabilities, stopping once the vote is settled.
+
+        Trees are evaluated in blocks. Evaluation stops when, for every
+        sample, the leading class is ahead of the runner-up by more than the
+        remaining trees could add (the full forest cannot change the answer),
+        or when the leading class has reached ``confidence``. The
+        probabilities are the vote of the evaluated trees only; when all
+        trees are needed they equal ``predict_proba`` (up to the rounding of
+        the summation order).
+
+        Args:
+            X: (n_samples, n_features) input
+            block_size: Number of trees evaluated per block
+            confidence: Optional mean probability of the leading class at
+                which evaluation stops early
+
+        Returns:
+            tuple: ((n_samples, n_classes) probabilities over the evaluated
+            trees, number of trees used)
+        """
+        X = np.asarray(X, dtype=np.float32)
+        totals = np.zeros((X.shape[0], self.leaf_values.shape[1]))
+        trees_used = 0
+
+        while trees_used < self.n_trees:
+            block = slice(trees_used, min(trees_used + block_size, self.n_trees))
+            tree_proba = self.leaf_values[self.leaf_index[self.apply(X, block)]]
+            totals += tree_proba.sum(axis=0)
+            trees_used = block.stop
+
+            remaining = self.n_trees - trees_used
+            if remaining == 0:
+                break
+
+            top_two = np.sort(totals, axis=1)[:, -2:]
+            if (top_two[:, 1] - top_two[:, 0] > remaining).all():
+                break
+            if (
+                confidence is not None
+                and (top_two[:, 1] / trees_used >= confidence).all()
+            ):
+                break
+
+        return totals / trees_used, trees_used
+
+    def predict_anytime(self, X, block_size=10, confidence=None):
+        """Predicts class labels with early exit (see ``predict_proba_anytime``).
+
+        Args:
+            X: (n_samples, n_features) input
+            block_size: Number of trees evaluated per block
+            confidence: Optional confidence at which evaluation stops early
+
+        Returns:
+            tuple: (predicted class labels, number of trees used)
+        """
+        proba, trees_used = self.predict_proba_anytime(X, block_size, confidence)
+        return self.classes.take(np.argmax(proba, axis=1), axis=0), trees_used
+
+    def predict(self, X):
+        """Predicts class labels like ``RandomForestClassifier``.
+
+        Args:
+            X: (n_samples, n_features) input
+
+        Returns:
+            numpy.ndarray: Predicted class labels
+        """
+        return self.classes.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
@@ -0,0 +1,189 @@
+"""
+Frame Capture
+Pulls camera frames on a dedicated thread into a small drop-oldest buffer.
+"""
+
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class FrameRingBuffer:
+    """Thread-safe bounded buffer that always hands out the newest frame.
+
+    When the buffer is full the oldest frame is discarded, and when a consumer
+    takes the newest frame every older frame still waiting is discarded too.
+    Both cases are counted in ``dropped_frames``.
+    """
+
+    def __init__(self, capacity=2):
+        """Initializes the buffer.
+
+        Args:
+            capacity: Maximum number of frames kept at once
+        """
+        if capacity < 1:
+            raise ValueError("Buffer capacity must be at least 1")
+
+        self.capacity = capacity
+        self._frames = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self._closed = False
+        self.total_frames = 0
+        self.dropped_frames = 0
+
+    def put(self, frame):
+        """Adds a frame, dropping the oldest one if the buffer is full.
+
+        Args:
+            frame: Frame to add
+        """
+        with self._condition:
+            if len(self._frames) == self.capacity:
+                self.dropped_frames += 1
+            self._frames.append(frame)
+            self.total_frames += 1
+            self._condition.notify()
+
+    def get_latest(self, timeout=None):
+        """Returns the newest frame and discards the older ones.
+
+        Args:
+            timeout: Maximum wait time in seconds (waits forever if None)
+
+        Returns:
+            np.ndarray: Newest frame or None if no frame arrived in time
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._frames or self._closed, timeout
+            ):
+                return None
+            if not self._frames:
+                return None
+
+            frame = self._frames.pop()
+            self.dropped_frames += len(self._frames)
+            self._frames.clear()
+            return frame
+
+    def close(self):
+        """Wakes up waiting consumers; no more frames are expected."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reopen(self):
+        """Discards waiting frames and accepts new ones after ``close``."""
+        with self._condition:
+            self._frames.clear()
+            self._closed = False
+
+    def __len__(self):
+        with self._condition:
+            return len(self._frames)
+
+
+class FrameCapture:
+    """Reads frames from a capture device on a background thread.
+
+    The driver queue is drained continuously so that processing always works
+    on the most recent frame; end-to-end latency is bounded by one processing
+    cycle instead of by the depth of the driver queue.
+    """
+
+    def __init__(self, capture_device, buffer_size=2):
+        """Initializes the capture stage.
+
+        Args:
+            capture_device: Object with a ``read()`` method (e.g. cv2.VideoCapture)
+            buffer_size: Capacity of the frame ring buffer
+        """
+        self.capture_device = capture_device
+        self.buffer = FrameRingBuffer(buffer_size)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.error = None
+
+    def start(self):
+        """Starts the capture thread.
+
+        Returns:
+            FrameCapture: Self (for chaining)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+
+        self._stop_event.clear()
+        self.buffer.reopen()
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._capture_loop, name="FrameCapture", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Frame capture started")
+        return self
+
+    def _capture_loop(self):
+        """Continuously pulls frames from the device into the buffer."""
+        while not self._stop_event.is_set():
+            try:
+                ret, frame = self.capture_device.read()
+            except Exception as e:
+                self.error = str(e)
+                break
+
+            if not ret:
+                self.error = "Could not get camera image!"
+                break
+
+            self.buffer.put(frame)
+
+        if self.error:
+            logger.error(f"Frame capture stopped: {self.error}")
+        self.buffer.close()
+
+    def read(self, timeout=1.0):
+        """Returns the newest captured frame.
+
+        Mirrors ``cv2.VideoCapture.read`` so it can replace it in processing
+        loops.
+
+        Args:
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            tuple: (success status, frame)
+        """
+        frame = self.buffer.get_latest(timeout)
+        return frame is not None, frame
+
+    def is_running(self):
+        """Returns whether the capture thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout=1.0):
+        """Stops the capture thread.
+
+        Args:
+            timeout: Maximum time to wait for the thread to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.buffer.close()
+        logger.debug("Frame capture stopped")
+
+    def get_stats(self):
+        """Returns capture statistics.
+
+        Returns:
+            dict: Captured and dropped frame counts
+        """
+        return {
+            "captured_frames": self.buffer.total_frames,
+            "dropped_frames": self.buffer.dropped_frames,
+        }
@@ -0,0 +1,225 @@
+"""
+Frame Pipeline
+Runs frame processing stages on their own worker threads with bounded queues.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Backpressure policies
+BACKPRESSURE_BLOCK = "block"
+BACKPRESSURE_DROP_OLDEST = "drop_oldest"
+
+_STOP = object()
+
+
+class PipelineStage:
+    """A single processing stage with its own input queue and worker thread."""
+
+    def __init__(self, name, func, queue_size=2, backpressure=BACKPRESSURE_DROP_OLDEST):
+        """Initializes the stage.
+
+        Args:
+            name: Stage name (used in statistics and thread names)
+            func: Callable that processes one item; returning None drops the item
+            queue_size: Capacity of the stage input queue
+            backpressure: Policy when the input queue is full ("block" or
+                "drop_oldest")
+        """
+        if backpressure not in (BACKPRESSURE_BLOCK, BACKPRESSURE_DROP_OLDEST):
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+
+        self.name = name
+        self.func = func
+        self.backpressure = backpressure
+        self.input_queue = queue.Queue(maxsize=queue_size)
+        self.next_stage = None
+        self.sink = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.processed_items = 0
+        self.dropped_items = 0
+        self.failed_items = 0
+        self.busy_time = 0.0
+        self.started_at = None
+
+    def put(self, item, timeout=None):
+        """Puts an item into the stage input queue honoring backpressure.
+
+        Args:
+            item: Item to queue
+            timeout: Maximum wait time for the "block" policy
+
+        Returns:
+            bool: True if the item was queued
+        """
+        if self.backpressure == BACKPRESSURE_BLOCK:
+            try:
+                self.input_queue.put(item, timeout=timeout)
+                return True
+            except queue.Full:
+                self._count_drop()
+                return False
+
+        while True:
+            try:
+                self.input_queue.put_nowait(item)
+                return True
+            except queue.Full:
+                try:
+                    self.input_queue.get_nowait()
+                    self._count_drop()
+                except queue.Empty:
+                    pass
+
+    def _count_drop(self):
+        with self._lock:
+            self.dropped_items += 1
+
+    def start(self):
+        """Starts the worker thread."""
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name=f"PipelineStage-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        """Worker loop: processes items and forwards the results."""
+        while True:
+            item = self.input_queue.get()
+            if item is _STOP:
+                if self.next_stage is not None:
+                    self.next_stage.input_queue.put(_STOP)
+                break
+
+            start = time.perf_counter()
+            try:
+                result = self.func(item)
+            except Exception as e:
+                with self._lock:
+                    self.failed_items += 1
+                logger.error(f"Pipeline stage '{self.name}' error: {e}")
+                continue
+            finally:
+                with self._lock:
+                    self.busy_time += time.perf_counter() - start
+
+            with self._lock:
+                self.processed_items += 1
+
+            if result is None:
+                continue
+
+            if self.next_stage is not None:
+                self.next_stage.put(result)
+            elif self.sink is not None:
+                try:
+                    self.sink(result)
+                except Exception as e:
+                    logger.error(f"Pipeline sink error: {e}")
+
+    def join(self, timeout=None):
+        """Waits for the worker thread to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self):
+        """Returns stage statistics.
+
+        Returns:
+            dict: Processed/dropped/failed counts, average time and utilization
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+            return {
+                "processed": self.processed_items,
+                "dropped": self.dropped_items,
+                "failed": self.failed_items,
+                "queued": self.input_queue.qsize(),
+                "avg_time_ms": (
+                    self.busy_time / self.processed_items * 1000
+                    if self.processed_items
+                    else 0.0
+                ),
+                "utilization": self.busy_time / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+class FramePipeline:
+    """Chains stages so that consecutive frames are processed concurrently.
+
+    While frame N is in a later stage, frame N+1 can already be in an earlier
+    one. Each stage keeps a single worker, so item order is preserved.
+    """
+
+    def __init__(self, stages, sink=None):
+        """Initializes the pipeline.
+
+        Args:
+            stages: Ordered list of PipelineStage objects
+            sink: Callable that receives the output of the last stage
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+
+        self.stages = stages
+        for current_stage, next_stage in zip(stages, stages[1:]):
+            current_stage.next_stage = next_stage
+        self.stages[-1].sink = sink
+        self._running = False
+
+    def start(self):
+        """Starts all stage workers.
+
+        Returns:
+            FramePipeline: Self (for chaining)
+        """
+        if not self._running:
+            for stage in self.stages:
+                stage.start()
+            self._running = True
+            logger.debug(f"Frame pipeline started with {len(self.stages)} stages")
+        return self
+
+    def submit(self, item, timeout=None):
+        """Submits an item to the first stage.
+
+        Args:
+            item: Item to process
+            timeout: Maximum wait time for the "block" policy
+
+        Returns:
+            bool: True if the item was accepted
+        """
+        return self.stages[0].put(item, timeout)
+
+    def stop(self, timeout=2.0):
+        """Stops the workers after the queued items are processed.
+
+        Args:
+            timeout: Maximum time to wait for each stage
+        """
+        if not self._running:
+            return
+
+        self.stages[0].input_queue.put(_STOP)
+        for stage in self.stages:
+            stage.join(timeout)
+        self._running = False
+        logger.debug("Frame pipeline stopped")
+
+    def get_stats(self):
+        """Returns statistics for every stage.
+
+        Returns:
+            dict: Stage name -> stage statistics
+        """
+        return {stage.name: stage.get_stats() for stage in self.stages}
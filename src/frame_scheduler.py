@@ -0,0 +1,117 @@
+"""
+Frame Scheduler
+Paces the frame loop to a target rate using monotonic deadlines.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class FrameScheduler:
+    """Deadline-based frame scheduler.
+
+    Frame slots are laid on a fixed grid (``start + n * interval``). After each
+    frame the loop sleeps only for what is left of the current slot. A frame
+    that overruns its slot does not shift the grid: the missed slots are
+    skipped and counted, so the loop never falls further behind.
+    """
+
+    def __init__(self, target_fps=30, window_size=60, clock=None, sleep=None):
+        """Initializes the scheduler.
+
+        Args:
+            target_fps: Target frame rate
+            window_size: Number of recent frames used for fps/jitter statistics
+            clock: Monotonic clock function (default: time.monotonic)
+            sleep: Sleep function (default: time.sleep)
+        """
+        if target_fps <= 0:
+            raise ValueError(f"Invalid target fps: {target_fps}")
+
+        self.target_fps = target_fps
+        self.frame_interval = 1.0 / target_fps
+        self._clock = clock or time.monotonic
+        self._sleep = sleep or time.sleep
+        self._intervals = deque(maxlen=window_size)
+        self._next_deadline = None
+        self._last_tick = None
+
+        # Statistics
+        self.frame_count = 0
+        self.skipped_frames = 0
+        self.overruns = 0
+
+    def start(self):
+        """Resets the deadline grid and the statistics."""
+        now = self._clock()
+        self._next_deadline = now + self.frame_interval
+        self._last_tick = now
+        self._intervals.clear()
+        self.frame_count = 0
+        self.skipped_frames = 0
+        self.overruns = 0
+
+    def wait(self):
+        """Waits for the next frame slot.
+
+        Call once per frame after the frame has been processed.
+
+        Returns:
+            int: Number of frame slots skipped because of an overrun
+        """
+        if self._next_deadline is None:
+            self.start()
+
+        now = self._clock()
+        remaining = self._next_deadline - now
+        skipped = 0
+
+        if remaining > 0:
+            # Sleep only for the leftover budget
+            self._sleep(remaining)
+            now = self._clock()
+            self._next_deadline += self.frame_interval
+        else:
+            # Overrun: jump to the next slot on the grid instead of catching up
+            skipped = int(math.floor(-remaining / self.frame_interval))
+            self._next_deadline += (skipped + 1) * self.frame_interval
+            self.skipped_frames += skipped
+            self.overruns += 1
+
+        self._intervals.append(now - self._last_tick)
+        self._last_tick = now
+        self.frame_count += 1
+        return skipped
+
+    def get_achieved_fps(self):
+        """Returns the frame rate achieved over the recent window."""
+        total = sum(self._intervals)
+        return len(self._intervals) / total if total > 0 else 0.0
+
+    def get_jitter(self):
+        """Returns the frame interval jitter (standard deviation, seconds)."""
+        count = len(self._intervals)
+        if count < 2:
+            return 0.0
+        mean = sum(self._intervals) / count
+        variance = sum((i - mean) ** 2 for i in self._intervals) / count
+        return math.sqrt(variance)
+
+    def get_stats(self):
+        """Returns scheduler statistics.
+
+        Returns:
+            dict: Target/achieved fps, jitter, frame, skip and overrun counts
+        """
+        return {
+            "target_fps": self.target_fps,
+            "achieved_fps": self.get_achieved_fps(),
+            "jitter_ms": self.get_jitter() * 1000,
+            "frames": self.frame_count,
+            "skipped_frames": self.skipped_frames,
+            "overruns": self.overruns,
+        }
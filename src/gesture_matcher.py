@@ -0,0 +1,234 @@
+"""
+Gesture Matcher
+Nearest-gesture search over a gesture map compiled into contiguous arrays.
+"""
+
+import json
+import logging
+import os
+
+import numpy as np
+
+from src.lazy_import import lazy_import
+
+spatial = lazy_import("scipy.spatial")
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Share of a group's gestures above which re-ranking the KD-tree candidates
+# costs more than scanning the whole group
+LINEAR_SCAN_FRACTION = 0.25
+
+
+class _GestureGroup:
+    """Gestures that have the same number of landmarks."""
+
+    def __init__(self, names, points, confidences, index_threshold):
+        """Initializes the group.
+
+        Args:
+            names: Gesture names, in map order
+            points: (G, N, 2) float32 landmark tensor
+            confidences: (G,) gesture confidences
+            index_threshold: Gesture count from which a KD-tree is built
+        """
+        self.names = list(names)
+        self.points = np.ascontiguousarray(points, dtype=np.float32)
+        self.confidences = np.asarray(confidences, dtype=np.float64)
+        self.tree = None
+
+        if len(self.names) >= index_threshold:
+            flat = self.points.reshape(len(self.names), -1).astype(np.float64)
+            self.tree = spatial.cKDTree(flat)
+
+    def distances(self, points, indices=None):
+        """Mean landmark distance of the points to the given gestures."""
+        gestures = self.points if indices is None else self.points[indices]
+        return np.linalg.norm(gestures - points, axis=2).mean(axis=1)
+
+    def _scan(self, points):
+        """Linear scan over every gesture of the group."""
+        distances = self.distances(points)
+        best = int(np.argmin(distances))
+        return best, float(distances[best])
+
+    def nearest(self, points):
+        """Returns (gesture index, mean landmark distance) of the closest gesture.
+
+        With a KD-tree the Euclidean nearest neighbor of the flattened
+        landmarks gives an upper bound ``d`` on the best mean distance. A
+        gesture whose mean distance is below ``d`` is within ``N * d`` of
+        the query in flattened Euclidean distance, so the exact answer is
+        found by re-ranking the gestures inside that ball. For a query far
+        from every gesture the ball holds most of the map; the group is then
+        scanned linearly instead.
+        """
+        if self.tree is None:
+            return self._scan(points)
+
+        flat = points.reshape(-1).astype(np.float64)
+        _, nearest = self.tree.query(flat)
+        bound = float(self.distances(points, [nearest])[0])
+        radius = len(points) * bound * (1 + 1e-5) + 1e-6
+        count = self.tree.query_ball_point(flat, radius, return_length=True)
+        if count > LINEAR_SCAN_FRACTION * len(self.names):
+            return self._scan(points)
+
+        candidates = np.sort(self.tree.query_ball_point(flat, radius))
+
+        distances = self.distances(points, candidates)
+        best = int(np.argmin(distances))
+        return int(candidates[best]), float(distances[best])
+
+
+class GestureMatcher:
+    """Finds the gesture whose landmarks are closest to a hand.
+
+    The gesture map is compiled once into one ``(G, N, 2)`` float32 tensor
+    per landmark count, so a match is a single batched distance computation.
+    Maps with at least ``index_threshold`` gestures of one size also get a
+    KD-tree index.
+    """
+
+    def __init__(self, gesture_map, index_threshold=512):
+        """Compiles the gesture map.
+
+        Args:
+            gesture_map: Dict of gesture name -> {"landmarks", "confidence"}
+            index_threshold: Gesture count from which a KD-tree is built
+        """
+        grouped = {}
+        for name, data in gesture_map.items():
+            points = _to_points(data["landmarks"])
+            names, group_points, confidences = grouped.setdefault(
+                len(points), ([], [], [])
+            )
+            names.append(name)
+            group_points.append(points)
+            confidences.append(data.get("confidence", 0.0))
+
+        self.index_threshold = index_threshold
+        self.groups = {
+            size: _GestureGroup(names, np.stack(points), confidences, index_threshold)
+            for size, (names, points, confidences) in grouped.items()
+        }
+
+    @classmethod
+    def _from_arrays(cls, arrays, index_threshold):
+        """Creates a matcher from compiled arrays (see ``save``)."""
+        matcher = cls.__new__(cls)
+        matcher.index_threshold = index_threshold
+        matcher.groups = {}
+        for key in arrays:
+            if not key.startswith("points_"):
+                continue
+            size = int(key[len("points_") :])
+            matcher.groups[size] = _GestureGroup(
+                arrays[f"names_{size}"].tolist(),
+                arrays[key],
+                arrays[f"confidences_{size}"],
+                index_threshold,
+            )
+        return matcher
+
+    @classmethod
+    def load(cls, json_path, cache_path=None, index_threshold=512):
+        """Loads a gesture map, using its binary cache when it is up to date.
+
+        The cache is rebuilt whenever the size or modification time of the
+        JSON file changes.
+
+        Args:
+            json_path: Gesture map JSON file
+            cache_path: Binary cache (default: JSON path with a .npz extension)
+            index_threshold: Gesture count from which a KD-tree is built
+
+        Returns:
+            GestureMatcher: Compiled gesture map
+        """
+        cache_path = cache_path or os.path.splitext(json_path)[0] + ".npz"
+        stat = os.stat(json_path)
+        source = np.array([stat.st_size, stat.st_mtime_ns, CACHE_VERSION])
+
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path, allow_pickle=False) as cache:
+                    if np.array_equal(cache["source"], source):
+                        arrays = {key: cache[key] for key in cache.files}
+                        logger.debug(f"Gesture map loaded from cache: {cache_path}")
+                        return cls._from_arrays(arrays, index_threshold)
+            except Exception as e:
+                logger.warning(f"Gesture map cache could not be read: {e}")
+
+        with open(json_path, "r") as f:
+            matcher = cls(json.load(f), index_threshold)
+
+        try:
+            matcher.save(cache_path, source)
+        except OSError as e:
+            logger.warning(f"Gesture map cache could not be written: {e}")
+        return matcher
+
+    def save(self, cache_path, source):
+        """Writes the compiled arrays to a binary cache file.
+
+        Args:
+            cache_path: Output .npz file
+            source: Fingerprint of the JSON file the map was read from
+        """
+        arrays = {"source": source}
+        for size, group in self.groups.items():
+            arrays[f"points_{size}"] = group.points
+            arrays[f"names_{size}"] = np.array(group.names, dtype=str)
+            arrays[f"confidences_{size}"] = group.confidences
+
+        # Write to a temporary file first so readers never see a partial cache
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, cache_path)
+
+    def match(self, landmarks):
+        """Finds the closest gesture.
+
+        Args:
+            landmarks: Hand points as {"x", "y"} dicts or (x, y) pairs
+
+        Returns:
+            tuple: (gesture name, gesture confidence, mean landmark distance);
+            (None, 0.0, inf) if no gesture has as many landmarks
+        """
+        points = _to_points(landmarks)
+        group = self.groups.get(len(points))
+        if group is None:
+            return None, 0.0, float("inf")
+
+        index, distance = group.nearest(points)
+        return group.names[index], float(group.confidences[index]), distance
+
+    def to_dict(self):
+        """Returns the gesture map as a dict (map order within each size)."""
+        return {
+            name: {
+                "landmarks": group.points[i].tolist(),
+                "confidence": float(group.confidences[i]),
+            }
+            for group in self.groups.values()
+            for i, name in enumerate(group.names)
+        }
+
+    def __len__(self):
+        return sum(len(group.names) for group in self.groups.values())
+
+
+def _to_points(landmarks):
+    """Converts landmark dicts or pairs into an (N, 2) float32 array."""
+    return np.array(
+        [
+            (point["x"], point["y"]) if isinstance(point, dict) else point[:2]
+            for point in landmarks
+        ],
+        dtype=np.float32,
+    ).reshape(-1, 2)
@@ -4,15 +4,22 @@ Detects hand movements and extracts features using the MediaPipe library.
 """
 
 import logging
+from collections import namedtuple
 
-import cv2
-import mediapipe as mp
 import numpy as np
 
 from src.exceptions import HandDetectionError
+from src.landmark_flow import LandmarkFlowPropagator
+from src.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+mp = lazy_import("mediapipe")
 
 logger = logging.getLogger(__name__)
 
+# Detection results built outside MediaPipe (same fields as MediaPipe output)
+HandResults = namedtuple("HandResults", ["multi_hand_landmarks", "multi_handedness"])
+
 
 class HandDetector:
     """Class for detecting hand movements."""
@@ -23,8 +30,52 @@ class HandDetector:
         min_detection_confidence=0.8,
         min_tracking_confidence=0.5,
         max_num_hands=2,
+        inference_size=None,
+        roi_tracking=False,
+        roi_padding=0.3,
+        roi_refresh_interval=30,
+        detection_interval=1,
     ):
-        """Initializes the detector and loads necessary MediaPipe tools."""
+        """Initializes the detector and loads necessary MediaPipe tools.
+
+        Args:
+            static_image_mode: Treat every frame as an unrelated image
+            min_detection_confidence: Minimum palm detection confidence
+            min_tracking_confidence: Minimum landmark tracking confidence
+            max_num_hands: Maximum number of hands to detect
+            inference_size: Optional (width, height) box; larger frames are
+                downscaled to fit in it (keeping the aspect ratio) before
+                detection. Landmarks are normalized, so they still map
+                directly onto the full-size frame.
+            roi_tracking: Search the next frame only in a padded crop around
+                the hands found in the previous frame
+            roi_padding: Crop padding as a fraction of the hand box size
+            roi_refresh_interval: Frames between forced full-frame searches
+                (to pick up hands entering the scene)
+            detection_interval: Run MediaPipe only every Nth frame and move
+                the landmarks with optical flow in between (1 = every frame)
+        """
+        self.inference_size = inference_size
+        self.max_num_hands = max_num_hands
+
+        # Region of interest tracking (pixel box of the current crop)
+        self.roi_tracking = roi_tracking
+        self.roi_padding = roi_padding
+        self.roi_refresh_interval = roi_refresh_interval
+        self.min_roi_size = 96
+        self._roi = None
+        self._roi_hand_count = 0
+        self._frames_since_full_search = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+
+        # Optical flow propagation between sparse detections
+        self.detection_interval = max(1, detection_interval)
+        self.landmark_flow = LandmarkFlowPropagator()
+        self._frames_since_detection = 0
+        self.flow_frames = 0
+        self.flow_failures = 0
+
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
@@ -55,9 +106,7 @@ class HandDetector:
             if not isinstance(frame, np.ndarray) or len(frame.shape) != 3:
                 raise HandDetectionError("Invalid frame format")
 
-            # BGR -> RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(frame_rgb)
+            results = self.hands.process(self._prepare_input(frame))
 
             if results.multi_hand_landmarks:
                 return True, results.multi_hand_landmarks
@@ -99,11 +148,197 @@ class HandDetector:
 
         return processed_landmarks
 
-    def detect_hands(self, frame):
-        """Performs hand detection on the given frame."""
+    def _prepare_input(self, frame):
+        """Converts a BGR frame to the RGB image given to MediaPipe.
+
+        The frame is downscaled to ``inference_size`` first when it is larger,
+        so the color conversion also runs on the smaller image.
+
+        Args:
+            frame: BGR frame
+
+        Returns:
+            np.ndarray: RGB image for inference
+        """
+        if self.inference_size is not None:
+            H, W = frame.shape[:2]
+            max_w, max_h = self.inference_size
+            scale = min(max_w / W, max_h / H)
+
+            if scale < 1.0:
+                size = (max(1, round(W * scale)), max(1, round(H * scale)))
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
         # BGR -> RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        return self.hands.process(frame_rgb)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def detect_hands(self, frame):
+        """Performs hand detection on the given frame.
+
+        Returned landmarks are normalized to [0, 1], so they apply to the
+        full-size frame even when detection ran at ``inference_size``. With
+        ROI tracking enabled, detection runs on a crop around the previous
+        hands and the landmarks are converted back to full-frame coordinates;
+        when the hands are lost the full frame is searched again.
+
+        With a ``detection_interval`` above 1, frames between detections get
+        the last landmarks moved by optical flow; a detection is forced when
+        the flow becomes unreliable.
+        """
+        if self.detection_interval == 1:
+            return self._run_detection(frame)
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        if (
+            self._frames_since_detection < self.detection_interval - 1
+            and self.landmark_flow.has_landmarks()
+        ):
+            hands = self.landmark_flow.propagate(gray)
+            if hands is not None:
+                self._frames_since_detection += 1
+                self.flow_frames += 1
+                return HandResults(hands, self.landmark_flow.get_handedness())
+            self.flow_failures += 1
+
+        results = self._run_detection(frame)
+        self.landmark_flow.start(gray, results)
+        self._frames_since_detection = 0
+        return results
+
+    def _run_detection(self, frame):
+        """Runs MediaPipe on the frame (or on the tracked region of it)."""
+        if not self.roi_tracking:
+            return self.hands.process(self._prepare_input(frame))
+
+        H, W = frame.shape[:2]
+
+        # A full search can only find new hands if fewer than the maximum
+        # are being tracked
+        refresh_due = (
+            self._frames_since_full_search >= self.roi_refresh_interval
+            and self._roi_hand_count < self.max_num_hands
+        )
+
+        if self._roi is not None and not refresh_due:
+            x1, y1, x2, y2 = self._roi
+            results = self.hands.process(self._prepare_input(frame[y1:y2, x1:x2]))
+
+            if results.multi_hand_landmarks:
+                self._remap_landmarks(
+                    results, x1 / W, y1 / H, (x2 - x1) / W, (y2 - y1) / H
+                )
+                self._frames_since_full_search += 1
+                self.roi_frames += 1
+                self._update_roi(results, W, H)
+                return results
+
+        # Full-frame search (first frame, hand lost or periodic refresh)
+        results = self.hands.process(self._prepare_input(frame))
+        self._frames_since_full_search = 0
+        self.full_frames += 1
+        self._update_roi(results, W, H)
+        return results
+
+    def _remap_landmarks(self, results, offset_x, offset_y, scale_x, scale_y):
+        """Converts crop-normalized landmarks to full-frame coordinates in place.
+
+        Args:
+            results: MediaPipe detection results of the crop
+            offset_x: Crop left edge (normalized to the full frame)
+            offset_y: Crop top edge (normalized to the full frame)
+            scale_x: Crop width (normalized to the full frame)
+            scale_y: Crop height (normalized to the full frame)
+        """
+        for hand_landmarks in results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = offset_x + landmark.x * scale_x
+                landmark.y = offset_y + landmark.y * scale_y
+                # MediaPipe scales depth like the x axis
+                landmark.z = landmark.z * scale_x
+
+    def _update_roi(self, results, frame_width, frame_height):
+        """Updates the search region from the detected hands.
+
+        The current crop is kept while the hands stay well inside it, so
+        MediaPipe's own tracking keeps a stable coordinate frame.
+
+        Args:
+            results: Detection results in full-frame coordinates
+            frame_width: Frame width
+            frame_height: Frame height
+        """
+        if not results.multi_hand_landmarks:
+            self._roi = None
+            self._roi_hand_count = 0
+            return
+
+        self._roi_hand_count = len(results.multi_hand_landmarks)
+
+        xs = [lm.x for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        ys = [lm.y for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        hx1, hx2 = min(xs) * frame_width, max(xs) * frame_width
+        hy1, hy2 = min(ys) * frame_height, max(ys) * frame_height
+
+        if self._roi is not None:
+            x1, y1, x2, y2 = self._roi
+            margin_x = (x2 - x1) * 0.1
+            margin_y = (y2 - y1) * 0.1
+            if (
+                hx1 >= x1 + margin_x
+                and hx2 <= x2 - margin_x
+                and hy1 >= y1 + margin_y
+                and hy2 <= y2 - margin_y
+            ):
+                return
+
+        pad = max(hx2 - hx1, hy2 - hy1) * self.roi_padding
+        half_w = max((hx2 - hx1) / 2 + pad, self.min_roi_size / 2)
+        half_h = max((hy2 - hy1) / 2 + pad, self.min_roi_size / 2)
+        cx, cy = (hx1 + hx2) / 2, (hy1 + hy2) / 2
+
+        x1 = max(0, int(cx - half_w))
+        y1 = max(0, int(cy - half_h))
+        x2 = min(frame_width, int(cx + half_w) + 1)
+        y2 = min(frame_height, int(cy + half_h) + 1)
+
+        if x2 - x1 >= frame_width and y2 - y1 >= frame_height:
+            # Crop would cover the whole frame; no gain from cropping
+            self._roi = None
+        else:
+            self._roi = (x1, y1, x2, y2)
+
+    def reset_tracking(self):
+        """Forgets the search region and the propagated landmarks."""
+        self._roi = None
+        self._frames_since_full_search = 0
+        self.landmark_flow.reset()
+        self._frames_since_detection = 0
+
+    def get_flow_stats(self):
+        """Returns optical flow propagation statistics.
+
+        Returns:
+            dict: Propagated frame count and forced detections
+        """
+        return {
+            "flow_frames": self.flow_frames,
+            "flow_failures": self.flow_failures,
+        }
+
+    def get_roi_stats(self):
+        """Returns region of interest tracking statistics.
+
+        Returns:
+            dict: Crop/full-frame detection counts and the current crop box
+        """
+        total = self.roi_frames + self.full_frames
+        return {
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "roi_ratio": self.roi_frames / total if total else 0.0,
+            "roi": self._roi,
+        }
 
     def visualize_hands(self, frame, hand_landmarks):
         """Visualizes joint points on the hand."""
@@ -118,6 +353,9 @@ class HandDetector:
     def extract_landmarks(self, hand_landmarks):
         """Extracts feature vector from hand landmarks.
 
+        List based variant; the service uses ``extract_landmark_array`` and
+        ``landmarks_to_features``, which produce the same values.
+
         Returns:
             tuple: (feature vector, x coordinates, y coordinates)
         """
@@ -140,23 +378,62 @@ class HandDetector:
 
         return data_aux, x_, y_
 
+    @staticmethod
+    def extract_landmark_array(hand_landmarks):
+        """Copies hand landmarks into a (21, 3) float32 array in a single pass.
+
+        Args:
+            hand_landmarks: MediaPipe hand landmarks
+
+        Returns:
+            np.ndarray: Rows of normalized (x, y, z) coordinates
+        """
+        landmarks = hand_landmarks.landmark
+        return np.fromiter(
+            (value for lm in landmarks for value in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=3 * len(landmarks),
+        ).reshape(-1, 3)
+
+    @staticmethod
+    def landmarks_to_features(points, out=None):
+        """Builds the classifier feature vector from a landmark array.
+
+        The x and y coordinates are shifted so that the smallest value of each
+        axis becomes zero, which matches ``extract_landmarks``.
+
+        Args:
+            points: (21, 2) or (21, 3) landmark array
+            out: Optional (21, 2) float32 buffer to write into
+
+        Returns:
+            np.ndarray: 42 values (x0, y0, x1, y1, ...); a view of ``out``
+        """
+        xy = points[:, :2]
+        if out is None:
+            out = np.empty(xy.shape, dtype=np.float32)
+        np.subtract(xy, xy.min(axis=0), out=out)
+        return out.reshape(-1)
+
     def draw_bounding_box(self, frame, x_, y_, color, stability_info=None):
         """Draws a rectangle around the hand.
 
         Args:
             frame: Frame
-            x_: x coordinates
-            y_: y coordinates
+            x_: x coordinates (list or array)
+            y_: y coordinates (list or array)
             color: Rectangle color (BGR)
             stability_info: Optional stability information text
         """
         H, W, _ = frame.shape
+        x_ = np.asarray(x_)
+        y_ = np.asarray(y_)
 
         # Draw rectangle around hand
-        x1 = int(min(x_) * W) - 10
-        y1 = int(min(y_) * H) - 10
-        x2 = int(max(x_) * W) - 10
-        y2 = int(max(y_) * H) - 10
+        x1 = int(float(x_.min()) * W) - 10
+        y1 = int(float(y_.min()) * H) - 10
+        x2 = int(float(x_.max()) * W) - 10
+        y2 = int(float(y_.max()) * H) - 10
 
         # Keep coordinates within screen bounds
         x1, y1 = max(0, x1), max(0, y1)
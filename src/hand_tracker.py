@@ -0,0 +1,189 @@
+"""
+Hand Tracker
+Keeps the identity of each hand across frames so every hand has its own
+prediction history.
+"""
+
+import itertools
+import logging
+
+from src.stability_tracker import StabilityTracker
+
+logger = logging.getLogger(__name__)
+
+
+def box_iou(box_a, box_b):
+    """Calculates intersection over union of two (x1, y1, x2, y2) boxes.
+
+    Args:
+        box_a: First box
+        box_b: Second box
+
+    Returns:
+        float: IoU value between 0 and 1
+    """
+    ix1, iy1 = max(box_a[0], box_b[0]), max(box_a[1], box_b[1])
+    ix2, iy2 = min(box_a[2], box_b[2]), min(box_a[3], box_b[3])
+    intersection = max(0.0, ix2 - ix1) * max(0.0, iy2 - iy1)
+    if intersection == 0.0:
+        return 0.0
+
+    area_a = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1])
+    area_b = (box_b[2] - box_b[0]) * (box_b[3] - box_b[1])
+    return intersection / (area_a + area_b - intersection)
+
+
+class HandTrack:
+    """State of a single tracked hand."""
+
+    def __init__(
+        self, track_id, handedness, box, history_size=30, history_seconds=None
+    ):
+        """Initializes the track.
+
+        Args:
+            track_id: Unique track number
+            handedness: "Left"/"Right" label from MediaPipe (or None)
+            box: Normalized (x1, y1, x2, y2) hand box
+            history_size: Length of the prediction history in frames
+            history_seconds: Length of the prediction history in seconds
+                (frame-count history if None)
+        """
+        self.track_id = track_id
+        self.handedness = handedness
+        self.box = box
+        self.missed_frames = 0
+        self.stability = StabilityTracker(
+            max_frames=history_size if history_seconds is None else None,
+            window_seconds=history_seconds,
+        )
+
+        # Landmarks and result of the last classification of this hand
+        self.classified_points = None
+        self.letter = None
+        self.confidence = None
+
+
+class HandTracker:
+    """Matches detected hands to the tracks of the previous frames.
+
+    Hands are matched greedily by box overlap; a matching MediaPipe handedness
+    label gives a pair priority. A hand that moved too far for any overlap is
+    still matched when it is the only hand with that handedness on both sides.
+    """
+
+    def __init__(
+        self,
+        iou_threshold=0.2,
+        handedness_bonus=0.2,
+        max_missed_frames=5,
+        history_size=30,
+        history_seconds=None,
+    ):
+        """Initializes the tracker.
+
+        Args:
+            iou_threshold: Minimum box overlap for a match
+            handedness_bonus: Score bonus for pairs with the same handedness
+            max_missed_frames: Frames a track survives without a match
+            history_size: Prediction history length of new tracks
+            history_seconds: Time-based prediction history length of new
+                tracks (frame-count history if None)
+        """
+        self.iou_threshold = iou_threshold
+        self.handedness_bonus = handedness_bonus
+        self.max_missed_frames = max_missed_frames
+        self.history_size = history_size
+        self.history_seconds = history_seconds
+        self.tracks = []
+        self._next_id = itertools.count(1)
+
+    def update(self, boxes, handedness=None):
+        """Assigns a track to every detected hand.
+
+        Args:
+            boxes: Normalized (x1, y1, x2, y2) box per detected hand
+            handedness: Optional handedness label per detected hand
+
+        Returns:
+            list: HandTrack for each detected hand (same order as ``boxes``)
+        """
+        if handedness is None:
+            handedness = [None] * len(boxes)
+
+        assigned = [None] * len(boxes)
+        free_tracks = set(range(len(self.tracks)))
+
+        # Candidate pairs ordered by score
+        candidates = []
+        for hand_index, box in enumerate(boxes):
+            for track_index, track in enumerate(self.tracks):
+                iou = box_iou(box, track.box)
+                if iou < self.iou_threshold:
+                    continue
+                score = iou
+                if (
+                    handedness[hand_index]
+                    and handedness[hand_index] == track.handedness
+                ):
+                    score += self.handedness_bonus
+                candidates.append((score, hand_index, track_index))
+
+        for _, hand_index, track_index in sorted(candidates, reverse=True):
+            if assigned[hand_index] is None and track_index in free_tracks:
+                assigned[hand_index] = self.tracks[track_index]
+                free_tracks.discard(track_index)
+
+        # Fast movement: unique handedness on both sides still identifies a hand
+        for hand_index, label in enumerate(handedness):
+            if assigned[hand_index] is not None or not label:
+                continue
+            same_hands = [i for i, other in enumerate(handedness) if other == label]
+            same_tracks = [i for i in free_tracks if self.tracks[i].handedness == label]
+            if len(same_hands) == 1 and len(same_tracks) == 1:
+                assigned[hand_index] = self.tracks[same_tracks[0]]
+                free_tracks.discard(same_tracks[0])
+
+        # Update matched tracks and create new ones
+        for hand_index, box in enumerate(boxes):
+            track = assigned[hand_index]
+            if track is None:
+                track = HandTrack(
+                    next(self._next_id),
+                    handedness[hand_index],
+                    box,
+                    self.history_size,
+                    self.history_seconds,
+                )
+                self.tracks.append(track)
+                assigned[hand_index] = track
+                logger.debug(f"New hand track: {track.track_id}")
+            else:
+                track.box = box
+                track.missed_frames = 0
+                if handedness[hand_index]:
+                    track.handedness = handedness[hand_index]
+
+        # Age unmatched tracks
+        matched_ids = {id(track) for track in assigned}
+        for track in self.tracks:
+            if id(track) not in matched_ids:
+                track.missed_frames += 1
+        self.tracks = [
+            track
+            for track in self.tracks
+            if track.missed_frames <= self.max_missed_frames
+        ]
+
+        return assigned
+
+    def get_track(self, track_id):
+        """Returns the track with the given id (or None)."""
+        for track in self.tracks:
+            if track.track_id == track_id:
+                return track
+        return None
+
+    def reset(self):
+        """Drops all tracks."""
+        self.tracks = []
@@ -0,0 +1,270 @@
+"""
+Inference Batcher
+Collects feature vectors from many callers into batched model calls.
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceBatcher:
+    """Micro-batching front end for a SignLanguageModel shared by many callers.
+
+    Callers submit 42-value feature vectors and get futures back. A
+    scheduler thread flushes the queue as one vectorized
+    ``predict_batch_with_confidence`` call once ``max_batch_size`` vectors
+    are waiting or the oldest one has waited ``max_wait`` seconds, whichever
+    comes first. Under concurrency the per-call model overhead is shared by
+    the whole batch, while no vector waits much longer than ``max_wait``.
+
+    The batcher also offers the blocking ``predict*`` methods of the model,
+    so it can be passed to SignLanguageService as a shared model; every
+    other attribute is read from the wrapped model. Batches and forwarded
+    method calls (``get_cache_stats``, ``warm_up``, ...) hold the same lock,
+    so the model is never used by two threads at once.
+    """
+
+    def __init__(self, model, max_batch_size=32, max_wait=0.002, window_size=1000):
+        """Initializes the batcher.
+
+        Args:
+            model: SignLanguageModel (or anything with
+                ``predict_batch_with_confidence``)
+            max_batch_size: Largest number of vectors per model call
+            max_wait: Longest time in seconds the oldest vector waits for
+                the batch to fill
+            window_size: Number of recent batches (and vectors) used for the
+                statistics
+        """
+        if max_batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._model_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+        # Statistics
+        self.total_batches = 0
+        self.total_items = 0
+        self._batch_sizes = deque(maxlen=window_size)
+        self._queue_delays = deque(maxlen=window_size)
+
+    def __getattr__(self, name):
+        # Only called for attributes the batcher does not have
+        if name == "model":
+            raise AttributeError(name)
+        value = getattr(self.model, name)
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def locked(*args, **kwargs):
+            with self._model_lock:
+                return value(*args, **kwargs)
+
+        return locked
+
+    def start(self):
+        """Starts the scheduler thread.
+
+        Returns:
+            InferenceBatcher: Self (for chaining)
+        """
+        with self._condition:
+            if self._running:
+                return self
+            self._running = True
+
+        self._thread = threading.Thread(
+            target=self._run, name="InferenceBatcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Inference batcher started (batch size {self.max_batch_size}, "
+            f"max wait {self.max_wait * 1000:.1f} ms)"
+        )
+        return self
+
+    def stop(self, timeout=1.0):
+        """Flushes the waiting vectors and stops the scheduler thread.
+
+        Args:
+            timeout: Maximum time to wait for the thread
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, features):
+        """Queues one feature vector.
+
+        Args:
+            features: 42-value feature vector
+
+        Returns:
+            concurrent.futures.Future: Resolves to (letter or None, confidence)
+
+        Raises:
+            RuntimeError: If the batcher is not running
+        """
+        return self.submit_many([features])[0]
+
+    def submit_many(self, features_batch):
+        """Queues several feature vectors at once (they stay in order).
+
+        Args:
+            features_batch: Sequence of 42-value vectors or an (N, 42) array
+
+        Returns:
+            list: One future per vector
+
+        Raises:
+            RuntimeError: If the batcher is not running
+        """
+        now = time.perf_counter()
+        futures, items = [], []
+        for features in features_batch:
+            future = Future()
+            futures.append(future)
+            vector = np.asarray(features, dtype=np.float32).reshape(-1)
+            if vector.size != 42:
+                logger.warning(f"Invalid feature vector length: {vector.size}")
+                future.set_result((None, 0.0))
+                continue
+            items.append((vector, future, now))
+
+        with self._condition:
+            if not self._running:
+                raise RuntimeError("Inference batcher is not running")
+            self._queue.extend(items)
+            self._condition.notify()
+        return futures
+
+    def predict_batch_with_confidence(self, features_batch):
+        """Predicts letters through the batch queue (blocks until done).
+
+        Args:
+            features_batch: Sequence of 42-value vectors or an (N, 42) array
+
+        Returns:
+            tuple: (list of letters or None, list of confidence values)
+        """
+        if len(features_batch) == 0:
+            return [], []
+
+        results = [future.result() for future in self.submit_many(features_batch)]
+        letters, confidences = zip(*results)
+        return list(letters), list(confidences)
+
+    def predict_with_confidence(self, features):
+        """Predicts one letter through the batch queue (blocks until done).
+
+        Returns:
+            tuple: (predicted letter, confidence value)
+        """
+        return self.submit(features).result()
+
+    def predict(self, features):
+        """Predicts one letter through the batch queue (blocks until done).
+
+        Returns:
+            str: Predicted letter or None
+        """
+        return self.predict_with_confidence(features)[0]
+
+    def predict_batch(self, features_batch):
+        """Predicts letters through the batch queue (blocks until done).
+
+        Returns:
+            list: Predicted letter (or None) for every row
+        """
+        return self.predict_batch_with_confidence(features_batch)[0]
+
+    def _next_batch(self):
+        """Waits until a batch is due and takes it from the queue.
+
+        Returns:
+            list: Queued items (empty once stopped and drained)
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or not self._running)
+            if self._queue and self._running:
+                deadline = self._queue[0][2] + self.max_wait
+                while len(self._queue) < self.max_batch_size and self._running:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+            size = min(len(self._queue), self.max_batch_size)
+            return [self._queue.popleft() for _ in range(size)]
+
+    def _run(self):
+        """Scheduler loop: one model call per batch."""
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self._flush(batch)
+
+    def _flush(self, batch):
+        """Classifies one batch and resolves its futures."""
+        started = time.perf_counter()
+        try:
+            with self._model_lock:
+                letters, confidences = self.model.predict_batch_with_confidence(
+                    np.stack([vector for vector, _, _ in batch])
+                )
+        except Exception as e:
+            logger.error(f"Batched prediction error: {e}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+        else:
+            for (_, future, _), letter, confidence in zip(batch, letters, confidences):
+                future.set_result((letter, confidence))
+
+        with self._condition:
+            self.total_batches += 1
+            self.total_items += len(batch)
+            self._batch_sizes.append(len(batch))
+            self._queue_delays.extend(started - enqueued for _, _, enqueued in batch)
+
+    def get_stats(self):
+        """Returns batch size and queueing delay statistics.
+
+        Averages and maxima cover the most recent batches and vectors.
+
+        Returns:
+            dict: Batch and item counts, batch sizes and queueing delays
+        """
+        with self._condition:
+            sizes = list(self._batch_sizes)
+            delays = list(self._queue_delays)
+            queued = len(self._queue)
+
+        return {
+            "batches": self.total_batches,
+            "items": self.total_items,
+            "queued": queued,
+            "avg_batch_size": sum(sizes) / len(sizes) if sizes else 0.0,
+            "max_batch_size": max(sizes, default=0),
+            "avg_queue_delay_ms": sum(delays) / len(delays) * 1000 if delays else 0.0,
+            "max_queue_delay_ms": max(delays, default=0.0) * 1000,
+        }
@@ -0,0 +1,164 @@
+"""
+Landmark Codec
+Compact binary encoding of hand landmark sets for landmark-only clients.
+
+A packet holds the (x, y) coordinates of every hand of one frame::
+
+    magic "YL" | version (u8) | flags (u8) | hand count (u16) | payload
+
+Coordinates are quantized to uint16 over ``[COORD_MIN, COORD_MAX]`` (a
+step of about 3e-5 in normalized image coordinates). With the delta flag
+the payload holds int8 differences to the previous packet's quantized
+values instead, which halves the size while a hand moves slowly. All
+values are little-endian, hand by hand, point by point, x before y.
+"""
+
+import struct
+
+import numpy as np
+
+MAGIC = b"YL"
+VERSION = 1
+FLAG_DELTA = 0x01
+
+HEADER = struct.Struct("<2sBBH")
+POINTS_PER_HAND = 21
+
+# MediaPipe coordinates leave [0, 1] slightly when a hand is at the edge
+COORD_MIN = -0.5
+COORD_MAX = 1.5
+_SCALE = 65535 / (COORD_MAX - COORD_MIN)
+
+
+def is_landmark_packet(data):
+    """Returns whether the bytes start with a landmark packet header."""
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def quantize(points):
+    """Quantizes landmark coordinates to uint16.
+
+    Args:
+        points: (..., 21, 2) or (..., 21, 3) landmark array (z is dropped)
+
+    Returns:
+        np.ndarray: uint16 array of the x and y coordinates
+    """
+    xy = np.asarray(points, dtype=np.float64)[..., :2]
+    scaled = np.rint((np.clip(xy, COORD_MIN, COORD_MAX) - COORD_MIN) * _SCALE)
+    return scaled.astype(np.uint16)
+
+
+def dequantize(values):
+    """Converts quantized coordinates back to float32 landmarks."""
+    return values.astype(np.float32) / np.float32(_SCALE) + np.float32(COORD_MIN)
+
+
+class LandmarkEncoder:
+    """Encodes the hands of consecutive frames of one stream.
+
+    Delta encoding is used automatically when the previous packet had the
+    same number of hands and every coordinate moved by at most 127 steps;
+    otherwise a full (absolute) packet is written.
+    """
+
+    def __init__(self, delta=True):
+        """Initializes the encoder.
+
+        Args:
+            delta: Delta-encode against the previous packet when possible
+        """
+        self.delta = delta
+        self._previous = None
+
+    def encode(self, hands):
+        """Encodes the hands of one frame.
+
+        Args:
+            hands: Landmark sets, (H, 21, 2|3) array-like or one (21, 2|3) set
+
+        Returns:
+            bytes: Packet
+        """
+        values = quantize(_as_hand_batch(hands))
+        flags = 0
+        payload = values.astype("<u2")
+
+        if self.delta and self._previous is not None:
+            if self._previous.shape == values.shape:
+                difference = values.astype(np.int32) - self._previous
+                if len(difference) and np.abs(difference).max() <= 127:
+                    flags = FLAG_DELTA
+                    payload = difference.astype("<i1")
+
+        self._previous = values.astype(np.int32)
+        header = HEADER.pack(MAGIC, VERSION, flags, len(values))
+        return header + payload.tobytes()
+
+    def reset(self):
+        """Forgets the previous frame; the next packet is absolute."""
+        self._previous = None
+
+
+class LandmarkDecoder:
+    """Decodes the packets of one stream (keeps the state for deltas)."""
+
+    def __init__(self):
+        self._previous = None
+
+    def decode(self, data):
+        """Decodes one packet.
+
+        Args:
+            data: Packet bytes
+
+        Returns:
+            np.ndarray: (H, 21, 2) float32 landmark sets
+
+        Raises:
+            ValueError: If the packet is malformed or a delta packet does not
+                match the previous packet
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Landmark packet is too short")
+
+        magic, version, flags, hand_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a landmark packet of a supported version")
+
+        shape = (hand_count, POINTS_PER_HAND, 2)
+        count = hand_count * POINTS_PER_HAND * 2
+        dtype = np.dtype("<i1") if flags & FLAG_DELTA else np.dtype("<u2")
+        if len(data) != HEADER.size + count * dtype.itemsize:
+            raise ValueError("Landmark packet has an invalid length")
+
+        payload = np.frombuffer(data, dtype=dtype, count=count, offset=HEADER.size)
+        payload = payload.reshape(shape)
+
+        if flags & FLAG_DELTA:
+            if self._previous is None or self._previous.shape != shape:
+                raise ValueError("Delta packet without a matching previous packet")
+            values = self._previous + payload
+            if values.min() < 0 or values.max() > 65535:
+                raise ValueError("Delta packet is out of range")
+        else:
+            values = payload.astype(np.int32)
+
+        self._previous = values
+        return dequantize(values)
+
+    def reset(self):
+        """Forgets the previous packet."""
+        self._previous = None
+
+
+def _as_hand_batch(hands):
+    """Returns landmark sets as an (H, 21, k) array."""
+    points = np.asarray(hands, dtype=np.float32)
+    if points.ndim == 2:
+        points = points[np.newaxis]
+    if points.size == 0:
+        return np.zeros((0, POINTS_PER_HAND, 2), dtype=np.float32)
+    if points.ndim != 3 or points.shape[1] != POINTS_PER_HAND or points.shape[2] < 2:
+        raise ValueError(f"Invalid landmark set shape: {points.shape}")
+    return points
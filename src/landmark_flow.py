@@ -0,0 +1,159 @@
+"""
+Landmark Flow
+Moves hand landmarks between detections with pyramidal Lucas-Kanade flow.
+"""
+
+import copy
+import logging
+
+import numpy as np
+
+from src.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+class LandmarkFlowPropagator:
+    """Propagates the landmarks of the last detection to the following frames.
+
+    Landmarks are tracked with ``cv2.calcOpticalFlowPyrLK``. Propagation fails
+    (and a full detection must run) when a point is lost, when the tracking
+    error grows too large or when the hand has drifted too far from where it
+    was last detected.
+    """
+
+    def __init__(self, win_size=(21, 21), max_level=3, max_error=12.0, max_drift=0.5):
+        """Initializes the propagator.
+
+        Args:
+            win_size: Lucas-Kanade search window size
+            max_level: Number of pyramid levels
+            max_error: Maximum mean tracking error per hand
+            max_drift: Maximum mean landmark displacement since the last
+                detection, relative to the hand box size
+        """
+        self.win_size = win_size
+        self.max_level = max_level
+        self.max_error = max_error
+        self.max_drift = max_drift
+        self.criteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03)
+        self.reset()
+
+    def reset(self):
+        """Forgets the tracked landmarks."""
+        self._prev_gray = None
+        self._points = None
+        self._anchor_points = None
+        self._hand_sizes = None
+        self._results = None
+
+    def has_landmarks(self):
+        """Returns whether there are landmarks to propagate."""
+        return self._points is not None
+
+    def start(self, gray, results):
+        """Starts tracking from a fresh detection.
+
+        Args:
+            gray: Grayscale frame the detection ran on
+            results: Detection results (normalized landmarks)
+        """
+        if not results.multi_hand_landmarks:
+            self.reset()
+            return
+
+        H, W = gray.shape[:2]
+        points = np.array(
+            [
+                (landmark.x * W, landmark.y * H)
+                for hand_landmarks in results.multi_hand_landmarks
+                for landmark in hand_landmarks.landmark
+            ],
+            dtype=np.float32,
+        ).reshape(len(results.multi_hand_landmarks), -1, 2)
+
+        self._prev_gray = gray
+        self._points = points
+        self._anchor_points = points.copy()
+        sizes = points.max(axis=1) - points.min(axis=1)
+        self._hand_sizes = np.maximum(sizes.max(axis=1), 1.0)
+        self._results = results
+
+    def propagate(self, gray):
+        """Moves the tracked landmarks onto a new frame.
+
+        Args:
+            gray: New grayscale frame
+
+        Returns:
+            list: Hand landmark lists with propagated positions, or None if
+            the tracking is no longer reliable
+        """
+        if self._points is None:
+            return None
+
+        hand_count, point_count, _ = self._points.shape
+        previous = self._points.reshape(-1, 1, 2)
+        current, status, error = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray,
+            gray,
+            previous,
+            None,
+            winSize=self.win_size,
+            maxLevel=self.max_level,
+            criteria=self.criteria,
+        )
+
+        if current is None or not status.all():
+            return None
+
+        current = current.reshape(hand_count, point_count, 2)
+        mean_error = error.reshape(hand_count, point_count).mean(axis=1)
+        drift = np.linalg.norm(current - self._anchor_points, axis=2).mean(axis=1)
+
+        if (mean_error > self.max_error).any():
+            return None
+        if (drift / self._hand_sizes > self.max_drift).any():
+            return None
+
+        H, W = gray.shape[:2]
+        if (
+            (current[..., 0] < 0).any()
+            or (current[..., 0] >= W).any()
+            or (current[..., 1] < 0).any()
+            or (current[..., 1] >= H).any()
+        ):
+            return None
+
+        self._prev_gray = gray
+        self._points = current
+        return self._copy_landmarks(current, W, H)
+
+    def _copy_landmarks(self, points, frame_width, frame_height):
+        """Copies the last detected landmarks with new positions.
+
+        Args:
+            points: Propagated pixel coordinates (hands, 21, 2)
+            frame_width: Frame width
+            frame_height: Frame height
+
+        Returns:
+            list: Landmark lists in normalized coordinates
+        """
+        hands = []
+        for hand_landmarks, hand_points in zip(
+            self._results.multi_hand_landmarks, points
+        ):
+            hand_copy = copy.deepcopy(hand_landmarks)
+            for landmark, (px, py) in zip(hand_copy.landmark, hand_points):
+                landmark.x = float(px) / frame_width
+                landmark.y = float(py) / frame_height
+            hands.append(hand_copy)
+
+        return hands
+
+    def get_handedness(self):
+        """Returns the handedness of the last detection (if available)."""
+        return getattr(self._results, "multi_handedness", None)
@@ -0,0 +1,123 @@
+"""
+Lazy Import
+Defers heavy third-party imports (OpenCV, MediaPipe, googletrans, ...) until
+their first use, so tools and tests that only need light modules such as
+``MorseCodeService`` or ``AppState`` start in milliseconds.
+
+Usage::
+
+    from src.lazy_import import lazy_import
+
+    cv2 = lazy_import("cv2")  # nothing imported yet
+    cv2.resize(frame, size)   # cv2 is imported here
+"""
+
+import importlib
+import logging
+import sys
+import threading
+import time
+import types
+
+logger = logging.getLogger(__name__)
+
+_proxies = {}
+_import_times = {}
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access.
+
+    Import errors (e.g. ``winsound`` outside Windows) are raised at first use
+    instead of at import time of the module that declared the proxy.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        """Imports the real module if needed and returns it."""
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = _import(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "deferred"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def _import(name):
+    """Imports a module and records how long it took."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    with _lock:
+        _import_times.setdefault(name, elapsed_ms)
+    logger.debug(f"Lazy import of '{name}' took {elapsed_ms:.1f} ms")
+    return module
+
+
+def lazy_import(name):
+    """Returns a proxy that imports the module on first use.
+
+    Args:
+        name: Absolute module name (e.g. "cv2", "mediapipe")
+
+    Returns:
+        LazyModule: Shared proxy for the module
+    """
+    with _lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = LazyModule(name)
+        return proxy
+
+
+def preload(*names):
+    """Imports the given modules now, in order.
+
+    Useful to attribute import time to one subsystem at a time, since a
+    module imported first also pays for the dependencies it shares with
+    later ones.
+
+    Args:
+        *names: Module names
+
+    Returns:
+        dict: Module name -> import time in milliseconds (0 if already loaded)
+    """
+    times = {}
+    for name in names:
+        already_loaded = name in sys.modules
+        lazy_import(name)._load()
+        times[name] = 0.0 if already_loaded else get_import_times().get(name, 0.0)
+    return times
+
+
+def is_loaded(name):
+    """Returns whether a module has been imported (lazily or not)."""
+    return name in sys.modules
+
+
+def get_import_times():
+    """Returns the import times of modules loaded through proxies.
+
+    Returns:
+        dict: Module name -> import time in milliseconds
+    """
+    with _lock:
+        return dict(_import_times)
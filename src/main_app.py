@@ -17,15 +17,22 @@ import time
 import tkinter as tk
 from tkinter import messagebox
 
-import cv2
-
 # Import modules
 from src.app_state import AppState
+from src.config import Config
+from src.detection_worker import DetectionWorker
 from src.exceptions import CameraError, ProcessingError, TranslationError
+from src.frame_capture import FrameCapture, FrameRingBuffer
+from src.frame_scheduler import FrameScheduler
+from src.lazy_import import lazy_import
 from src.morse_service import MorseCodeService
+from src.service_loader import ServiceLoader
 from src.sign_language_service import SignLanguageService
+from src.stream_pool import StreamPool
 from src.translator_service import TranslatorService
 
+cv2 = lazy_import("cv2")
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +66,8 @@ class SignLanguageApp:
             ValueError: If UI class is invalid
             RuntimeError: If camera cannot be started
         """
+        self._startup_time = time.perf_counter()
+
         # Main window settings
         self.root = root_window
         self.root.title("Sign Language Translator")
@@ -67,26 +76,158 @@ class SignLanguageApp:
         # Keyboard focus
         self.root.focus_set()
 
-        # Services
-        self.sign_language_service = SignLanguageService()
-        self.translation_service = TranslatorService()
+        # Services are built and warmed up in the background; the window
+        # shows a loading state until they are ready
+        self.sign_language_service = None
+        self.translation_service = None
+        self.service_loader = ServiceLoader()
+        self.service_loader.submit(
+            "sign_language",
+            self._create_sign_language_service,
+            warm_up=lambda service: service.warm_up(self._get_camera_size()),
+        )
+        self.service_loader.submit("translation", TranslatorService)
+        self._pending_services = {
+            "sign_language": self._on_sign_language_service_ready,
+            "translation": self._on_translation_service_ready,
+        }
+        self._service_poll_job = None
+        self.service_poll_ms = 100
         self.application_state = AppState()
 
+        # Background camera reader (created when the camera starts)
+        self.frame_capture = None
+
+        # Camera indexes / video files; several sources share a worker pool
+        self.stream_sources = Config().get("kamera.kaynaklar") or [0]
+        self.stream_pool = None
+
+        # Target frame rate of the processing loop
+        self.target_fps = Config().get("kamera.fps", 30)
+
+        # Run detect/classify/render stages on separate worker threads
+        self.pipelined_processing = Config().get("performans.pipeline", False)
+
+        # Single-slot mailbox between the processing thread and the Tk loop
+        self.display_mailbox = FrameRingBuffer(capacity=1)
+        self.display_refresh_ms = 16  # ~60 Hz screen refresh
+        self._display_job = None
+        self._displayed_letter_count = 0
+
         # Make variables public for UI compatibility
-        self.required_stable_frames = self.sign_language_service.required_stable_frames
+        self.required_stable_frames = SignLanguageService.REQUIRED_STABLE_FRAMES
 
         # Translation settings
         self.translation_direction = tk.StringVar(value="tr-en")
 
         # Create UI
+        ui_start = time.perf_counter()
         self.ui_class = ui_class
         self.user_interface = self.ui_class(self.root, self)
+        logger.info(
+            "User interface created in %.0f ms", (time.perf_counter() - ui_start) * 1000
+        )
 
         # Set up keyboard shortcuts
         self._setup_keyboard_shortcuts()
 
+        # Loading state until the services are ready
+        self.user_interface.start_button.configure(state="disabled")
+        self.user_interface.status_label.configure(text="Loading models...")
+        self._service_poll_job = self.root.after(
+            self.service_poll_ms, self._poll_services
+        )
+
         logger.info("Sign language translator application started")
 
+    def _create_sign_language_service(self):
+        """
+        Creates the sign language service from the configuration.
+
+        Runs on a service loader thread. With "performans.surec_izolasyonu"
+        the service runs in a separate worker process.
+
+        Returns:
+            SignLanguageService or DetectionWorker: New service
+        """
+        options = self._get_sign_language_service_options()
+        if Config().get("performans.surec_izolasyonu", False):
+            return DetectionWorker(options).start()
+        return SignLanguageService(**options)
+
+    def _get_sign_language_service_options(self):
+        """
+        Returns the SignLanguageService arguments from the configuration.
+
+        Returns:
+            dict: Keyword arguments
+        """
+        return SignLanguageService.options_from_config()
+
+    def _poll_services(self):
+        """
+        Hands services finished by the loader over to the application.
+
+        Runs on the Tk main thread via ``root.after`` until every service has
+        either loaded or failed.
+        """
+        self._service_poll_job = None
+
+        for name, on_ready in list(self._pending_services.items()):
+            if not self.service_loader.is_ready(name):
+                continue
+
+            del self._pending_services[name]
+            try:
+                on_ready(self.service_loader.get(name))
+            except Exception as e:
+                logger.error("Service '%s' could not be loaded: %s", name, str(e))
+                self.user_interface.status_label.configure(
+                    text=f"Service could not be loaded: {name}"
+                )
+
+        if self._pending_services:
+            self._service_poll_job = self.root.after(
+                self.service_poll_ms, self._poll_services
+            )
+        else:
+            logger.info(
+                "All services ready %.0f ms after startup",
+                (time.perf_counter() - self._startup_time) * 1000,
+            )
+
+    def _on_sign_language_service_ready(self, service):
+        """
+        Enables the camera once the sign language service is ready.
+
+        Args:
+            service (SignLanguageService): Loaded and warmed up service
+        """
+        self.sign_language_service = service
+        self.required_stable_frames = service.required_stable_frames
+        self.user_interface.start_button.configure(state="normal")
+        self.user_interface.status_label.configure(text="Ready")
+
+    def _on_translation_service_ready(self, service):
+        """
+        Enables translation once the translation service is ready.
+
+        Args:
+            service (TranslatorService): Loaded service
+        """
+        self.translation_service = service
+
+    @staticmethod
+    def _get_camera_size():
+        """
+        Reads the camera resolution from the configuration.
+
+        Returns:
+            tuple: (width, height)
+        """
+        size = Config().get("kamera.cozunurluk") or {}
+        return (size.get("genislik", 640), size.get("yukseklik", 480))
+
     def _setup_keyboard_shortcuts(self):
         """Sets up keyboard shortcuts."""
         self.root.bind("<space>", lambda e: self.add_space())
@@ -101,11 +242,24 @@ class SignLanguageApp:
             self.user_interface.start_button.configure(text="Start Camera")
             self.user_interface.status_label.configure(text="Stopped")
 
+            if self.frame_capture is not None:
+                self.frame_capture.stop()
+
             if self.application_state.get("cap") is not None:
                 self.application_state.get("cap").release()
                 self.application_state.set("cap", None)
+
+            self._stop_stream_pool()
         else:
-            cap = cv2.VideoCapture(0)
+            if self.sign_language_service is None:
+                messagebox.showinfo("Warning", "Models are still loading!")
+                return
+
+            if len(self.stream_sources) > 1:
+                self._start_stream_pool()
+                return
+
+            cap = cv2.VideoCapture(self.stream_sources[0])
 
             if not cap.isOpened():
                 messagebox.showerror("Error", "Could not open camera!")
@@ -119,6 +273,85 @@ class SignLanguageApp:
             # Start camera stream in a separate thread
             threading.Thread(target=self.process_camera, daemon=True).start()
 
+            # Show processed frames from the Tk main thread
+            self._start_display_loop()
+
+    def _start_stream_pool(self):
+        """Starts processing every configured source in a worker pool."""
+        self.application_state.set("is_running", True)
+        self.user_interface.start_button.configure(text="Stop Camera")
+        self.user_interface.status_label.configure(text="Starting streams...")
+
+        pool = StreamPool(
+            self.stream_sources,
+            pool_size=Config().get("performans.isci_sayisi"),
+            service_options=self._get_sign_language_service_options(),
+            frame_size=self._get_camera_size(),
+        )
+
+        def start_pool():
+            # Worker processes load their models; keep the Tk thread free
+            try:
+                pool.start()
+            except Exception as e:
+                logger.error("Streams could not be started: %s", str(e))
+                self.root.after(0, self._on_stream_pool_error, str(e))
+                return
+
+            if self.application_state.get("is_running"):
+                self.stream_pool = pool
+            else:
+                pool.stop()
+
+        threading.Thread(target=start_pool, daemon=True).start()
+        self._start_display_loop()
+
+    def _on_stream_pool_error(self, error):
+        """
+        Resets the camera controls after the worker pool failed to start.
+
+        Must run on the Tk main thread.
+
+        Args:
+            error (str): Error message
+        """
+        if not self.application_state.get("is_running"):
+            return  # The user already stopped the camera
+
+        self.application_state.set("is_running", False)
+        self.user_interface.start_button.configure(text="Start Camera")
+        self.user_interface.status_label.configure(text="Stopped")
+        messagebox.showerror("Error", f"Streams could not be started: {error}")
+
+    def _stop_stream_pool(self, wait=False):
+        """
+        Stops the worker pool of the multi-stream mode.
+
+        Args:
+            wait (bool): Stop on the calling thread instead of in the background
+        """
+        pool, self.stream_pool = self.stream_pool, None
+        if pool is None:
+            return
+        if wait:
+            pool.stop()
+        else:
+            threading.Thread(target=pool.stop, daemon=True).start()
+
+    def _update_stream_display(self):
+        """
+        Shows the mosaic of every stream with its frame rate and latency.
+
+        Must run on the Tk main thread.
+        """
+        pool = self.stream_pool
+        self._update_camera_display(pool.get_mosaic())
+        status = ", ".join(
+            f"#{stream_id}: {stats['fps']:.0f} fps / {stats['avg_latency_ms']:.0f} ms"
+            for stream_id, stats in pool.get_stats().items()
+        )
+        self.user_interface.status_label.configure(text=status)
+
     def _process_frame(self, camera_frame):
         """
         Processes a single camera frame.
@@ -148,117 +381,218 @@ class SignLanguageApp:
         self, predicted_letter, prediction_count, is_prediction_stable
     ):
         """
-        Handles letter prediction and updates the UI.
+        Handles letter prediction and updates the application state.
+
+        Runs on the processing thread; the UI picks the changes up in the
+        display loop.
 
         Args:
             predicted_letter (str): Most frequently predicted letter
-            prediction_count (int): Number of predictions
+            prediction_count (float): Confidence-weighted number of predictions
             is_prediction_stable (bool): Is the prediction stable
+
+        Returns:
+            int: New letter progress value, or None if it did not change
         """
-        if predicted_letter and prediction_count > 0:
-            # Update progress bar
-            progress = min(
-                prediction_count, self.sign_language_service.required_stable_frames
-            )
-            self.user_interface.update_letter_progress(progress)
+        if not (predicted_letter and prediction_count > 0):
+            return None
 
-            # If there is a stable prediction and it has not been added before
-            is_new_letter = (
-                predicted_letter != self.application_state.get("last_added_letter")
-                or self.application_state.get("current_word") == ""
-            )
+        # If there is a stable prediction and it has not been added before
+        if self.application_state.commit_prediction(
+            predicted_letter, is_prediction_stable
+        ):
+            # Clear prediction list
+            self.sign_language_service.clear_predictions()
 
-            if is_prediction_stable and is_new_letter:
-                # Add the predicted letter
-                self.application_state.add_letter(predicted_letter)
-                self.user_interface.letter_label.configure(text=predicted_letter)
+            # Reset progress bar
+            return 0
 
-                # Update text
-                self.update_text()
+        # Confidence-weighted counts are fractional; the progress bar shows frames
+        return int(
+            min(prediction_count, self.sign_language_service.required_stable_frames)
+        )
 
-                # Clear prediction list
-                self.sign_language_service.clear_predictions()
+    def _update_camera_display(self, processed_frame):
+        """
+        Updates the camera image in the UI. Must run on the Tk main thread.
 
-                # Reset progress bar
-                self.user_interface.update_letter_progress(0)
+        Args:
+            processed_frame (np.ndarray): Processed camera frame (BGR)
+        """
+        img = self.convert_to_tk_image(processed_frame)
+        self.user_interface.set_camera_image(img)
 
-    def _update_camera_display(
-        self, processed_frame, current_time, last_update_time, update_interval
+    def _handle_processed_frame(
+        self, processed_frame, letter, stability_info, prediction=None
     ):
         """
-        Updates the camera image in the UI.
+        Applies the result of one processed frame to the application.
+
+        The UI is not touched here; the result is posted to the display
+        mailbox, which the Tk main thread reads in ``_display_loop``.
 
         Args:
             processed_frame (np.ndarray): Processed camera frame
-            current_time (float): Current time
-            last_update_time (float): Last update time
-            update_interval (float): Update interval
+            letter (str): Letter detected in the frame
+            stability_info (float): Stability percentage
+            prediction (tuple): ``update_prediction`` output if the frame was
+                already rated (by the detection worker)
+        """
+        # Update letter prediction
+        if prediction is None:
+            prediction = self.sign_language_service.update_prediction(
+                letter, self.sign_language_service.last_confidence
+            )
+        predicted_letter, _, prediction_count, is_prediction_stable = prediction
 
-        Returns:
-            float: New last update time
+        # Handle prediction results
+        letter_progress = self._handle_prediction(
+            predicted_letter, prediction_count, is_prediction_stable
+        )
+
+        # Hand the result over to the display loop (older results are replaced)
+        self.display_mailbox.put(
+            {
+                "frame": processed_frame,
+                "stability": stability_info,
+                "letter_progress": letter_progress,
+            }
+        )
+
+    def _start_display_loop(self):
+        """Schedules the display loop on the Tk main thread."""
+        if self._display_job is None:
+            self.display_mailbox.reopen()
+            self._display_job = self.root.after(
+                self.display_refresh_ms, self._display_loop
+            )
+
+    def _display_loop(self):
         """
-        if current_time - last_update_time >= update_interval:
-            if self.application_state.get("is_running"):
-                cv2_img = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                img = self.convert_to_tk_image(cv2_img)
-                self.user_interface.set_camera_image(img)
-                self.root.update_idletasks()
-                self.root.update()
-                return current_time
-        return last_update_time
+        Shows the newest processed frame and refreshes the indicators.
+
+        Runs on the Tk main thread via ``root.after`` so the processing thread
+        never waits for redraws and never touches Tk directly.
+        """
+        self._display_job = None
+        item = self.display_mailbox.get_latest(timeout=0)
+
+        if self.stream_pool is not None:
+            try:
+                self._update_stream_display()
+            except Exception as e:
+                logger.error("Display update error: %s", str(e))
+        elif item is not None:
+            try:
+                if self.application_state.get("is_running"):
+                    self._update_camera_display(item["frame"])
+
+                # Update stability indicators
+                self._update_stability_ui(item["stability"])
+
+                if item["letter_progress"] is not None:
+                    self.user_interface.update_letter_progress(item["letter_progress"])
+
+                # Letters are committed on the processing thread; the same
+                # letter can be added twice in a row, so count the additions
+                letter_count = self.application_state.get("letter_count")
+                if letter_count != self._displayed_letter_count:
+                    self._displayed_letter_count = letter_count
+                    self.user_interface.letter_label.configure(
+                        text=self.application_state.get("detected_letter")
+                    )
+                    self.update_text()
+            except Exception as e:
+                logger.error("Display update error: %s", str(e))
+
+        if self.application_state.get("is_running") or len(self.display_mailbox):
+            self._display_job = self.root.after(
+                self.display_refresh_ms, self._display_loop
+            )
+
+    def _handle_pipeline_output(self, item):
+        """
+        Pipeline sink; receives frames that passed every processing stage.
+
+        Args:
+            item (dict): Pipeline item with the "output" tuple
+        """
+        if self.application_state.get("is_running"):
+            self._handle_processed_frame(*item["output"])
 
     def process_camera(self):
         """
         Continuously processes the camera image.
 
         This method runs in a separate thread and does the following:
-        1. Captures frames from the camera
+        1. Takes the newest frame from the background capture stage
         2. Sends the frame to the sign language service
         3. Translates detected signs to text
-        4. Updates the UI
+        4. Posts the result to the display mailbox for the UI
+
+        When pipelined processing is enabled, detection, classification and
+        rendering run on their own worker threads so consecutive frames
+        overlap. With a detection worker process, frames are handed over
+        through shared memory and its results are collected every frame.
 
         Performance:
-            - 30 FPS is targeted
-            - Sleep is used to reduce frame processing load
+            - The frame rate from the "kamera.fps" setting is targeted
+            - Frames are read on a separate thread; stale frames are dropped
+            - Only the leftover frame budget is slept; overruns skip frames
 
         Raises:
             CameraError: If camera image cannot be obtained
             ProcessingError: If an error occurs during frame processing
         """
-        last_update_time = time.time()
-        update_interval = 1.0 / 30.0  # 30 FPS
+        frame_capture = FrameCapture(self.application_state.get("cap")).start()
+        self.frame_capture = frame_capture
+
+        worker = (
+            self.sign_language_service
+            if isinstance(self.sign_language_service, DetectionWorker)
+            else None
+        )
+
+        pipeline = None
+        if self.pipelined_processing and worker is None:
+            pipeline = self.sign_language_service.build_pipeline(
+                sink=self._handle_pipeline_output
+            ).start()
+
+        scheduler = FrameScheduler(self.target_fps)
+        scheduler.start()
 
         while (
             self.application_state.get("is_running")
             and self.application_state.get("cap") is not None
         ):
             try:
-                ret, frame = self.application_state.get("cap").read()
+                ret, frame = frame_capture.read()
 
                 if not ret:
-                    raise CameraError("Could not get camera image!")
-
-                # Process the frame
-                processed_frame, letter, stability_info = self._process_frame(frame)
-
-                # Update stability indicators
-                self._update_stability_ui(stability_info)
-
-                # Update letter prediction
-                (predicted_letter, _, prediction_count, is_prediction_stable) = (
-                    self.sign_language_service.update_prediction(letter)
-                )
-
-                # Handle prediction results
-                self._handle_prediction(
-                    predicted_letter, prediction_count, is_prediction_stable
-                )
-
-                # Update camera image
-                current_time = time.time()
-                last_update_time = self._update_camera_display(
-                    processed_frame, current_time, last_update_time, update_interval
-                )
+                    raise CameraError(
+                        frame_capture.error or "Could not get camera image!"
+                    )
+
+                if worker is not None:
+                    # The worker process picks the frame up from shared memory
+                    worker.submit(frame)
+                    for result in worker.poll():
+                        self._handle_processed_frame(
+                            result["frame"],
+                            result["letter"],
+                            result["stability"],
+                            result["prediction"],
+                        )
+                elif pipeline is not None:
+                    # Stages pick the frame up on their own threads
+                    pipeline.submit({"frame": frame})
+                else:
+                    # Process the frame
+                    processed_frame, letter, stability_info = self._process_frame(frame)
+                    self._handle_processed_frame(
+                        processed_frame, letter, stability_info
+                    )
 
             except CameraError as e:
                 logger.error("Camera error: %s", str(e))
@@ -268,8 +602,44 @@ class SignLanguageApp:
             except Exception as e:
                 logger.error("Unexpected error: %s", str(e))
 
-            # Performance improvement
-            time.sleep(0.01)
+            # Sleep only for what is left of the frame budget
+            scheduler.wait()
+
+        stats = scheduler.get_stats()
+        logger.info(
+            "Frame rate: %.1f/%d FPS, jitter %.1f ms, %d frames skipped",
+            stats["achieved_fps"],
+            stats["target_fps"],
+            stats["jitter_ms"],
+            stats["skipped_frames"],
+        )
+
+        if pipeline is not None:
+            pipeline.stop()
+            for stage_name, stats in pipeline.get_stats().items():
+                logger.info(
+                    "Pipeline stage '%s': %d frames, %.1f ms avg, %.0f%% busy",
+                    stage_name,
+                    stats["processed"],
+                    stats["avg_time_ms"],
+                    stats["utilization"] * 100,
+                )
+
+        if worker is not None:
+            stats = worker.get_stats()
+            logger.info(
+                "Detection worker: %d frames, %d dropped, %.1f ms avg latency",
+                stats["completed"],
+                stats["dropped"],
+                stats["avg_latency_ms"],
+            )
+
+        frame_capture.stop()
+        logger.info(
+            "Camera stream stopped (captured: %d, dropped: %d)",
+            frame_capture.buffer.total_frames,
+            frame_capture.buffer.dropped_frames,
+        )
 
         # When loop ends, release camera
         if self.application_state.get("cap") is not None:
@@ -325,7 +695,11 @@ class SignLanguageApp:
         # If text to translate is not empty
         text_to_translate = self.application_state.get_display_text().strip()
 
-        if text_to_translate:
+        if text_to_translate and self.translation_service is None:
+            self.user_interface.status_label.configure(
+                text="Translation service is not ready."
+            )
+        elif text_to_translate:
             try:
                 # Split language pair
                 lang_pair = self.translation_direction.get().split("-")
@@ -388,7 +762,8 @@ class SignLanguageApp:
     def clear_text(self):
         """Clears all text."""
         # Clear prediction
-        self.sign_language_service.clear_predictions()
+        if self.sign_language_service is not None:
+            self.sign_language_service.clear_predictions()
 
         # Clear state
         self.application_state.clear()
@@ -411,9 +786,24 @@ class SignLanguageApp:
         self.application_state.set("is_running", False)
 
         # Release resources
+        if self.frame_capture is not None:
+            self.frame_capture.stop()
+
         if self.application_state.get("cap") is not None:
             self.application_state.get("cap").release()
 
-        self.sign_language_service.release_resources()
+        if self._display_job is not None:
+            self.root.after_cancel(self._display_job)
+            self._display_job = None
+
+        if self._service_poll_job is not None:
+            self.root.after_cancel(self._service_poll_job)
+            self._service_poll_job = None
+
+        self._stop_stream_pool(wait=True)
+
+        self.service_loader.shutdown(wait=False)
+        if self.sign_language_service is not None:
+            self.sign_language_service.release_resources()
         self.root.destroy()
         logger.info("Application closed")
@@ -0,0 +1,221 @@
+"""
+Model Artifact
+Versioned, memory-mappable storage format for the compiled sign language
+forest, and a converter from the pickled scikit-learn model.
+
+An artifact is a directory holding one ``.npy`` file per forest array and a
+``manifest.json`` header::
+
+    EnglishHandSignModel.model/
+        manifest.json
+        feature.npy  threshold.npy  left.npy  right.npy
+        leaf_index.npy  leaf_values.npy  roots.npy  classes.npy
+
+The arrays are opened with ``np.load(mmap_mode="r")``, so loading does not
+read the node data up front and processes using the same artifact share its
+pages through the OS page cache. Nothing is unpickled.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+
+import numpy as np
+
+from src.exceptions import ModelException
+from src.forest_compiler import CompiledForest
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NAME = "yasmin-forest"
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+ARRAY_NAMES = (
+    "feature",
+    "threshold",
+    "left",
+    "right",
+    "leaf_index",
+    "leaf_values",
+    "roots",
+    "classes",
+)
+
+
+def is_artifact(path):
+    """Returns whether the path is a model artifact directory."""
+    return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+def file_hash(path):
+    """Calculates the SHA-256 hash of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_artifact(forest, path, labels=None, training_data_hash=None):
+    """Writes a compiled forest as a model artifact.
+
+    Args:
+        forest: CompiledForest to store
+        path: Artifact directory (created if missing)
+        labels: Optional class index -> letter mapping
+        training_data_hash: Optional hash of the training data
+
+    Returns:
+        dict: Written manifest
+    """
+    os.makedirs(path, exist_ok=True)
+
+    arrays = {}
+    for name in ARRAY_NAMES:
+        array = np.ascontiguousarray(getattr(forest, name))
+        if array.dtype == object:
+            raise ModelException(f"Array '{name}' cannot be stored without pickle")
+        np.save(os.path.join(path, f"{name}.npy"), array, allow_pickle=False)
+        arrays[name] = {"dtype": array.dtype.str, "shape": list(array.shape)}
+
+    manifest = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "n_features": forest.n_features,
+        "n_trees": forest.n_trees,
+        "max_depth": forest.max_depth,
+        "labels": {str(k): v for k, v in (labels or {}).items()},
+        "training_data_hash": training_data_hash,
+        "arrays": arrays,
+    }
+
+    # Manifest last: a directory without it is not a (complete) artifact
+    with open(os.path.join(path, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    logger.info(f"Model artifact written: {path}")
+    return manifest
+
+
+def load_artifact(path, mmap=True):
+    """Loads a model artifact.
+
+    Args:
+        path: Artifact directory
+        mmap: Memory-map the arrays instead of reading them
+
+    Returns:
+        tuple: (CompiledForest, manifest dict)
+
+    Raises:
+        ModelException: If the artifact is missing, has an unsupported
+            version or its arrays do not match the manifest
+    """
+    try:
+        with open(os.path.join(path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ModelException(f"Model artifact could not be read: {e}")
+
+    if manifest.get("format") != FORMAT_NAME:
+        raise ModelException(f"Not a model artifact: {path}")
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ModelException(
+            f"Unsupported model artifact version: {manifest.get('version')}"
+        )
+
+    arrays = {}
+    for name in ARRAY_NAMES:
+        try:
+            array = np.load(
+                os.path.join(path, f"{name}.npy"),
+                mmap_mode="r" if mmap else None,
+                allow_pickle=False,
+            )
+        except (OSError, ValueError) as e:
+            raise ModelException(f"Model array '{name}' could not be loaded: {e}")
+
+        expected = manifest["arrays"][name]
+        if (
+            array.dtype.str != expected["dtype"]
+            or list(array.shape) != expected["shape"]
+        ):
+            raise ModelException(f"Model array '{name}' does not match the manifest")
+        # Plain ndarray view of the mapping (indexing a memmap is slower)
+        arrays[name] = np.asarray(array)
+
+    forest = CompiledForest(
+        max_depth=manifest["max_depth"], n_features=manifest["n_features"], **arrays
+    )
+    logger.info(
+        f"Model artifact loaded: {path} ({forest.n_trees} trees, "
+        f"{'memory-mapped' if mmap else 'in memory'})"
+    )
+    return forest, manifest
+
+
+def convert_pickle(pickle_path, artifact_path, labels=None, training_data_path=None):
+    """Converts a pickled scikit-learn forest into a model artifact.
+
+    Args:
+        pickle_path: Pickle file with a ``{"model": forest}`` dict
+        artifact_path: Output artifact directory
+        labels: Optional class index -> letter mapping
+        training_data_path: Optional training data file whose hash is stored
+
+    Returns:
+        dict: Written manifest
+    """
+    with open(pickle_path, "rb") as f:
+        model = pickle.load(f)["model"]
+
+    forest = CompiledForest.from_sklearn(model)
+    training_data_hash = file_hash(training_data_path) if training_data_path else None
+    return save_artifact(forest, artifact_path, labels, training_data_hash)
+
+
+def main(argv=None):
+    """Command line converter: pickle -> model artifact."""
+    parser = argparse.ArgumentParser(
+        description="Convert a pickled sign language model to a model artifact"
+    )
+    parser.add_argument(
+        "pickle_path", help="Pickled model (e.g. EnglishHandSignModel.p)"
+    )
+    parser.add_argument(
+        "artifact_path",
+        nargs="?",
+        help="Output directory (default: pickle path with a .model extension)",
+    )
+    parser.add_argument("--training-data", help="Training data file to hash")
+    args = parser.parse_args(argv)
+
+    # Imported here: sign_language_model itself imports this module
+    from src.sign_language_model import DEFAULT_LABELS
+
+    artifact_path = (
+        args.artifact_path or os.path.splitext(args.pickle_path)[0] + ".model"
+    )
+    manifest = convert_pickle(
+        args.pickle_path, artifact_path, DEFAULT_LABELS, args.training_data
+    )
+    print(
+        f"{args.pickle_path} -> {artifact_path} "
+        f"({manifest['n_trees']} trees, format v{manifest['version']})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
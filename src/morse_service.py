@@ -5,7 +5,11 @@ Manages Morse code operations for the sign language application.
 
 import logging
 import time
-import winsound
+
+from src.lazy_import import lazy_import
+
+# Windows only; a missing module surfaces as a playback error
+winsound = lazy_import("winsound")
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,116 @@
+"""
+Motion Gate
+Cheap frame-difference check that decides whether detection can be skipped.
+"""
+
+import logging
+import zlib
+
+import numpy as np
+
+from src.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+class MotionGate:
+    """Detects frames that are (nearly) identical to the last analysed frame.
+
+    Frames are compared on a small grayscale thumbnail against the reference
+    frame of the last full detection, so slow drift still triggers a new
+    detection once it adds up. Exact duplicates (repeated by some webcams)
+    are caught with a checksum of the full frame.
+    """
+
+    def __init__(self, threshold=2.0, sample_size=(64, 48), max_reuse_frames=15):
+        """Initializes the gate.
+
+        Args:
+            threshold: Mean absolute gray level difference (0-255) below
+                which the scene is considered unchanged
+            sample_size: (width, height) of the comparison thumbnail
+            max_reuse_frames: Maximum consecutive reused frames before a
+                detection is forced
+        """
+        self.threshold = threshold
+        self.sample_size = sample_size
+        self.max_reuse_frames = max_reuse_frames
+        self._reference = None
+        self._last_checksum = None
+        self._reuse_count = 0
+
+        # Statistics
+        self.duplicate_hits = 0
+        self.static_hits = 0
+        self.misses = 0
+
+    def _thumbnail(self, frame):
+        """Returns the downsampled grayscale comparison image."""
+        small = cv2.resize(frame, self.sample_size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    @staticmethod
+    def _checksum(frame):
+        """Returns a checksum of the full frame buffer."""
+        return zlib.crc32(np.ascontiguousarray(frame).data)
+
+    def should_reuse(self, frame):
+        """Checks whether previous detection results can be reused.
+
+        A miss makes the frame the new reference, as the caller is expected
+        to run a full detection on it.
+
+        Args:
+            frame: Frame to check (BGR)
+
+        Returns:
+            bool: True if the scene has not changed since the last detection
+        """
+        checksum = self._checksum(frame)
+        is_duplicate = checksum == self._last_checksum
+        self._last_checksum = checksum
+
+        if self._reference is not None and self._reuse_count < self.max_reuse_frames:
+            if is_duplicate:
+                self._reuse_count += 1
+                self.duplicate_hits += 1
+                return True
+
+            thumbnail = self._thumbnail(frame)
+            difference = cv2.absdiff(thumbnail, self._reference).mean()
+            if difference < self.threshold:
+                self._reuse_count += 1
+                self.static_hits += 1
+                return True
+        else:
+            thumbnail = self._thumbnail(frame)
+
+        self._reference = thumbnail
+        self._reuse_count = 0
+        self.misses += 1
+        return False
+
+    def reset(self):
+        """Forgets the reference frame; the next frame is always a miss."""
+        self._reference = None
+        self._last_checksum = None
+        self._reuse_count = 0
+
+    def get_stats(self):
+        """Returns gate statistics for threshold tuning.
+
+        Returns:
+            dict: Hit/miss counts and hit rate
+        """
+        hits = self.duplicate_hits + self.static_hits
+        total = hits + self.misses
+        return {
+            "duplicate_hits": self.duplicate_hits,
+            "static_hits": self.static_hits,
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
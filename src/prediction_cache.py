@@ -0,0 +1,110 @@
+"""
+Prediction Cache
+Bounded LRU cache of letter predictions keyed by quantized feature vectors.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """LRU cache for classifier outputs.
+
+    Feature vectors are snapped to a grid before they are used as keys, so
+    vectors that differ only by landmark noise share one entry.
+    """
+
+    def __init__(self, max_size=256, grid=0.005):
+        """Initializes the cache.
+
+        Args:
+            max_size: Maximum number of cached predictions
+            grid: Quantization step of the feature values
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        if grid <= 0:
+            raise ValueError("Quantization grid must be positive")
+
+        self.max_size = max_size
+        self.grid = grid
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, features):
+        """Quantizes a feature vector into a cache key.
+
+        Args:
+            features: Feature vector
+
+        Returns:
+            bytes: Cache key
+        """
+        quantized = np.rint(np.asarray(features, dtype=np.float64) / self.grid)
+        return quantized.astype(np.int32).tobytes()
+
+    def get(self, key):
+        """Returns the cached value and marks it as recently used.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Key from ``make_key``
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Removes all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_stats(self):
+        """Returns cache statistics.
+
+        Returns:
+            dict: Size, hit/miss/eviction counts and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,676 @@
+"""
+Recognition Server
+Serves sign language recognition to thin clients over WebSocket.
+
+Clients open a session on ``/ws`` and send JPEG frames as binary messages,
+or landmark packets (see ``src.landmark_codec``) if they track hands
+themselves; every processed frame is answered with a JSON text message holding the
+letter, its stability and the committed text. Text messages control the
+session: ``{"type": "space"}``, ``{"type": "backspace"}`` and
+``{"type": "clear"}``. ``GET /health`` returns the server statistics.
+
+The server is a single asyncio event loop built on the standard library
+(HTTP/1.1 upgrade and RFC 6455 framing). JPEG decoding and detection run in
+a thread pool, so the loop never blocks on a frame.
+
+Usage::
+
+    python -m src.recognition_server --host 0.0.0.0 --port 8765
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import logging
+import os
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.app_state import AppState
+from src.config import Config
+from src.exceptions import ConfigurationException
+from src.inference_batcher import InferenceBatcher
+from src.landmark_codec import LandmarkDecoder, is_landmark_packet
+from src.lazy_import import lazy_import
+from src.sign_language_service import MODEL_OPTIONS, SignLanguageService
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+CLOSE_NORMAL = 1000
+CLOSE_UNSUPPORTED = 1003
+CLOSE_TOO_BIG = 1009
+
+
+class WebSocketClosed(Exception):
+    """Raised when the peer closed the WebSocket or the connection dropped."""
+
+
+def encode_frame(opcode, payload=b"", mask=None):
+    """Encodes one WebSocket frame (always final).
+
+    Args:
+        opcode: Frame opcode
+        payload: Frame payload (str is UTF-8 encoded)
+        mask: Optional 4-byte masking key (clients must mask their frames)
+
+    Returns:
+        bytes: Encoded frame
+    """
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+
+    mask_bit = 0x80 if mask is not None else 0
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, length)
+
+    if mask is None:
+        return header + payload
+    return header + mask + _apply_mask(payload, mask)
+
+
+def _apply_mask(payload, mask):
+    """XORs the payload with the repeating 4-byte masking key."""
+    if not payload:
+        return b""
+    key = np.frombuffer(mask * ((len(payload) + 3) // 4), dtype=np.uint8)
+    data = np.frombuffer(payload, dtype=np.uint8)
+    return (data ^ key[: len(data)]).tobytes()
+
+
+async def read_frame(reader, max_size):
+    """Reads one WebSocket frame.
+
+    Args:
+        reader: asyncio.StreamReader of the connection
+        max_size: Largest accepted payload in bytes
+
+    Returns:
+        tuple: (final flag, opcode, unmasked payload)
+
+    Raises:
+        WebSocketClosed: If the connection ended
+        ValueError: If the payload is larger than max_size
+    """
+    try:
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        if length > max_size:
+            raise ValueError(f"Message too big: {length} bytes")
+
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+    except (asyncio.IncompleteReadError, ConnectionError) as e:
+        raise WebSocketClosed() from e
+
+    if mask is not None:
+        payload = _apply_mask(payload, mask)
+    return bool(first & 0x80), first & 0x0F, payload
+
+
+class Session:
+    """State of one client: its own service, stability window and text.
+
+    At most one frame of a session is being recognized at a time. Frames
+    that arrive meanwhile replace the waiting frame, so a slow detector
+    always works on the newest frame instead of building up latency.
+    """
+
+    def __init__(self, session_id, service):
+        """Initializes the session.
+
+        Args:
+            session_id: Session number
+            service: SignLanguageService owned by this session
+        """
+        self.session_id = session_id
+        self.service = service
+        self.state = AppState()
+        self.landmark_decoder = LandmarkDecoder()
+        self.pending = None
+        self.busy = False  # A frame is being recognized or waiting
+        self.frame_ready = asyncio.Event()
+        self.recognition = None  # Future of the frame in the thread pool
+        # The service is only touched by pool threads, so the prediction
+        # history is cleared there, before the next frame
+        self.clear_requested = False
+
+        # Statistics
+        self.received_frames = 0
+        self.processed_frames = 0
+        self.dropped_frames = 0
+
+    def offer(self, data):
+        """Stores a frame for processing, replacing a waiting one.
+
+        Returns:
+            bool: False if a waiting frame was dropped
+        """
+        dropped = self.pending is not None
+        if dropped:
+            self.dropped_frames += 1
+        self.pending = data
+        self.busy = True
+        self.frame_ready.set()
+        return not dropped
+
+    def recognize(self, data):
+        """Rates a JPEG frame or decoded landmarks (runs in the thread pool).
+
+        Args:
+            data: JPEG bytes or (H, 21, 2) landmark sets
+
+        Returns:
+            dict: Letter, confidence, stability and prediction; None if the
+            frame could not be decoded
+        """
+        if self.clear_requested:
+            self.clear_requested = False
+            self.service.clear_predictions()
+
+        if isinstance(data, np.ndarray):
+            letter, stability = self.service.process_landmarks(data)
+        else:
+            frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if frame is None:
+                return None
+            _, letter, stability = self.service.process_frame(frame)
+        confidence = self.service.last_confidence
+        return {
+            "letter": letter,
+            "confidence": confidence,
+            "stability": stability,
+            "prediction": self.service.update_prediction(letter, confidence),
+        }
+
+    def apply(self, result):
+        """Commits a recognized letter to the session text.
+
+        Returns:
+            dict: Message for the client
+        """
+        self.processed_frames += 1
+        predicted_letter, _, prediction_count, is_stable = result["prediction"]
+        committed = (
+            bool(predicted_letter)
+            and prediction_count > 0
+            and self.state.commit_prediction(predicted_letter, is_stable)
+        )
+        if committed:
+            self.clear_requested = True
+
+        return {
+            "type": "result",
+            "letter": result["letter"],
+            "confidence": result["confidence"],
+            "stability": result["stability"],
+            "committed": predicted_letter if committed else None,
+            "text": self.state.get_display_text(),
+            "dropped": self.dropped_frames,
+        }
+
+    def command(self, message):
+        """Applies a client command to the session text.
+
+        Args:
+            message: Decoded JSON command
+
+        Returns:
+            dict: Message for the client
+        """
+        command = message.get("type") if isinstance(message, dict) else None
+        if command == "space":
+            self.state.add_space()
+        elif command == "backspace":
+            self.state.delete_last_letter()
+        elif command == "clear":
+            self.state.clear()
+            self.clear_requested = True
+        else:
+            return {"type": "error", "message": f"Unknown command: {command}"}
+        return {"type": "text", "text": self.state.get_display_text()}
+
+
+class RecognitionServer:
+    """Asyncio WebSocket server with one recognition session per client.
+
+    Every session owns a SignLanguageService, so hand tracks and the
+    stability window are never shared between clients. Detection runs in a
+    thread pool of ``workers`` threads. Once ``workers + max_queue`` frames
+    are being processed or wait for a thread, frames of idle sessions are
+    dropped instead of queued (load shedding); busy sessions keep only their
+    newest frame. Connections beyond ``max_sessions`` are refused with
+    HTTP 503.
+
+    With ``max_batch_size`` set, all sessions share one model behind an
+    InferenceBatcher, so the letter predictions of concurrent sessions are
+    classified together.
+    """
+
+    def __init__(
+        self,
+        service_options=None,
+        max_sessions=8,
+        workers=None,
+        max_queue=None,
+        max_message_size=4 * 1024 * 1024,
+        max_batch_size=None,
+        max_batch_wait=0.002,
+    ):
+        """Initializes the server.
+
+        Args:
+            service_options: Keyword arguments of SignLanguageService
+            max_sessions: Maximum number of concurrent sessions
+            workers: Number of detection threads (default: CPU count, at most
+                max_sessions)
+            max_queue: Frames allowed to wait for a detection thread
+                (default: as many as there are threads)
+            max_message_size: Largest accepted WebSocket message in bytes
+            max_batch_size: Share one micro-batched model between the
+                sessions, with at most this many vectors per model call
+                (every session loads its own model if None)
+            max_batch_wait: Longest time in seconds a vector waits for its
+                batch to fill
+        """
+        self.service_options = service_options or {}
+        self.max_sessions = max_sessions
+        self.workers = workers or min(max_sessions, os.cpu_count() or 1)
+        self.max_queue = self.workers if max_queue is None else max_queue
+        self.max_message_size = max_message_size
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait
+        self.batcher = None
+
+        self.sessions = {}
+        self.in_flight = 0
+        self.shed_frames = 0
+        self.refused_sessions = 0
+        self._session_ids = itertools.count(1)
+        self._reserved = 0
+        self._service_class = SignLanguageService
+        self._executor = None
+        self._server = None
+
+    async def start(
+        self, host="127.0.0.1", port=8765, service_class=SignLanguageService
+    ):
+        """Starts listening.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port (0 picks a free port)
+            service_class: Service class created for every session
+
+        Returns:
+            RecognitionServer: Self (for chaining)
+        """
+        self._service_class = service_class
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="Recognition"
+        )
+        if self.max_batch_size:
+            model_options = {
+                name: value
+                for name, value in self.service_options.items()
+                if name in MODEL_OPTIONS
+            }
+            model = await asyncio.get_running_loop().run_in_executor(
+                self._executor, lambda: service_class.load_model(**model_options)
+            )
+            self.batcher = InferenceBatcher(
+                model, self.max_batch_size, self.max_batch_wait
+            ).start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        logger.info(
+            f"Recognition server listening on {host}:{self.port} "
+            f"({self.max_sessions} sessions, {self.workers} detection threads)"
+        )
+        return self
+
+    @property
+    def port(self):
+        """Port the server listens on."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Serves until the task is cancelled."""
+        await self._server.serve_forever()
+
+    async def stop(self):
+        """Stops listening and releases the thread pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.batcher is not None:
+            self.batcher.stop()
+            self.batcher = None
+
+    def get_stats(self):
+        """Returns server statistics.
+
+        Returns:
+            dict: Session count, frames in flight, shed frames and per-session
+            frame counts
+        """
+        return {
+            "sessions": len(self.sessions),
+            "max_sessions": self.max_sessions,
+            "in_flight": self.in_flight,
+            "shed_frames": self.shed_frames,
+            "refused_sessions": self.refused_sessions,
+            "batching": self.batcher.get_stats() if self.batcher else None,
+            "per_session": {
+                session_id: {
+                    "received_frames": session.received_frames,
+                    "processed_frames": session.processed_frames,
+                    "dropped_frames": session.dropped_frames,
+                }
+                for session_id, session in self.sessions.items()
+            },
+        }
+
+    async def _handle_connection(self, reader, writer):
+        """Routes one HTTP connection (health check or WebSocket session)."""
+        try:
+            try:
+                request = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+
+            lines = request.decode("latin-1").split("\r\n")
+            parts = lines[0].split()
+            path = parts[1] if len(parts) > 1 else ""
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if path == "/health":
+                await self._respond(writer, "200 OK", self.get_stats())
+            elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._run_session(reader, writer, headers)
+            else:
+                await self._respond(writer, "404 Not Found", {"error": "not found"})
+        except ConnectionError:
+            pass
+        except Exception as e:
+            logger.error(f"Connection error: {e}")
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, body):
+        """Writes a JSON HTTP response."""
+        data = json.dumps(body).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        await writer.drain()
+
+    async def _run_session(self, reader, writer, headers):
+        """Performs the WebSocket handshake and serves one session."""
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._respond(writer, "400 Bad Request", {"error": "missing key"})
+            return
+
+        # Reserve the slot before the (slow) service creation so concurrent
+        # handshakes cannot exceed the cap
+        if len(self.sessions) + self._reserved >= self.max_sessions:
+            self.refused_sessions += 1
+            await self._respond(
+                writer, "503 Service Unavailable", {"error": "session limit reached"}
+            )
+            return
+
+        self._reserved += 1
+        try:
+            loop = asyncio.get_running_loop()
+            options = dict(self.service_options)
+            if self.batcher is not None:
+                options["model"] = self.batcher
+            service = await loop.run_in_executor(
+                self._executor, lambda: self._service_class(**options)
+            )
+        except Exception as e:
+            logger.error(f"Session service could not be created: {e}")
+            await self._respond(
+                writer, "503 Service Unavailable", {"error": "service unavailable"}
+            )
+            return
+        finally:
+            self._reserved -= 1
+
+        accept = base64.b64encode(
+            hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()
+        ).decode("ascii")
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode("latin-1")
+        )
+
+        session = Session(next(self._session_ids), service)
+        self.sessions[session.session_id] = session
+        logger.info(f"Session {session.session_id} opened")
+
+        worker = asyncio.create_task(self._process_frames(session, writer))
+        try:
+            await self._send(writer, {"type": "session", "id": session.session_id})
+            await self._receive_messages(session, reader, writer)
+        except WebSocketClosed:
+            pass
+        finally:
+            worker.cancel()
+            try:
+                await worker
+            except (asyncio.CancelledError, Exception):
+                pass
+            del self.sessions[session.session_id]
+            # Cancelling the worker does not stop a pool thread that is still
+            # inside recognize; release the service only after it finished
+            if session.recognition is not None:
+                await asyncio.wait([session.recognition])
+            await loop.run_in_executor(self._executor, service.release_resources)
+            logger.info(
+                f"Session {session.session_id} closed: "
+                f"{session.processed_frames} frames, "
+                f"{session.dropped_frames} dropped"
+            )
+
+    async def _receive_messages(self, session, reader, writer):
+        """Reads client messages until the session closes."""
+        fragments, message_opcode = [], None
+        while True:
+            try:
+                final, opcode, payload = await read_frame(reader, self.max_message_size)
+            except ValueError:
+                await self._close(writer, CLOSE_TOO_BIG)
+                return
+
+            if opcode == OPCODE_CLOSE:
+                await self._close(writer, CLOSE_NORMAL)
+                return
+            if opcode == OPCODE_PING:
+                writer.write(encode_frame(OPCODE_PONG, payload))
+                continue
+            if opcode == OPCODE_PONG:
+                continue
+
+            if opcode != OPCODE_CONTINUATION:
+                fragments, message_opcode = [], opcode
+            fragments.append(payload)
+            if sum(len(fragment) for fragment in fragments) > self.max_message_size:
+                await self._close(writer, CLOSE_TOO_BIG)
+                return
+            if not final:
+                continue
+
+            data = b"".join(fragments)
+            fragments = []
+            if message_opcode == OPCODE_BINARY and is_landmark_packet(data):
+                # Decoded on arrival: delta packets need every predecessor,
+                # even the ones that are shed
+                try:
+                    self._accept_frame(session, session.landmark_decoder.decode(data))
+                except ValueError as e:
+                    await self._send(writer, {"type": "error", "message": str(e)})
+            elif message_opcode == OPCODE_BINARY:
+                self._accept_frame(session, data)
+            elif message_opcode == OPCODE_TEXT:
+                try:
+                    message = json.loads(data.decode("utf-8"))
+                except ValueError:
+                    message = None
+                await self._send(writer, session.command(message))
+            else:
+                await self._close(writer, CLOSE_UNSUPPORTED)
+                return
+
+    def _accept_frame(self, session, data):
+        """Queues a frame for its session or sheds it when overloaded."""
+        session.received_frames += 1
+        # A busy session only swaps its waiting frame; a new session frame
+        # would add to the detector queue
+        if not session.busy and self.in_flight >= self.workers + self.max_queue:
+            session.dropped_frames += 1
+            self.shed_frames += 1
+            return
+        session.offer(data)
+
+    async def _process_frames(self, session, writer):
+        """Recognizes the newest frame of a session, one frame at a time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await session.frame_ready.wait()
+            session.frame_ready.clear()
+            data, session.pending = session.pending, None
+
+            session.busy = True
+            session.recognition = loop.run_in_executor(
+                self._executor, session.recognize, data
+            )
+            # Counted until the pool thread is done, even if this task is
+            # cancelled while waiting
+            self.in_flight += 1
+            session.recognition.add_done_callback(self._recognition_done)
+            try:
+                result = await asyncio.shield(session.recognition)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Session {session.session_id} frame failed: {e}")
+                result = None
+            session.recognition = None
+            session.busy = session.pending is not None
+
+            if result is None:
+                message = {"type": "error", "message": "frame could not be processed"}
+            else:
+                message = session.apply(result)
+            await self._send(writer, message)
+
+    def _recognition_done(self, future):
+        """Done callback of a frame in the thread pool."""
+        self.in_flight -= 1
+
+    @staticmethod
+    async def _send(writer, message):
+        """Sends a JSON text message."""
+        writer.write(encode_frame(OPCODE_TEXT, json.dumps(message)))
+        await writer.drain()
+
+    @staticmethod
+    async def _close(writer, code):
+        """Sends a close frame."""
+        writer.write(encode_frame(OPCODE_CLOSE, struct.pack("!H", code)))
+        await writer.drain()
+
+
+def main(argv=None):
+    """Command line tool: runs the recognition server."""
+    parser = argparse.ArgumentParser(
+        description="Serve sign language recognition over WebSocket"
+    )
+    parser.add_argument("--host", help="Interface to listen on")
+    parser.add_argument("--port", type=int, help="TCP port")
+    parser.add_argument(
+        "--max-sessions", type=int, help="Maximum number of concurrent sessions"
+    )
+    parser.add_argument("--workers", type=int, help="Number of detection threads")
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Configuration file (default: config.yaml)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    config = Config()
+    try:
+        config.load_config(args.config)
+    except ConfigurationException as e:
+        logger.warning(f"Configuration could not be loaded, using defaults: {e}")
+
+    server = RecognitionServer(
+        SignLanguageService.options_from_config(),
+        max_sessions=args.max_sessions or config.get("sunucu.max_oturum", 8),
+        workers=args.workers or config.get("sunucu.isci_sayisi"),
+        max_queue=config.get("sunucu.kuyruk_limiti"),
+        max_batch_size=config.get("sunucu.mikro_toplama.boyut"),
+        max_batch_wait=config.get("sunucu.mikro_toplama.bekleme_ms", 2) / 1000,
+    )
+
+    async def serve():
+        await server.start(
+            args.host or config.get("sunucu.adres", "127.0.0.1"),
+            args.port or config.get("sunucu.port", 8765),
+        )
+        try:
+            await server.serve_forever()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
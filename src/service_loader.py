@@ -0,0 +1,121 @@
+"""
+Service Loader
+Builds heavy services on background threads so the UI can appear at once.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceLoader:
+    """Creates services concurrently and exposes a readiness future for each.
+
+    Every service is built by a factory on a worker thread, optionally
+    followed by a warm-up call so the first real request does not pay for
+    lazy initialization. Creation and warm-up times are logged and kept per
+    service.
+    """
+
+    def __init__(self, max_workers=4):
+        """Initializes the loader.
+
+        Args:
+            max_workers: Maximum number of services built at the same time
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ServiceLoader"
+        )
+        self._futures = {}
+        self._timings = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name, factory, warm_up=None):
+        """Starts building a service in the background.
+
+        Args:
+            name: Service name (used for lookups and timing logs)
+            factory: Callable returning the service
+            warm_up: Optional callable receiving the new service
+
+        Returns:
+            concurrent.futures.Future: Resolves to the service (or its error)
+        """
+        future = self._executor.submit(self._build, name, factory, warm_up)
+        with self._lock:
+            self._futures[name] = future
+        return future
+
+    def _build(self, name, factory, warm_up):
+        """Builds and warms up one service, recording the timings."""
+        start = time.perf_counter()
+        try:
+            service = factory()
+            created = time.perf_counter()
+            if warm_up is not None:
+                warm_up(service)
+            finished = time.perf_counter()
+        except Exception as e:
+            logger.error(f"Service '{name}' could not be started: {e}")
+            raise
+
+        timings = {
+            "init_ms": (created - start) * 1000,
+            "warmup_ms": (finished - created) * 1000,
+        }
+        with self._lock:
+            self._timings[name] = timings
+        logger.info(
+            f"Service '{name}' ready: init {timings['init_ms']:.0f} ms, "
+            f"warm-up {timings['warmup_ms']:.0f} ms"
+        )
+        return service
+
+    def future(self, name):
+        """Returns the readiness future of a service."""
+        with self._lock:
+            return self._futures[name]
+
+    def is_ready(self, name):
+        """Returns whether a service finished loading (successfully or not)."""
+        return self.future(name).done()
+
+    def get(self, name, timeout=None):
+        """Waits for a service and returns it.
+
+        Args:
+            name: Service name
+            timeout: Maximum wait time in seconds (None waits forever)
+
+        Returns:
+            Service object
+
+        Raises:
+            Exception: The error raised while building the service
+        """
+        return self.future(name).result(timeout)
+
+    def all_ready(self):
+        """Returns whether every submitted service finished loading."""
+        with self._lock:
+            return all(future.done() for future in self._futures.values())
+
+    def get_timings(self):
+        """Returns creation and warm-up times of the finished services.
+
+        Returns:
+            dict: Service name -> {"init_ms", "warmup_ms"}
+        """
+        with self._lock:
+            return dict(self._timings)
+
+    def shutdown(self, wait=False):
+        """Stops the worker threads.
+
+        Args:
+            wait: Wait for services that are still loading
+        """
+        self._executor.shutdown(wait=wait)
@@ -8,22 +8,125 @@ import pickle
 
 import numpy as np
 
+from src.forest_compiler import CompiledForest
+from src.model_artifact import is_artifact, load_artifact
+from src.prediction_cache import PredictionCache
+
 logger = logging.getLogger(__name__)
 
+# Prediction backends
+BACKEND_SKLEARN = "sklearn"
+BACKEND_COMPILED = "compiled"
+
+# Default English ASL labels (class index -> letter)
+DEFAULT_LABELS = {
+    0: "A",
+    1: "B",
+    2: "C",
+    3: "D",
+    4: "E",
+    5: "F",
+    6: "G",
+    7: "H",
+    8: "I",
+    9: "J",
+    10: "K",
+    11: "L",
+    12: "M",
+    13: "N",
+    14: "O",
+    15: "P",
+    16: "Q",
+    17: "R",
+    18: "S",
+    19: "T",
+    20: "U",
+    21: "V",
+    22: "W",
+    23: "X",
+    24: "Y",
+    25: "Z",
+}
+
 
 class SignLanguageModel:
     """Sign language recognition model class."""
 
-    def __init__(self, model_path, labels_dict=None):
-        """Loads the model and sets up labels."""
-        self.model = self._load_model(model_path)
+    def __init__(
+        self,
+        model_path,
+        labels_dict=None,
+        backend=BACKEND_SKLEARN,
+        anytime_block_size=None,
+        anytime_confidence=None,
+        cache_size=None,
+        cache_grid=0.005,
+    ):
+        """Loads the model and sets up labels.
+
+        Args:
+            model_path: Pickled model file or model artifact directory
+                (artifacts are always evaluated with the compiled backend)
+            labels_dict: Class index -> letter mapping (default: the
+                artifact labels or English ASL)
+            backend: "sklearn" to call the model directly or "compiled" to
+                evaluate a flattened copy of the random forest
+            anytime_block_size: With the compiled backend, evaluate trees in
+                blocks of this size and stop once the vote is settled
+                (disabled if None). Only letter-only predictions stop early;
+                confidences always come from the whole forest
+            anytime_confidence: Optional leading class probability at which
+                anytime evaluation stops early
+            cache_size: Number of predictions kept in an LRU cache keyed by
+                the quantized feature vector (disabled if None)
+            cache_grid: Quantization step of the cache keys
+        """
+        if backend not in (BACKEND_SKLEARN, BACKEND_COMPILED):
+            raise ValueError(f"Unknown prediction backend: {backend}")
+
+        self.backend = backend
+        self.compiled_forest = None
+        self.manifest = None
+
+        if is_artifact(model_path):
+            self.model = None
+            self.compiled_forest, self.manifest = load_artifact(model_path)
+            self.backend = BACKEND_COMPILED
+            artifact_labels = {
+                int(k): v for k, v in self.manifest.get("labels", {}).items()
+            }
+            labels_dict = labels_dict or artifact_labels
+        else:
+            self.model = self._load_model(model_path)
+
         self.labels_dict = labels_dict or self._get_default_labels()
-        logger.info(f"Sign language model loaded: {model_path}")
+        self.anytime_block_size = anytime_block_size
+        self.anytime_confidence = anytime_confidence
+
+        self.prediction_cache = (
+            PredictionCache(max_size=cache_size, grid=cache_grid)
+            if cache_size
+            else None
+        )
+
+        # Anytime prediction statistics
+        self.anytime_predictions = 0
+        self.anytime_trees_used = 0
+
+        if self.backend == BACKEND_COMPILED and self.compiled_forest is None:
+            try:
+                self.compiled_forest = CompiledForest.from_sklearn(self.model)
+            except ValueError as e:
+                logger.warning(f"Model could not be compiled, using sklearn: {e}")
+                self.backend = BACKEND_SKLEARN
+
+        logger.info(f"Sign language model loaded: {model_path} ({self.backend})")
 
     def _load_model(self, model_path):
         """Loads a model saved as pickle."""
         try:
-            model_dict = pickle.load(open(model_path, "rb"))
+            with open(model_path, "rb") as f:
+                model_dict = pickle.load(f)
             return model_dict["model"]
         except Exception as e:
             logger.error(f"Model loading error: {e}")
@@ -31,40 +134,14 @@ class SignLanguageModel:
 
     def _get_default_labels(self):
         """Returns default English ASL labels."""
-        return {
-            0: "A",
-            1: "B",
-            2: "C",
-            3: "D",
-            4: "E",
-            5: "F",
-            6: "G",
-            7: "H",
-            8: "I",
-            9: "J",
-            10: "K",
-            11: "L",
-            12: "M",
-            13: "N",
-            14: "O",
-            15: "P",
-            16: "Q",
-            17: "R",
-            18: "S",
-            19: "T",
-            20: "U",
-            21: "V",
-            22: "W",
-            23: "X",
-            24: "Y",
-            25: "Z",
-        }
+        return dict(DEFAULT_LABELS)
 
     def predict(self, features):
         """Makes letter prediction based on feature vector.
 
         Args:
-            features: Feature vector (hand landmark coordinates)
+            features: Feature vector (hand landmark coordinates), a list or a
+                NumPy array
 
         Returns:
             str: Predicted letter or None (in case of failed prediction)
@@ -73,25 +150,259 @@ class SignLanguageModel:
             logger.warning(f"Invalid feature vector length: {len(features)}")
             return None
 
+        return self.predict_batch([features])[0]
+
+    def predict_batch(self, features_batch):
+        """Predicts letters for several feature vectors with one model call.
+
+        Args:
+            features_batch: Sequence of 42-value feature vectors or an
+                (N, 42) NumPy array
+
+        Returns:
+            list: Predicted letter (or None) for every row
+        """
+        if not (self.anytime_block_size and self.compiled_forest is not None):
+            letters, _ = self.predict_batch_with_confidence(features_batch)
+            return letters
+
+        # Without a confidence to report, the vote can stop once it is settled
+        if len(features_batch) == 0:
+            return []
         try:
-            prediction = self.model.predict([np.asarray(features)])
-            predicted_class = int(prediction[0])
-            return self.labels_dict.get(predicted_class)
+            batch = np.asarray(features_batch, dtype=np.float32)
+            if batch.ndim != 2 or batch.shape[1] != 42:
+                logger.warning(f"Invalid feature batch shape: {batch.shape}")
+                return [None] * len(features_batch)
+
+            labels, trees_used = self.compiled_forest.predict_anytime(
+                batch, self.anytime_block_size, self.anytime_confidence
+            )
+            self._count_anytime(trees_used)
+            return [self.labels_dict.get(int(label)) for label in labels]
         except Exception as e:
             logger.error(f"Prediction error: {e}")
+            return [None] * len(features_batch)
+
+    def predict_anytime(self, features, block_size=None, confidence=None):
+        """Makes a letter prediction that stops once the forest vote is settled.
+
+        Args:
+            features: 42-value feature vector
+            block_size: Trees per block (model setting or 10 if None)
+            confidence: Early stop confidence (model setting if None)
+
+        Returns:
+            tuple: (predicted letter or None, number of trees evaluated)
+        """
+        if len(features) != 42:
+            logger.warning(f"Invalid feature vector length: {len(features)}")
+            return None, 0
+
+        if self.compiled_forest is None:
+            # The sklearn backend always evaluates the whole forest
+            return self.predict(features), len(getattr(self.model, "estimators_", []))
+
+        try:
+            labels, trees_used = self.compiled_forest.predict_anytime(
+                np.asarray(features, dtype=np.float32).reshape(1, -1),
+                block_size or self.anytime_block_size or 10,
+                confidence if confidence is not None else self.anytime_confidence,
+            )
+            self._count_anytime(trees_used)
+            return self.labels_dict.get(int(labels[0])), trees_used
+        except Exception as e:
+            logger.error(f"Prediction error: {e}")
+            return None, 0
+
+    def _predict_proba(self, batch):
+        """Runs the selected backend on a float32 (N, 42) batch.
+
+        Always evaluates the whole forest: the probabilities of an early
+        exit are vote shares of the trees evaluated so far and overstate the
+        confidence.
+
+        Returns:
+            tuple: ((N, n_classes) class probabilities, class labels)
+        """
+        if self.compiled_forest is None:
+            return self.model.predict_proba(batch), self.model.classes_
+        return self.compiled_forest.predict_proba(batch), self.compiled_forest.classes
+
+    def warm_up(self):
+        """Runs one prediction so lazy initialization happens before real frames."""
+        self._predict_proba(np.zeros((1, 42), dtype=np.float32))
+        self.anytime_predictions = 0
+        self.anytime_trees_used = 0
+
+    def _count_anytime(self, trees_used):
+        self.anytime_predictions += 1
+        self.anytime_trees_used += trees_used
+
+    def get_cache_stats(self):
+        """Returns prediction cache statistics (None if the cache is disabled)."""
+        if self.prediction_cache is None:
             return None
+        return self.prediction_cache.get_stats()
+
+    def get_anytime_stats(self):
+        """Returns anytime prediction statistics.
+
+        Returns:
+            dict: Prediction count and average share of the forest evaluated
+        """
+        n_trees = self.compiled_forest.n_trees if self.compiled_forest else 0
+        average = (
+            self.anytime_trees_used / self.anytime_predictions
+            if self.anytime_predictions
+            else 0.0
+        )
+        return {
+            "predictions": self.anytime_predictions,
+            "avg_trees_used": average,
+            "forest_fraction": average / n_trees if n_trees else 0.0,
+        }
 
     def predict_with_confidence(self, features):
         """Returns prediction and confidence value.
 
-        Note: Current model may not provide confidence value, in which case only prediction is returned.
+        The confidence is the share of the forest vote won by the predicted
+        class.
+
+        Args:
+            features: 42-value feature vector
 
         Returns:
             tuple: (predicted letter, confidence value)
         """
-        letter = self.predict(features)
-        confidence = 1.0  # Default confidence (if real model doesn't support it)
+        letters, confidences = self.predict_batch_with_confidence([features])
+        return letters[0], confidences[0]
+
+    def predict_batch_with_confidence(self, features_batch):
+        """Predicts letters and their confidences with one model call.
+
+        Args:
+            features_batch: Sequence of 42-value feature vectors or an
+                (N, 42) NumPy array
+
+        Returns:
+            tuple: (list of letters or None, list of confidence values)
+        """
+        if len(features_batch) == 0:
+            return [], []
+
+        failed = [None] * len(features_batch), [0.0] * len(features_batch)
+        try:
+            # The forest works in float32 internally, so this is lossless
+            batch = np.asarray(features_batch, dtype=np.float32)
+            if batch.ndim != 2 or batch.shape[1] != 42:
+                logger.warning(f"Invalid feature batch shape: {batch.shape}")
+                return failed
+
+            results = [None] * len(batch)
+            if self.prediction_cache is not None:
+                keys = [self.prediction_cache.make_key(row) for row in batch]
+                results = [self.prediction_cache.get(key) for key in keys]
+
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                proba, classes = self._predict_proba(batch[missing])
+                best = np.argmax(proba, axis=1)
+                for i, class_index, row in zip(missing, best, proba):
+                    results[i] = (
+                        self.labels_dict.get(int(classes[class_index])),
+                        float(row[class_index]),
+                    )
+                    if self.prediction_cache is not None:
+                        self.prediction_cache.put(keys[i], results[i])
+
+            letters, confidences = zip(*results)
+            return list(letters), list(confidences)
+        except Exception as e:
+            logger.error(f"Prediction error: {e}")
+            return failed
+
+    @staticmethod
+    def landmarks_to_features(landmarks_batch):
+        """Builds feature vectors from a batch of landmark sets.
+
+        Same features as ``HandDetector.landmarks_to_features``: the x and y
+        coordinates of every set are shifted so that their minimum is zero.
+
+        Args:
+            landmarks_batch: (N, 21, 2) or (N, 21, 3) landmark array
+
+        Returns:
+            np.ndarray: (N, 42) float32 feature vectors
+
+        Raises:
+            ValueError: If the batch does not hold 21-point landmark sets
+        """
+        points = np.asarray(landmarks_batch, dtype=np.float32)
+        if points.ndim != 3 or points.shape[1] != 21 or points.shape[2] < 2:
+            raise ValueError(f"Invalid landmark batch shape: {points.shape}")
+
+        xy = points[:, :, :2]
+        return (xy - xy.min(axis=1, keepdims=True)).reshape(len(points), 42)
+
+    def predict_landmarks(self, landmarks):
+        """Predicts the letter of one precomputed 21-point landmark set.
+
+        Args:
+            landmarks: (21, 2) or (21, 3) normalized landmark coordinates
+
+        Returns:
+            tuple: (predicted letter or None, confidence value)
+        """
+        letters, confidences = self.predict_landmarks_batch([landmarks])
+        return letters[0], confidences[0]
+
+    def predict_landmarks_batch(self, landmarks_batch):
+        """Predicts letters for several landmark sets with one model call.
+
+        Lets clients that run hand tracking themselves skip image decoding
+        and hand detection.
+
+        Args:
+            landmarks_batch: (N, 21, 2) or (N, 21, 3) landmark array or a
+                sequence of landmark sets
+
+        Returns:
+            tuple: (list of letters or None, list of confidence values)
+        """
+        if len(landmarks_batch) == 0:
+            return [], []
+
+        try:
+            features_batch = self.landmarks_to_features(landmarks_batch)
+        except ValueError as e:
+            logger.warning(str(e))
+            return [None] * len(landmarks_batch), [0.0] * len(landmarks_batch)
+        return self.predict_batch_with_confidence(features_batch)
+
+    def predict_top_k(self, features, k=3):
+        """Returns the k most probable letters.
+
+        Args:
+            features: 42-value feature vector
+            k: Number of results
 
-        # Confidence calculation for future models can be added here
+        Returns:
+            list: (letter, probability) tuples, most probable first
+        """
+        if len(features) != 42:
+            logger.warning(f"Invalid feature vector length: {len(features)}")
+            return []
 
-        return letter, confidence
+        try:
+            proba, classes = self._predict_proba(
+                np.asarray(features, dtype=np.float32).reshape(1, -1)
+            )
+            order = np.argsort(-proba[0], kind="stable")[:k]
+            return [
+                (self.labels_dict.get(int(classes[i])), float(proba[0, i]))
+                for i in order
+            ]
+        except Exception as e:
+            logger.error(f"Prediction error: {e}")
+            return []
@@ -3,66 +3,222 @@ Sign Language Service
 Coordinates sign language detection and translation operations.
 """
 
-import json
 import logging
 import os
 import time
-from collections import deque
 
-import cv2
 import numpy as np
 
+from src.config import Config
 from src.exceptions import SignLanguageError
+from src.frame_pipeline import BACKPRESSURE_DROP_OLDEST, FramePipeline, PipelineStage
+from src.gesture_matcher import GestureMatcher
 
 # Import our project modules
 from src.hand_detector import HandDetector
-from src.sign_language_model import SignLanguageModel
+from src.hand_tracker import HandTracker
+from src.lazy_import import lazy_import
+from src.model_artifact import is_artifact
+from src.motion_gate import MotionGate
+from src.sign_language_model import BACKEND_SKLEARN, SignLanguageModel
+from src.stability_tracker import StabilityTracker
+
+cv2 = lazy_import("cv2")
 
 logger = logging.getLogger(__name__)
 
+# Service arguments that configure the letter model (see ``load_model``)
+MODEL_OPTIONS = (
+    "model_path",
+    "model_backend",
+    "anytime_block_size",
+    "anytime_confidence",
+    "prediction_cache_size",
+    "prediction_cache_grid",
+)
+
 
 class SignLanguageService:
     """Main service class for sign language operations."""
 
-    def __init__(self, model_path=None, gesture_map_path=None):
+    # Same letter must be detected for 20 frames
+    REQUIRED_STABLE_FRAMES = 20
+
+    def __init__(
+        self,
+        model_path=None,
+        gesture_map_path=None,
+        inference_size=None,
+        roi_tracking=False,
+        motion_threshold=None,
+        detection_interval=1,
+        model_backend=BACKEND_SKLEARN,
+        anytime_block_size=None,
+        anytime_confidence=None,
+        min_stable_frames=5,
+        prediction_cache_size=None,
+        prediction_cache_grid=0.005,
+        temporal_epsilon=None,
+        stability_window_seconds=None,
+        model=None,
+    ):
         """Initialize service components.
 
         Args:
             model_path: Sign language model file path (uses default path if None)
             gesture_map_path: Gesture map file path (uses default path if None)
+            inference_size: Optional (width, height) used for hand detection;
+                overlays are still drawn on the full-size frame
+            roi_tracking: Search for hands around the previous hand boxes
+                instead of the whole frame
+            motion_threshold: Mean gray level difference below which the
+                previous detection and prediction are reused (disabled if None)
+            detection_interval: Run MediaPipe every Nth frame and propagate
+                landmarks with optical flow in between
+            model_backend: "sklearn" or "compiled" letter prediction backend
+            anytime_block_size: Evaluate the compiled forest in blocks of this
+                many trees and stop once the vote is settled (disabled if
+                None); only used for letters without a confidence, so frame
+                ratings always use the whole forest
+            anytime_confidence: Optional leading class probability at which
+                the anytime evaluation stops early
+            min_stable_frames: Number of frames after which a letter predicted
+                with full confidence is committed
+            prediction_cache_size: Size of the model's LRU prediction cache
+                (disabled if None)
+            prediction_cache_grid: Quantization step of the cache keys
+            temporal_epsilon: Largest landmark movement (normalized
+                coordinates) since a hand was last classified for which its
+                previous prediction is reused (disabled if None)
+            stability_window_seconds: Length of the time-based stability
+                window; keeps stability independent of the frame rate
+                (window of the last 30 frames if None)
+            model: Loaded model shared with other services, e.g. an
+                InferenceBatcher (loaded with ``load_model`` if None)
         """
-        self.hand_detector = HandDetector()
-        self.model_path = model_path or "./sign_language_model/EnglishHandSignModel.p"
-        self.english_model = self._initialize_model()
+        self.hand_detector = HandDetector(
+            inference_size=inference_size,
+            roi_tracking=roi_tracking,
+            detection_interval=detection_interval,
+        )
+        self.model_path = model_path or self._default_model_path()
+        self.model_backend = model_backend
+        self.anytime_block_size = anytime_block_size
+        self.anytime_confidence = anytime_confidence
+        self.prediction_cache_size = prediction_cache_size
+        self.prediction_cache_grid = prediction_cache_grid
+        self.english_model = model if model is not None else self._initialize_model()
+
+        # Reuse of per-hand predictions while the hand holds still
+        self.temporal_epsilon = temporal_epsilon
+        self.temporal_hits = 0
+        self.temporal_misses = 0
+
+        # Reuse of results on static scenes
+        self.motion_gate = (
+            MotionGate(threshold=motion_threshold)
+            if motion_threshold is not None
+            else None
+        )
+        self._cached_hands = None
 
         # Load gesture map
         self.gesture_map_path = gesture_map_path or "./data/gesture_map.json"
-        self.gesture_map = self._load_gesture_map()
+        self.gesture_matcher = self._load_gesture_map()
+
+        # Every tracked hand keeps its own prediction history; the letters of
+        # the active hand are the ones being committed
+        self.stability_window_seconds = stability_window_seconds
+        self.hand_tracker = HandTracker(
+            history_size=30,  # Last 30 predictions
+            history_seconds=stability_window_seconds,
+        )
+        self.active_track_id = None
+        self._default_stability = StabilityTracker(
+            max_frames=30 if stability_window_seconds is None else None,
+            window_seconds=stability_window_seconds,
+        )
+        self.last_confidence = None  # Confidence of the active hand's letter
 
         # Variables for stability
-        self.last_predictions = deque(maxlen=30)  # Store last 30 predictions
-        self.required_stable_frames = 20  # Same letter must be detected for 20 frames
+        self.required_stable_frames = self.REQUIRED_STABLE_FRAMES
         self.stable_threshold = 0.8  # 80% of frames must detect the same letter
         self.min_confidence = 0.7  # Minimum confidence threshold
+        self.min_stable_frames = min_stable_frames  # Frames at full confidence
 
         logger.info("Sign language service initialized")
 
+    @staticmethod
+    def options_from_config():
+        """Reads the service arguments from the configuration.
+
+        Returns:
+            dict: Keyword arguments for SignLanguageService
+        """
+        config = Config()
+        size = config.get("kamera.cikarim_cozunurlugu")
+        return dict(
+            inference_size=(size["genislik"], size["yukseklik"]) if size else None,
+            roi_tracking=config.get("performans.roi_takibi", False),
+            motion_threshold=config.get("performans.hareket_esigi"),
+            detection_interval=config.get("performans.algilama_araligi", 1),
+            model_backend=config.get("model.arka_uc", "sklearn"),
+            min_stable_frames=config.get("model.kare_stabilite_esigi", 5),
+            prediction_cache_size=config.get("performans.tahmin_onbellegi.boyut"),
+            prediction_cache_grid=config.get(
+                "performans.tahmin_onbellegi.izgara", 0.005
+            ),
+            temporal_epsilon=config.get("performans.zamansal_esik"),
+            stability_window_seconds=config.get("model.stabilite_penceresi_sn"),
+            anytime_block_size=config.get("model.erken_cikis.blok_boyutu"),
+            anytime_confidence=config.get("model.erken_cikis.guven_esigi"),
+        )
+
+    @property
+    def stability(self):
+        """Stability tracker of the active hand."""
+        track = self.hand_tracker.get_track(self.active_track_id)
+        if track is None:
+            return self._default_stability
+        return track.stability
+
+    @property
+    def last_predictions(self):
+        """Letters in the prediction history of the active hand."""
+        return list(self.stability)
+
+    @staticmethod
+    def _default_model_path():
+        """Returns the default model, preferring the converted artifact."""
+        artifact_path = "./sign_language_model/EnglishHandSignModel.model"
+        if is_artifact(artifact_path):
+            return artifact_path
+        return "./sign_language_model/EnglishHandSignModel.p"
+
+    @property
+    def gesture_map(self):
+        """Gesture map as a dict (rebuilt from the compiled matcher)."""
+        return self.gesture_matcher.to_dict()
+
     def _load_gesture_map(self):
-        """Loads the gesture map."""
+        """Loads the gesture map and compiles it for matching.
+
+        A binary cache next to the JSON file lets restarts skip JSON parsing.
+        """
         try:
             if not os.path.exists(self.gesture_map_path):
                 # Default map
-                return {
+                default_map = {
                     "A": {"landmarks": [(0.4, 0.6), (0.5, 0.7)], "confidence": 0.9},
                     "B": {"landmarks": [(0.3, 0.5), (0.4, 0.6)], "confidence": 0.85},
                     # ... other letters
                 }
+                return GestureMatcher(default_map)
 
-            with open(self.gesture_map_path, "r") as f:
-                return json.load(f)
+            return GestureMatcher.load(self.gesture_map_path)
         except Exception as e:
             logger.error(f"Could not load gesture map: {e}")
-            return {}
+            return GestureMatcher({})
 
     def process_hand_data(self, hand_data):
         """Processes hand data and determines the most suitable sign.
@@ -88,128 +244,405 @@ class SignLanguageService:
                 return None, 0.0
 
             # Find closest sign
-            best_match = None
-            best_distance = float("inf")
-            best_confidence = 0.0
-
-            for gesture, data in self.gesture_map.items():
-                distance = self._calculate_distance(hand_data, data["landmarks"])
-                if distance < best_distance:
-                    best_distance = distance
-                    best_match = gesture
-                    best_confidence = data["confidence"]
-
+            best_match, best_confidence, _ = self.gesture_matcher.match(hand_data)
             return best_match, best_confidence
 
         except Exception as e:
             logger.error(f"Hand data processing error: {str(e)}")
             raise SignLanguageError(f"Hand data could not be processed: {str(e)}")
 
-    def _calculate_distance(self, points1, points2):
-        """Calculates Euclidean distance between two point sets.
+    @staticmethod
+    def load_model(
+        model_path=None,
+        model_backend=BACKEND_SKLEARN,
+        anytime_block_size=None,
+        anytime_confidence=None,
+        prediction_cache_size=None,
+        prediction_cache_grid=0.005,
+    ):
+        """Loads the letter model with the service's model options.
 
-        Args:
-            points1: First point set
-            points2: Second point set
+        Lets several services share one model (see the ``model`` argument).
+        The arguments are the model options of ``SignLanguageService``.
 
         Returns:
-            float: Calculated distance
+            SignLanguageModel: Loaded model
         """
-        if len(points1) != len(points2):
-            return float("inf")
-
-        total_distance = 0
-        for p1, p2 in zip(points1, points2):
-            # Get positions of both points
-            pos1 = np.array([p1["x"], p1["y"]] if isinstance(p1, dict) else p1)
-            pos2 = np.array([p2["x"], p2["y"]] if isinstance(p2, dict) else p2)
-
-            # Calculate Euclidean distance
-            distance = np.linalg.norm(pos1 - pos2)
-            total_distance += distance
-
-        return total_distance / len(points1)
+        return SignLanguageModel(
+            model_path or SignLanguageService._default_model_path(),
+            backend=model_backend,
+            anytime_block_size=anytime_block_size,
+            anytime_confidence=anytime_confidence,
+            cache_size=prediction_cache_size,
+            cache_grid=prediction_cache_grid,
+        )
 
     def _initialize_model(self):
         """Loads the English ASL model."""
         try:
-            return SignLanguageModel(self.model_path)
+            return self.load_model(
+                self.model_path,
+                self.model_backend,
+                self.anytime_block_size,
+                self.anytime_confidence,
+                self.prediction_cache_size,
+                self.prediction_cache_grid,
+            )
         except Exception as e:
             logger.error(f"Could not load model: {e}")
             raise
 
-    def process_frame(self, frame):
+    def warm_up(self, frame_size=(640, 480)):
+        """Runs the detector and the model once on a dummy frame.
+
+        MediaPipe builds its graph and the model its lazy state on first use;
+        doing that here keeps the first camera frame from stalling.
+
+        Args:
+            frame_size: (width, height) of the dummy frame
+        """
+        width, height = frame_size
+        self.hand_detector.detect_hands(np.zeros((height, width, 3), dtype=np.uint8))
+        self.hand_detector.reset_tracking()
+        self.english_model.warm_up()
+
+    def process_frame(self, frame, timestamp=None):
         """Processes frame to detect hands and predict letters.
 
+        Runs the detect, classify and render stages one after another; see
+        ``build_pipeline`` for running them concurrently.
+
         Args:
             frame: Frame to process
+            timestamp: Frame time in seconds for the stability windows of
+                the inactive hands (default: now; must use the same clock
+                as ``update_prediction``)
 
         Returns:
             tuple: (processed frame, detected letter, stability value)
         """
-        H, W, _ = frame.shape
-        results = self.hand_detector.detect_hands(frame)
-        letter = ""
-        stability_info = None
+        hands = self._reusable_hands(frame)
+        if hands is None:
+            hands = self.classify(self.detect(frame))
+        return self.render(frame, hands, timestamp)
+
+    def _reusable_hands(self, frame):
+        """Returns the previous hands if the scene has not changed.
+
+        Args:
+            frame: Frame to check
+
+        Returns:
+            list: Cached ``classify`` output or None if detection must run
+        """
+        if self.motion_gate is None:
+            return None
+
+        if self.motion_gate.should_reuse(frame) and self._cached_hands is not None:
+            return self._cached_hands
+        return None
+
+    def detect(self, frame):
+        """Detect stage: runs hand detection on the frame.
+
+        Args:
+            frame: Frame to process (BGR)
+
+        Returns:
+            MediaPipe detection results
+        """
+        return self.hand_detector.detect_hands(frame)
+
+    def classify(self, results):
+        """Classify stage: extracts features and predicts a letter per hand.
+
+        Hands are matched to their tracks from the previous frames. A hand
+        that has barely moved since its last classification keeps its
+        prediction; all other hands are classified with a single model call.
+
+        Args:
+            results: Detection results returned by ``detect``
+
+        Returns:
+            list: One dict per hand with the landmarks, the (21, 3) landmark
+            array, the letter, its confidence and the hand track
+        """
+        hands = []
 
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
-                # Visualize hand
-                self.hand_detector.visualize_hands(frame, hand_landmarks)
-
-                # Extract landmark features
-                data_aux, x_, y_ = self.hand_detector.extract_landmarks(hand_landmarks)
-
-                # Determine color based on stability
-                color, stability = self._get_stability_color()
-                stability_info = stability * 100 if stability is not None else None
-
-                # Draw rectangle around hand
-                x1, y1, x2, y2 = self.hand_detector.draw_bounding_box(
-                    frame,
-                    x_,
-                    y_,
-                    color,
-                    (
-                        f"Stability: {int(stability_info)}%"
-                        if stability_info is not None
-                        else None
-                    ),
-                )
+                points = self.hand_detector.extract_landmark_array(hand_landmarks)
+                hands.append({"landmarks": hand_landmarks, "points": points})
+
+        handedness = getattr(results, "multi_handedness", None) or []
+        labels = [hand.classification[0].label for hand in handedness]
+        return self._classify_hands(hands, labels)
+
+    def _classify_hands(self, hands, labels):
+        """Tracks the hands and predicts their letters with one model call.
 
-                # Make letter prediction
-                if len(data_aux) == 42:
-                    letter = self.english_model.predict(data_aux)
-
-                    # Write letter on screen
-                    if letter:
-                        cv2.putText(
-                            frame,
-                            letter,
-                            (x1, y1 - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX,
-                            1.3,
-                            color,
-                            2,
-                            cv2.LINE_AA,
-                        )
+        Args:
+            hands: Hand dicts with a ``points`` landmark array
+            labels: Handedness label per hand (may be shorter than ``hands``)
+
+        Returns:
+            list: The hand dicts with their letter, confidence and track
+        """
+        self._assign_tracks(hands, labels)
+
+        pending = [hand for hand in hands if not self._reuse_track_prediction(hand)]
+        if pending:
+            # Extract landmark features and make letter predictions
+            features_batch = np.stack(
+                [
+                    self.hand_detector.landmarks_to_features(hand["points"])
+                    for hand in pending
+                ]
+            )
+            letters, confidences = self.english_model.predict_batch_with_confidence(
+                features_batch
+            )
+            for hand, letter, confidence in zip(pending, letters, confidences):
+                hand["letter"] = letter
+                hand["confidence"] = confidence
+
+                track = hand["track"]
+                track.classified_points = hand["points"]
+                track.letter, track.confidence = letter, confidence
+
+        self._cached_hands = hands
+        return hands
+
+    def _reuse_track_prediction(self, hand):
+        """Copies the previous prediction of a hand that has not moved.
+
+        Args:
+            hand: Hand dict with its track assigned
+
+        Returns:
+            bool: True if the previous prediction was reused
+        """
+        if self.temporal_epsilon is None:
+            return False
+
+        track = hand["track"]
+        if track.classified_points is None:
+            return False
+
+        movement = np.abs(hand["points"][:, :2] - track.classified_points[:, :2]).max()
+        if movement >= self.temporal_epsilon:
+            self.temporal_misses += 1
+            return False
+
+        hand["letter"], hand["confidence"] = track.letter, track.confidence
+        self.temporal_hits += 1
+        return True
+
+    def _assign_tracks(self, hands, labels):
+        """Matches the hands to their tracks and picks the active hand.
+
+        The active hand stays the same as long as its track is alive; when
+        it is lost, the first detected hand becomes active.
+
+        Args:
+            hands: Hand list built by ``classify``
+            labels: Handedness labels (missing labels count as None)
+        """
+        labels = [labels[i] if i < len(labels) else None for i in range(len(hands))]
+        boxes = [
+            (
+                float(hand["points"][:, 0].min()),
+                float(hand["points"][:, 1].min()),
+                float(hand["points"][:, 0].max()),
+                float(hand["points"][:, 1].max()),
+            )
+            for hand in hands
+        ]
+
+        tracks = self.hand_tracker.update(boxes, labels)
+        for hand, track in zip(hands, tracks):
+            hand["track"] = track
+
+        if tracks and self.hand_tracker.get_track(self.active_track_id) is None:
+            self.active_track_id = tracks[0].track_id
+            logger.debug(f"Active hand track: {self.active_track_id}")
+
+    def render(self, frame, hands, timestamp=None):
+        """Render stage: draws landmarks, boxes and letters on the frame.
+
+        Args:
+            frame: Frame to draw on (modified in place)
+            hands: Hand list returned by ``classify``
+            timestamp: Frame time in seconds (see ``process_frame``)
+
+        Returns:
+            tuple: (processed frame, letter of the active hand, stability value)
+        """
+        letter = ""
+        stability_info = None
+        self.last_confidence = None
+
+        for hand in hands:
+            # Visualize hand
+            self.hand_detector.visualize_hands(frame, hand["landmarks"])
+
+            is_active, color, hand_stability = self._rate_hand(hand, timestamp)
+
+            # Draw rectangle around hand
+            x1, y1, x2, y2 = self.hand_detector.draw_bounding_box(
+                frame,
+                hand["points"][:, 0],
+                hand["points"][:, 1],
+                color,
+                (
+                    f"Stability: {int(hand_stability)}%"
+                    if hand_stability is not None
+                    else None
+                ),
+            )
+
+            if is_active:
+                letter = hand.get("letter", letter)
+                stability_info = hand_stability
+                self.last_confidence = hand.get("confidence")
+
+            if "letter" in hand:
+                # Write letter on screen
+                if hand["letter"]:
+                    cv2.putText(
+                        frame,
+                        hand["letter"],
+                        (x1, y1 - 10),
+                        cv2.FONT_HERSHEY_SIMPLEX,
+                        1.3,
+                        color,
+                        2,
+                        cv2.LINE_AA,
+                    )
 
         return frame, letter, stability_info
 
-    def _get_stability_color(self):
+    def _rate_hand(self, hand, timestamp=None):
+        """Records the prediction of an inactive hand and rates its stability.
+
+        The active hand is recorded by ``update_prediction``.
+
+        Args:
+            hand: Hand dict returned by ``classify``
+            timestamp: Frame time in seconds (default: now)
+
+        Returns:
+            tuple: (is active hand, BGR color, stability in percent or None)
+        """
+        track = hand.get("track")
+        is_active = track is None or track.track_id == self.active_track_id
+
+        if not is_active and hand.get("letter"):
+            track.stability.add(
+                hand["letter"], self._frame_weight(hand.get("confidence")), timestamp
+            )
+
+        color, stability = self._get_stability_color(
+            track.stability if track is not None else None
+        )
+        return is_active, color, stability * 100 if stability is not None else None
+
+    def process_landmarks(self, landmark_sets, handedness=None, timestamp=None):
+        """Rates precomputed hand landmarks instead of a frame.
+
+        For clients that run hand tracking themselves: image decoding and
+        hand detection are skipped, while hand tracking, the stability
+        window and the prediction reuse work as for frames. All hands are
+        classified with one model call.
+
+        Args:
+            landmark_sets: Hands of one frame; (H, 21, 2|3) array-like or a
+                single (21, 2|3) set
+            handedness: Optional "Left"/"Right" label per hand
+            timestamp: Frame time in seconds (see ``process_frame``)
+
+        Returns:
+            tuple: (letter of the active hand, stability value)
+        """
+        points_batch = np.asarray(landmark_sets, dtype=np.float32)
+        if points_batch.ndim == 2:
+            points_batch = points_batch[np.newaxis]
+
+        hands = [{"landmarks": None, "points": points} for points in points_batch]
+        hands = self._classify_hands(hands, handedness or [])
+
+        letter = ""
+        stability_info = None
+        self.last_confidence = None
+        for hand in hands:
+            is_active, _, hand_stability = self._rate_hand(hand, timestamp)
+            if is_active:
+                letter = hand.get("letter", letter)
+                stability_info = hand_stability
+                self.last_confidence = hand.get("confidence")
+        return letter, stability_info
+
+    def build_pipeline(
+        self, sink=None, queue_size=2, backpressure=BACKPRESSURE_DROP_OLDEST
+    ):
+        """Builds a pipeline running the detect, classify and render stages
+        on separate worker threads.
+
+        Items flowing through the pipeline are dicts; submit ``{"frame": frame}``
+        and the sink receives the same dict with an ``"output"`` entry holding
+        the ``process_frame`` style tuple.
+
+        Args:
+            sink: Callable receiving each finished item
+            queue_size: Capacity of every stage queue
+            backpressure: "block" or "drop_oldest"
+
+        Returns:
+            FramePipeline: Pipeline (not started)
+        """
+
+        def detect_stage(item):
+            hands = self._reusable_hands(item["frame"])
+            if hands is not None:
+                item["hands"] = hands
+            else:
+                item["results"] = self.detect(item["frame"])
+            return item
+
+        def classify_stage(item):
+            if "hands" not in item:
+                item["hands"] = self.classify(item.pop("results"))
+            return item
+
+        def render_stage(item):
+            item["output"] = self.render(item["frame"], item.pop("hands"))
+            return item
+
+        stages = [
+            PipelineStage(name, func, queue_size, backpressure)
+            for name, func in (
+                ("detect", detect_stage),
+                ("classify", classify_stage),
+                ("render", render_stage),
+            )
+        ]
+        return FramePipeline(stages, sink)
+
+    def _get_stability_color(self, tracker=None):
         """Returns color and stability value based on stability status.
 
+        Args:
+            tracker: Stability tracker to rate (active hand if None)
+
         Returns:
             tuple: (color, stability value) - color in BGR format
         """
-        if not self.last_predictions:
-            return (0, 0, 255), None  # Red (initial color)
-
-        from collections import Counter
+        if tracker is None:
+            tracker = self.stability
 
-        letter_counts = Counter(self.last_predictions)
-        most_common_letter, count = letter_counts.most_common(1)[0]
-        stability = count / len(self.last_predictions)
+        stability = tracker.get_stability()
+        if stability is None:
+            return (0, 0, 255), None  # Red (initial color)
 
         # 0.0-0.3: Red, 0.3-0.6: Yellow, 0.6-1.0: Green
         if stability < 0.3:
@@ -219,25 +652,53 @@ class SignLanguageService:
         else:
             return (0, 255, 0), stability  # Green
 
-    def update_prediction(self, letter):
+    def _frame_weight(self, confidence):
+        """Returns how many frames one prediction counts as.
+
+        A letter predicted at ``min_confidence`` counts as one frame, so it
+        needs ``required_stable_frames`` frames as before. The weight grows
+        linearly up to full confidence, where ``min_stable_frames`` frames
+        are enough. Predictions below ``min_confidence`` count less than a
+        frame.
+
+        Args:
+            confidence: Prediction confidence (None counts as one frame)
+
+        Returns:
+            float: Frame weight
+        """
+        if confidence is None:
+            return 1.0
+        if confidence < self.min_confidence:
+            return confidence / self.min_confidence
+
+        max_weight = self.required_stable_frames / self.min_stable_frames
+        share = (confidence - self.min_confidence) / (1.0 - self.min_confidence)
+        return 1.0 + share * (max_weight - 1.0)
+
+    def update_prediction(self, letter, confidence=None, timestamp=None):
         """Adds a new letter prediction and calculates stability.
 
+        Every frame is weighted by the prediction confidence, so confidently
+        held letters become stable in fewer frames.
+
         Args:
             letter: Detected letter
+            confidence: Prediction confidence (counts as one frame if None)
+            timestamp: Frame time in seconds for the time-based stability
+                window (default: now; pass video time for recorded files)
 
         Returns:
-            tuple: (most detected letter, stability value, count, is stable)
+            tuple: (most detected letter, stability value, weighted count,
+            is stable)
         """
         if letter:
-            self.last_predictions.append(letter)
+            tracker = self.stability
+            tracker.add(letter, self._frame_weight(confidence), timestamp)
 
-            if len(self.last_predictions) > 0:
-                from collections import Counter
-
-                letter_counts = Counter(self.last_predictions)
-                most_common_letter, count = letter_counts.most_common(1)[0]
-
-                stability = count / len(self.last_predictions)
+            most_common_letter, count, total = tracker.vote()
+            if total > 0:
+                stability = count / total
                 is_stable = (
                     stability >= self.stable_threshold
                     and count >= self.required_stable_frames
@@ -249,7 +710,7 @@ class SignLanguageService:
 
     def clear_predictions(self):
         """Clears the prediction history."""
-        self.last_predictions.clear()
+        self.stability.clear()
         logger.debug("Prediction history cleared")
 
     def get_detection_stats(self):
@@ -259,29 +720,44 @@ class SignLanguageService:
             dict: Detection statistics
         """
         stats = {
-            "total_predictions": len(self.last_predictions),
+            "total_predictions": len(self.stability),
+            "tracked_hands": len(self.hand_tracker.tracks),
             "stable_threshold": self.stable_threshold,
             "required_stable_frames": self.required_stable_frames,
         }
 
-        if self.last_predictions:
-            from collections import Counter
-
-            letter_counts = Counter(self.last_predictions)
-            most_common_letter, count = letter_counts.most_common(1)[0]
-
+        most_common_letter, count, total = self.stability.vote()
+        if total > 0:
             stats.update(
                 {
                     "most_common_letter": most_common_letter,
                     "most_common_count": count,
-                    "stability": count / len(self.last_predictions),
+                    "stability": count / total,
                 }
             )
 
+        if self.motion_gate is not None:
+            stats["motion_gate"] = self.motion_gate.get_stats()
+
+        if self.anytime_block_size:
+            stats["anytime"] = self.english_model.get_anytime_stats()
+
+        if self.prediction_cache_size:
+            stats["prediction_cache"] = self.english_model.get_cache_stats()
+
+        if self.temporal_epsilon is not None:
+            stats["temporal_reuse"] = {
+                "hits": self.temporal_hits,
+                "misses": self.temporal_misses,
+            }
+
         return stats
 
     def release_resources(self):
         """Releases all resources."""
         if hasattr(self, "hand_detector"):
             self.hand_detector.release()
-        self.last_predictions.clear()
+        self.clear_predictions()
+        self.hand_tracker.reset()
+        self.active_track_id = None
+        self._cached_hands = None
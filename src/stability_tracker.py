@@ -0,0 +1,169 @@
+"""
+Stability Tracker
+Sliding window of letter predictions with incrementally updated vote counts.
+"""
+
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class StabilityTracker:
+    """Weighted letter vote over a sliding window of frames.
+
+    Per-letter scores are updated as frames enter and leave the window and
+    the leading letter is kept up to date, so adding a frame and reading the
+    vote cost constant time instead of a recount of the whole window. Only
+    when the leading letter loses weight is it searched again, among the
+    distinct letters in the window (at most the size of the alphabet).
+
+    The window holds either the last ``max_frames`` frames or, with
+    ``window_seconds``, the frames of the last seconds. In the time-based
+    window every frame also counts for its duration: a frame weight of 1
+    at ``reference_fps`` becomes 2 at half that rate, so the scores and the
+    stability are the same at 15 fps and 60 fps.
+    """
+
+    def __init__(
+        self, max_frames=30, window_seconds=None, reference_fps=30, clock=None
+    ):
+        """Initializes the tracker.
+
+        Args:
+            max_frames: Maximum number of frames in the window (unbounded if
+                None; requires ``window_seconds``)
+            window_seconds: Length of the time-based window (frame-count
+                window if None)
+            reference_fps: Frame rate at which a frame counts as one frame
+                in the time-based window
+            clock: Monotonic clock function (default: time.monotonic)
+        """
+        if max_frames is None and window_seconds is None:
+            raise ValueError("Either max_frames or window_seconds must be set")
+        if max_frames is not None and max_frames < 1:
+            raise ValueError(f"Invalid window size: {max_frames}")
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError(f"Invalid window length: {window_seconds}")
+        if reference_fps <= 0:
+            raise ValueError(f"Invalid reference fps: {reference_fps}")
+
+        self.max_frames = max_frames
+        self.window_seconds = window_seconds
+        self.reference_fps = reference_fps
+        self._clock = clock or time.monotonic
+
+        self._entries = deque()  # (letter, weight, timestamp)
+        self._scores = {}  # Letter -> summed weight
+        self._frames = {}  # Letter -> number of frames in the window
+        self._total = 0.0
+        self._leader = None
+        self._leader_stale = False
+        self._last_timestamp = None
+
+    def add(self, letter, weight=1.0, timestamp=None):
+        """Adds the prediction of one frame and slides the window.
+
+        Args:
+            letter: Predicted letter
+            weight: Frame weight (e.g. from the prediction confidence)
+            timestamp: Frame time in clock seconds (default: now)
+        """
+        now = self._clock() if timestamp is None else timestamp
+
+        if self.window_seconds is not None:
+            # Weight the frame by its duration, capped at the window length
+            if self._last_timestamp is None:
+                duration = 1.0 / self.reference_fps
+            else:
+                duration = min(
+                    max(now - self._last_timestamp, 0.0), self.window_seconds
+                )
+            weight *= duration * self.reference_fps
+        self._last_timestamp = now
+
+        self._entries.append((letter, weight, now))
+        self._scores[letter] = self._scores.get(letter, 0.0) + weight
+        self._frames[letter] = self._frames.get(letter, 0) + 1
+        self._total += weight
+
+        if not self._leader_stale and (
+            self._leader is None or self._scores[letter] > self._scores[self._leader]
+        ):
+            self._leader = letter
+
+        self._evict(now)
+
+    def _evict(self, now):
+        """Drops the frames that left the window."""
+        if self.max_frames is not None:
+            while len(self._entries) > self.max_frames:
+                self._remove(self._entries.popleft())
+
+        if self.window_seconds is not None:
+            oldest_allowed = now - self.window_seconds
+            while self._entries and self._entries[0][2] <= oldest_allowed:
+                self._remove(self._entries.popleft())
+
+    def _remove(self, entry):
+        """Takes a dropped frame out of the scores."""
+        letter, weight, _ = entry
+        self._frames[letter] -= 1
+        if self._frames[letter] == 0:
+            del self._frames[letter]
+            del self._scores[letter]
+        else:
+            self._scores[letter] -= weight
+
+        if self._entries:
+            self._total -= weight
+        else:
+            self._total = 0.0  # Drop accumulated rounding errors
+
+        if letter == self._leader:
+            self._leader_stale = True
+
+    def vote(self):
+        """Returns the leading letter of the window.
+
+        Returns:
+            tuple: (leading letter, its weighted count, total weight);
+            (None, 0.0, 0.0) for an empty window
+        """
+        if not self._entries:
+            return None, 0.0, 0.0
+
+        if self._leader_stale:
+            self._leader = max(self._scores, key=self._scores.get)
+            self._leader_stale = False
+
+        return self._leader, self._scores[self._leader], self._total
+
+    def get_stability(self):
+        """Returns the share of the window held by the leading letter.
+
+        Returns:
+            float: Stability between 0 and 1 (None for an empty window)
+        """
+        _, score, total = self.vote()
+        if total <= 0:
+            return None
+        return score / total
+
+    def clear(self):
+        """Empties the window."""
+        self._entries.clear()
+        self._scores.clear()
+        self._frames.clear()
+        self._total = 0.0
+        self._leader = None
+        self._leader_stale = False
+        self._last_timestamp = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterates over the letters in the window, oldest first."""
+        return (letter for letter, _, _ in self._entries)
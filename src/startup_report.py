@@ -0,0 +1,137 @@
+"""
+Startup Report
+Summarizes where application startup time goes: imports grouped per
+subsystem (like ``python -X importtime``, but one line per subsystem) and
+the init / warm-up time of each service.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+
+from src.lazy_import import preload
+
+logger = logging.getLogger(__name__)
+
+# Subsystem name -> top-level modules that belong to it (in preload order:
+# shared dependencies are charged to the first subsystem importing them)
+SUBSYSTEMS = (
+    ("NumPy", ("numpy",)),
+    ("OpenCV", ("cv2",)),
+    ("MediaPipe", ("mediapipe",)),
+    ("Model (scikit-learn)", ("sklearn",)),
+    ("Translation (googletrans)", ("googletrans",)),
+    ("UI (customtkinter, PIL)", ("customtkinter", "PIL.Image", "ui_design")),
+    ("Application", ("src",)),
+)
+
+OTHER_SUBSYSTEM = "Other"
+
+
+def subsystem_of(module_name):
+    """Returns the subsystem a module belongs to.
+
+    Args:
+        module_name: Module name (e.g. "cv2" or "src.main_app")
+
+    Returns:
+        str: Subsystem name
+    """
+    top_level = module_name.split(".")[0]
+    for subsystem, modules in SUBSYSTEMS:
+        if top_level in (name.split(".")[0] for name in modules):
+            return subsystem
+    return OTHER_SUBSYSTEM
+
+
+class StartupReport:
+    """Collects import and service timings and formats them as a table."""
+
+    def __init__(self, start_time=None):
+        """Initializes the report.
+
+        Args:
+            start_time: ``time.perf_counter()`` value of the process start
+                (default: now)
+        """
+        self.import_times = {}  # Module name -> ms
+        self.service_timings = {}  # Service name -> {"init_ms", "warmup_ms"}
+        self._start = time.perf_counter() if start_time is None else start_time
+
+    @contextmanager
+    def measure_import(self, module_name):
+        """Times an import (or any block) under the given module name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_import(module_name, (time.perf_counter() - start) * 1000)
+
+    def add_import(self, module_name, elapsed_ms):
+        """Records the import time of a module."""
+        self.import_times[module_name] = (
+            self.import_times.get(module_name, 0.0) + elapsed_ms
+        )
+
+    def preload_subsystems(self):
+        """Imports the third-party modules of every subsystem, in order.
+
+        Project modules (``src``, ``ui_design``) are left to the caller,
+        which times them with ``measure_import``. Missing modules are logged
+        and skipped.
+        """
+        for _, modules in SUBSYSTEMS:
+            for module_name in modules:
+                if module_name == "src" or module_name == "ui_design":
+                    continue
+                try:
+                    self.import_times.update(preload(module_name))
+                except ImportError as e:
+                    logger.warning(f"Module '{module_name}' could not be imported: {e}")
+
+    def add_services(self, timings):
+        """Records service timings as returned by ``ServiceLoader.get_timings``."""
+        self.service_timings.update(timings)
+
+    def get_subsystem_times(self):
+        """Returns the import time per subsystem.
+
+        Returns:
+            dict: Subsystem name -> ms, in ``SUBSYSTEMS`` order
+        """
+        totals = {}
+        for module_name, elapsed_ms in self.import_times.items():
+            subsystem = subsystem_of(module_name)
+            totals[subsystem] = totals.get(subsystem, 0.0) + elapsed_ms
+
+        order = [name for name, _ in SUBSYSTEMS] + [OTHER_SUBSYSTEM]
+        return {name: totals[name] for name in order if name in totals}
+
+    def format(self):
+        """Formats the report.
+
+        Returns:
+            str: Multi-line report
+        """
+        subsystem_times = self.get_subsystem_times()
+        width = max(
+            [len(name) for name in subsystem_times]
+            + [len(name) for name in self.service_timings]
+            + [len("Total")]
+        )
+
+        lines = ["Startup report", "=" * (width + 28), "Imports:"]
+        for name, elapsed_ms in subsystem_times.items():
+            lines.append(f"  {name:<{width}} {elapsed_ms:10.1f} ms")
+        lines.append(f"  {'Total':<{width}} {sum(subsystem_times.values()):10.1f} ms")
+
+        lines.append("Services (init + warm-up):")
+        for name, timings in self.service_timings.items():
+            lines.append(
+                f"  {name:<{width}} {timings['init_ms']:10.1f} ms"
+                f" + {timings['warmup_ms']:.1f} ms"
+            )
+
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        lines.append(f"Time since start: {elapsed_ms:.1f} ms")
+        return "\n".join(lines)
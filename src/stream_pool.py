@@ -0,0 +1,406 @@
+"""
+Stream Pool
+Processes several camera or video streams with a fixed pool of detection
+worker processes.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from src.app_state import AppState
+from src.detection_worker import DetectionWorker
+from src.frame_capture import FrameCapture
+from src.frame_scheduler import FrameScheduler
+from src.lazy_import import lazy_import
+from src.sign_language_service import SignLanguageService
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+class PacedCapture:
+    """Reads a video file at its own frame rate instead of decode speed."""
+
+    def __init__(self, capture_device, fps=None):
+        """Initializes the paced reader.
+
+        Args:
+            capture_device: Opened cv2.VideoCapture of a video file
+            fps: Playback rate (default: the rate stored in the file, or 30)
+        """
+        self.capture_device = capture_device
+        fps = fps or capture_device.get(cv2.CAP_PROP_FPS) or 30
+        self._scheduler = FrameScheduler(fps)
+        self._scheduler.start()
+
+    def read(self):
+        """Waits for the next frame slot and reads a frame."""
+        self._scheduler.wait()
+        return self.capture_device.read()
+
+    def release(self):
+        """Releases the video file."""
+        self.capture_device.release()
+
+
+class VideoStream:
+    """One source with its own capture thread, text state and statistics."""
+
+    def __init__(self, stream_id, source, capture_device, window_size=30):
+        """Initializes the stream.
+
+        Args:
+            stream_id: Stream number
+            source: Camera index or video file path
+            capture_device: Object with ``read()`` and ``release()``
+            window_size: Number of recent frames used for fps/latency
+        """
+        self.stream_id = stream_id
+        self.source = source
+        self.capture_device = capture_device
+        self.frame_capture = FrameCapture(capture_device)
+        self.state = AppState()
+        self.worker = None
+
+        # Newest processed frame and rating
+        self.frame = None
+        self.letter = ""
+        self.stability = None
+        self.in_flight_since = None
+
+        # Statistics
+        self.processed_frames = 0
+        self.dropped_frames = 0
+        self._finish_times = deque(maxlen=window_size)
+        self._latencies = deque(maxlen=window_size)
+
+    def is_finished(self):
+        """Returns whether the source ended (or failed) and is drained."""
+        return (
+            not self.frame_capture.is_running() and len(self.frame_capture.buffer) == 0
+        )
+
+    def record_result(self, latency):
+        """Updates the fps and latency statistics with a finished frame."""
+        self.processed_frames += 1
+        self._finish_times.append(time.perf_counter())
+        self._latencies.append(latency)
+
+    def get_stats(self):
+        """Returns stream statistics.
+
+        Returns:
+            dict: Processed/dropped frames, fps and latency over the window
+        """
+        fps = 0.0
+        if len(self._finish_times) > 1:
+            elapsed = self._finish_times[-1] - self._finish_times[0]
+            if elapsed > 0:
+                fps = (len(self._finish_times) - 1) / elapsed
+
+        return {
+            "source": self.source,
+            "processed_frames": self.processed_frames,
+            "dropped_frames": self.dropped_frames
+            + self.frame_capture.buffer.dropped_frames,
+            "fps": fps,
+            "avg_latency_ms": (
+                sum(self._latencies) / len(self._latencies) * 1000
+                if self._latencies
+                else 0.0
+            ),
+            "text": self.state.get_display_text(),
+        }
+
+
+class StreamPool:
+    """Serves N streams with a fixed-size pool of detection worker processes.
+
+    Every stream is pinned to one worker (stream ``i`` to worker
+    ``i % pool_size``), so its hand tracks and stability window stay in one
+    place. A dispatcher thread visits the streams round-robin, starting one
+    stream later on every pass, and gives each stream at most one frame in
+    flight: a fast camera cannot starve the others, and every stream always
+    gets its newest frame processed. Throughput grows with the number of
+    workers up to the number of streams.
+    """
+
+    def __init__(
+        self,
+        sources,
+        pool_size=None,
+        service_options=None,
+        frame_size=(640, 480),
+        idle_wait=0.002,
+    ):
+        """Initializes the pool.
+
+        Args:
+            sources: Camera indexes and/or video file paths
+            pool_size: Number of worker processes (default: one per stream,
+                at most the number of CPU cores; never more than the streams)
+            service_options: Keyword arguments of SignLanguageService
+            frame_size: (width, height) every frame is scaled to
+            idle_wait: Seconds the dispatcher sleeps when there is no work
+        """
+        if not sources:
+            raise ValueError("At least one stream source is required")
+
+        self.sources = list(sources)
+        self.pool_size = min(pool_size or os.cpu_count() or 1, len(self.sources))
+        self.service_options = service_options or {}
+        self.frame_size = tuple(frame_size)
+        self.idle_wait = idle_wait
+
+        self.streams = []
+        self.workers = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._next_stream = 0
+
+    @staticmethod
+    def _open_source(source):
+        """Opens a camera index or a video file.
+
+        Raises:
+            IOError: If the source cannot be opened
+        """
+        capture_device = cv2.VideoCapture(source)
+        if not capture_device.isOpened():
+            raise IOError(f"Could not open stream source: {source}")
+        if isinstance(source, str) and not source.isdigit():
+            return PacedCapture(capture_device)
+        return capture_device
+
+    def start(self, service_class=SignLanguageService):
+        """Opens the sources, starts the workers and the dispatcher thread.
+
+        Every worker loads its model and the services of its streams, and is
+        warmed up before the first frame is submitted.
+
+        Args:
+            service_class: Service class run by the workers
+
+        Returns:
+            StreamPool: Self (for chaining)
+        """
+        try:
+            for stream_id, source in enumerate(self.sources):
+                if isinstance(source, str) and source.isdigit():
+                    source = int(source)
+                self.streams.append(
+                    VideoStream(stream_id, source, self._open_source(source))
+                )
+
+            for index in range(self.pool_size):
+                worker = DetectionWorker(
+                    self.service_options,
+                    slots=2,
+                    stream_ids=range(index, len(self.streams), self.pool_size),
+                )
+                self.workers.append(worker)
+                worker.start(service_class)
+                worker.warm_up(self.frame_size)
+        except Exception:
+            self.stop()
+            raise
+
+        for stream in self.streams:
+            stream.worker = self.workers[stream.stream_id % self.pool_size]
+            stream.frame_capture.start()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._dispatch_loop, name="StreamPool", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Stream pool started: {len(self.streams)} streams, "
+            f"{self.pool_size} workers"
+        )
+        return self
+
+    def _dispatch_loop(self):
+        """Feeds the workers round-robin and collects their results."""
+        while not self._stop_event.is_set():
+            submitted = self._submit_round()
+            collected = self._collect_results()
+
+            if not (submitted or collected):
+                if all(stream.is_finished() for stream in self.streams):
+                    if not any(stream.in_flight_since for stream in self.streams):
+                        logger.info("All streams finished")
+                        break
+                time.sleep(self.idle_wait)
+
+    def _submit_round(self):
+        """Submits the newest frame of every idle stream, round-robin.
+
+        Returns:
+            int: Number of submitted frames
+        """
+        count = len(self.streams)
+        start = self._next_stream
+        self._next_stream = (start + 1) % count
+
+        submitted = 0
+        for offset in range(count):
+            stream = self.streams[(start + offset) % count]
+            if stream.in_flight_since is not None:
+                continue
+
+            frame = stream.frame_capture.buffer.get_latest(timeout=0)
+            if frame is None:
+                continue
+
+            if (frame.shape[1], frame.shape[0]) != self.frame_size:
+                frame = cv2.resize(frame, self.frame_size)
+
+            if stream.worker.submit(frame, stream.stream_id):
+                stream.in_flight_since = time.perf_counter()
+                submitted += 1
+            else:
+                stream.dropped_frames += 1
+        return submitted
+
+    def _collect_results(self):
+        """Routes finished frames to their streams.
+
+        Returns:
+            int: Number of collected results
+        """
+        collected = 0
+        for worker in self.workers:
+            for result in worker.poll():
+                self._handle_result(self.streams[result["stream_id"]], result)
+                collected += 1
+
+        # Frames that failed in the worker come back without a result
+        for stream in self.streams:
+            if (
+                stream.in_flight_since is not None
+                and stream.stream_id not in stream.worker.get_in_flight_streams()
+            ):
+                stream.in_flight_since = None
+        return collected
+
+    def _handle_result(self, stream, result):
+        """Applies one processed frame to its stream."""
+        latency = time.perf_counter() - stream.in_flight_since
+        stream.in_flight_since = None
+        stream.record_result(latency)
+
+        predicted_letter, _, prediction_count, is_stable = result["prediction"]
+        with self._lock:
+            stream.frame = result["frame"]
+            stream.letter = result["letter"]
+            stream.stability = result["stability"]
+            if (
+                predicted_letter
+                and prediction_count > 0
+                and stream.state.commit_prediction(predicted_letter, is_stable)
+            ):
+                stream.worker.clear_predictions(stream.stream_id)
+
+    def is_running(self):
+        """Returns whether the dispatcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stats(self):
+        """Returns per-stream statistics.
+
+        Returns:
+            dict: Stream id -> statistics (see ``VideoStream.get_stats``)
+        """
+        with self._lock:
+            return {stream.stream_id: stream.get_stats() for stream in self.streams}
+
+    def get_mosaic(self, tile_size=None, columns=None):
+        """Builds one image showing the newest frame of every stream.
+
+        Each tile is labeled with its stream number, fps and text.
+
+        Args:
+            tile_size: (width, height) of a tile (default: frame size divided
+                to fit the grid into one frame)
+            columns: Number of tile columns (default: square-ish grid)
+
+        Returns:
+            np.ndarray: BGR mosaic image
+        """
+        count = len(self.streams)
+        columns = columns or math.ceil(math.sqrt(count))
+        rows = math.ceil(count / columns)
+        if tile_size is None:
+            tile_size = (self.frame_size[0] // columns, self.frame_size[1] // rows)
+        width, height = tile_size
+
+        mosaic = np.zeros((rows * height, columns * width, 3), dtype=np.uint8)
+        with self._lock:
+            for index, stream in enumerate(self.streams):
+                row, column = divmod(index, columns)
+                tile = mosaic[
+                    row * height : (row + 1) * height,
+                    column * width : (column + 1) * width,
+                ]
+                if stream.frame is not None:
+                    tile[:] = cv2.resize(stream.frame, (width, height))
+
+                stats = stream.get_stats()
+                cv2.putText(
+                    tile,
+                    f"#{stream.stream_id} {stats['fps']:.0f} fps {stream.letter}",
+                    (8, 22),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6,
+                    (0, 255, 0),
+                    2,
+                    cv2.LINE_AA,
+                )
+                cv2.putText(
+                    tile,
+                    stats["text"][-30:],
+                    (8, height - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6,
+                    (255, 255, 255),
+                    2,
+                    cv2.LINE_AA,
+                )
+        return mosaic
+
+    def stop(self, timeout=2.0):
+        """Stops the streams and the workers.
+
+        Args:
+            timeout: Maximum time to wait for the dispatcher thread
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        for stream in self.streams:
+            stream.frame_capture.stop()
+            stream.capture_device.release()
+            stats = stream.get_stats()
+            logger.info(
+                "Stream %d (%s): %d frames, %.1f fps, %.1f ms avg latency",
+                stream.stream_id,
+                stream.source,
+                stats["processed_frames"],
+                stats["fps"],
+                stats["avg_latency_ms"],
+            )
+
+        for worker in self.workers:
+            worker.release_resources()
+        self.workers = []
@@ -5,7 +5,9 @@ Translates texts into different languages using the Google Translate API.
 
 import logging
 
-from googletrans import Translator
+from src.lazy_import import lazy_import
+
+googletrans = lazy_import("googletrans")
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,7 @@ class TranslatorService:
     def __init__(self):
         """Initializes the translation service."""
         try:
-            self.translator = Translator()
+            self.translator = googletrans.Translator()
             logger.info("Translation service started")
         except Exception as e:
             logger.error(f"Translation service could not be started: {e}")
@@ -0,0 +1,74 @@
+"""
+Shared helpers of the unit tests
+"""
+
+import os
+import pickle
+import tempfile
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from src.sign_language_model import SignLanguageModel
+
+
+def train_forest(n_estimators=25, seed=0):
+    """Small forest on 42 noisy landmark-like features with 26 classes"""
+    rng = np.random.default_rng(seed)
+    centers = rng.random((26, 42))
+    y = np.repeat(np.arange(26), 20)
+    X = centers[y] + rng.normal(0, 0.08, (len(y), 42))
+    forest = RandomForestClassifier(n_estimators=n_estimators, random_state=seed)
+    return forest.fit(X, y)
+
+
+def write_model(path, forest):
+    """Pickles a forest the way the training script stores the model"""
+    with open(path, "wb") as f:
+        pickle.dump({"model": forest}, f)
+
+
+def load_model(forest, **options):
+    """Loads a SignLanguageModel from a pickled copy of the forest"""
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "model.p")
+        write_model(model_path, forest)
+        return SignLanguageModel(model_path, **options)
+
+
+class FakeService:
+    """Stand-in for SignLanguageService that runs in a worker process."""
+
+    required_stable_frames = 3
+    model_loads = 0
+
+    def __init__(self, fail=False, model=None):
+        if fail:
+            raise RuntimeError("model missing")
+        self.model = model
+        self.last_confidence = None
+        self.count = 0
+
+    @staticmethod
+    def load_model():
+        FakeService.model_loads += 1
+        return FakeService.model_loads
+
+    def warm_up(self, frame_size):
+        pass
+
+    def process_frame(self, frame):
+        frame[0, 0] = 255  # Overlay drawn in place
+        self.last_confidence = 0.9
+        # Only the first model loaded in the worker process predicts letters
+        return frame, "A" if self.model == 1 else "", 50.0
+
+    def update_prediction(self, letter, confidence=None):
+        self.count += 1
+        return letter, 1.0, float(self.count), self.count >= 3
+
+    def clear_predictions(self):
+        self.count = 0
+
+    def release_resources(self):
+        pass
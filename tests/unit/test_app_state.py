@@ -29,6 +29,14 @@ class TestAppState(unittest.TestCase):
         self.assertEqual(self.app_state.get("current_word"), "A")
         self.assertEqual(self.app_state.get("last_added_letter"), "A")
 
+    def test_letter_count_changes_for_repeated_letters(self):
+        """Every added letter is counted, even if it repeats the last one"""
+        self.app_state.add_letter("A")
+        self.app_state.add_space()
+        self.app_state.add_letter("A")
+        self.assertEqual(self.app_state.get("letter_count"), 2)
+        self.assertEqual(self.app_state.get("detected_letter"), "A")
+
     def test_add_space(self):
         """Add space test"""
         self.app_state.add_letter("A")
@@ -57,6 +65,14 @@ class TestAppState(unittest.TestCase):
         self.app_state.add_letter("B")
         self.assertEqual(self.app_state.get_display_text(), "A B")
 
+    def test_commit_prediction(self):
+        """Only stable, new letters are committed"""
+        self.assertFalse(self.app_state.commit_prediction("A", False))
+        self.assertTrue(self.app_state.commit_prediction("A", True))
+        self.assertFalse(self.app_state.commit_prediction("A", True))
+        self.assertTrue(self.app_state.commit_prediction("B", True))
+        self.assertEqual(self.app_state.get("current_word"), "AB")
+
 
 if __name__ == "__main__":
     unittest.main()
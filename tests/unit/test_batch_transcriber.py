@@ -0,0 +1,138 @@
+"""
+Unit tests for headless batch transcription
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from src.batch_transcriber import (
+    Transcript,
+    format_srt_time,
+    iter_frames,
+    summarize_workers,
+    write_events,
+)
+
+
+class StubService:
+    """Reports a letter as stable once it was seen on three frames."""
+
+    def __init__(self):
+        self.last_confidence = 0.9
+        self.history = []
+        self.cleared = 0
+
+    def update_prediction(self, letter, confidence=None, timestamp=None):
+        if letter:
+            self.history.append(letter)
+        if not self.history:
+            return None, 0, 0, False
+        leader = self.history[-1]
+        count = self.history.count(leader)
+        return leader, count, count, count >= 3
+
+    def clear_predictions(self):
+        self.history = []
+        self.cleared += 1
+
+
+class TestTranscript(unittest.TestCase):
+    def run_letters(self, letters, fps=10):
+        transcript = Transcript(StubService())
+        for index, letter in enumerate(letters):
+            transcript.add_frame(index, index / fps, letter)
+        transcript.end_word(len(letters), len(letters) / fps)
+        return transcript
+
+    def test_letters_and_words_are_committed_with_timestamps(self):
+        """A gap without hands longer than the word timeout ends a word"""
+        letters = ["A"] * 3 + ["B"] * 3 + [""] * 12 + ["C"] * 3
+        transcript = self.run_letters(letters)
+
+        self.assertEqual(transcript.get_text(), "AB C")
+        letter_events = [e for e in transcript.events if e["type"] == "letter"]
+        self.assertEqual(
+            [(e["letter"], e["frame"]) for e in letter_events],
+            [("A", 2), ("B", 5), ("C", 20)],
+        )
+        self.assertAlmostEqual(letter_events[1]["time"], 0.5)
+
+        words = [e for e in transcript.events if e["type"] == "word"]
+        self.assertEqual([w["word"] for w in words], ["AB", "C"])
+        self.assertAlmostEqual(words[0]["start"], 0.2)
+        self.assertAlmostEqual(words[0]["end"], 1.5)
+
+    def test_short_gap_keeps_the_word(self):
+        """Gaps shorter than the word timeout do not split a word"""
+        transcript = self.run_letters(["A"] * 3 + [""] * 5 + ["B"] * 3)
+        self.assertEqual(transcript.get_text(), "AB")
+
+    def test_empty_input_has_no_events(self):
+        """No text and no events without hands"""
+        transcript = self.run_letters([""] * 10)
+        self.assertEqual(transcript.events, [])
+        self.assertEqual(transcript.get_text(), "")
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.events = [
+            {"type": "letter", "letter": "A", "frame": 2, "time": 0.2},
+            {"type": "word", "word": "A", "frame": 20, "start": 0.2, "end": 3723.5},
+        ]
+
+    def test_srt_time(self):
+        """SRT timestamps use HH:MM:SS,mmm"""
+        self.assertEqual(format_srt_time(0), "00:00:00,000")
+        self.assertEqual(format_srt_time(3723.5), "01:02:03,500")
+
+    def test_jsonl_contains_every_event(self):
+        path = os.path.join(self.directory.name, "out.jsonl")
+        write_events(self.events, path, "jsonl")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual([json.loads(line) for line in f], self.events)
+
+    def test_srt_has_one_cue_per_word(self):
+        path = os.path.join(self.directory.name, "out.srt")
+        write_events(self.events, path, "srt")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "1\n00:00:00,200 --> 01:02:03,500\nA\n\n")
+
+
+class TestInputs(unittest.TestCase):
+    def test_image_directory_is_read_in_name_order(self):
+        """Images are sorted by name and timed with the given frame rate"""
+        with tempfile.TemporaryDirectory() as directory:
+            for i, name in enumerate(("b.png", "a.png", "c.png")):
+                image = np.full((8, 8, 3), i * 50, dtype=np.uint8)
+                cv2.imwrite(os.path.join(directory, name), image)
+            with open(os.path.join(directory, "notes.txt"), "w") as f:
+                f.write("not an image")
+
+            frames = list(iter_frames(directory, image_fps=4))
+
+        self.assertEqual([(i, t) for i, t, _ in frames], [(0, 0), (1, 0.25), (2, 0.5)])
+        self.assertEqual([int(f[0, 0, 0]) for _, _, f in frames], [50, 0, 100])
+
+    def test_worker_summary(self):
+        """Frames and time are summed per worker process"""
+        results = [
+            {"pid": 1, "frames": 100, "seconds": 2.0},
+            {"pid": 1, "frames": 50, "seconds": 1.0},
+            {"pid": 2, "frames": 30, "seconds": 0.0},
+        ]
+        summary = summarize_workers(results)
+        self.assertEqual(summary[1]["files"], 2)
+        self.assertAlmostEqual(summary[1]["fps"], 50.0)
+        self.assertEqual(summary[2]["fps"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the process-isolated detection worker
+"""
+
+import unittest
+
+import numpy as np
+
+from src.detection_worker import DetectionWorker, SharedFrameRing
+from src.exceptions import SignLanguageError
+from tests.unit.helpers import FakeService
+
+
+class TestSharedFrameRing(unittest.TestCase):
+    def test_attached_ring_shares_frames(self):
+        """A second handle on the same block sees the written frames"""
+        ring = SharedFrameRing((4, 6, 3), slots=2)
+        self.addCleanup(ring.close)
+        attached = SharedFrameRing(**ring.get_spec())
+        self.addCleanup(attached.close)
+
+        ring.frame(1)[:] = 7
+        self.assertTrue(np.all(attached.frame(1) == 7))
+        self.assertTrue(np.all(attached.frame(0) == 0))
+
+
+class TestDetectionWorker(unittest.TestCase):
+    def setUp(self):
+        self.worker = DetectionWorker(slots=2, start_timeout=30).start(FakeService)
+        self.addCleanup(self.worker.release_resources)
+
+    def test_process_frame_round_trip(self):
+        """Frames come back with the overlay drawn by the worker"""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+
+        processed, letter, stability = self.worker.process_frame(frame)
+
+        self.assertEqual(letter, "A")
+        self.assertEqual(stability, 50.0)
+        self.assertEqual(processed[0, 0, 0], 255)
+        self.assertEqual(frame[0, 0, 0], 0)
+        self.assertEqual(self.worker.required_stable_frames, 3)
+        self.assertEqual(self.worker.last_confidence, 0.9)
+
+    def test_submit_poll_and_clear(self):
+        """Results carry the worker's stability rating; clearing resets it"""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        for _ in range(3):
+            self.worker.process_frame(frame)
+
+        self.worker.clear_predictions()
+        self.assertTrue(self.worker.submit(frame))
+        results = []
+        while not results:
+            results = self.worker.poll(timeout=5)
+
+        self.assertEqual(results[0]["prediction"], ("A", 1.0, 1.0, False))
+        stats = self.worker.get_stats()
+        self.assertEqual(stats["completed"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_full_ring_drops_frames(self):
+        """Frames are dropped while every slot is in use"""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+
+        # Slots are only freed when the results are collected
+        self.assertTrue(self.worker.submit(frame))
+        self.assertTrue(self.worker.submit(frame))
+        self.assertFalse(self.worker.submit(frame))
+        self.assertEqual(self.worker.get_stats()["dropped"], 1)
+
+
+class TestDetectionWorkerStreams(unittest.TestCase):
+    def test_streams_share_one_model(self):
+        """The services of all streams are created at startup with one model"""
+        worker = DetectionWorker(slots=2, start_timeout=30, stream_ids=[3, 5])
+        self.addCleanup(worker.release_resources)
+        worker.start(FakeService)
+        worker.warm_up((6, 4))
+
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        for stream_id in (3, 5, 7):
+            self.assertTrue(worker.submit(frame, stream_id))
+            results = []
+            while not results:
+                results = worker.poll(timeout=5)
+            self.assertEqual(results[0]["stream_id"], stream_id)
+            self.assertEqual(results[0]["letter"], "A")
+
+
+class TestDetectionWorkerStartup(unittest.TestCase):
+    def test_service_error_is_reported(self):
+        """A service that cannot be created fails the start"""
+        worker = DetectionWorker({"fail": True}, start_timeout=30)
+        self.addCleanup(worker.release_resources)
+
+        with self.assertRaises(SignLanguageError):
+            worker.start(FakeService)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ from src.exceptions import (
     CameraException,
     MorseException,
     ConfigurationException,
+    ModelException,
     YasminBaseException,
 )
 
@@ -69,6 +70,15 @@ class TestExceptions(unittest.TestCase):
         exc = ConfigurationException(custom_msg)
         self.assertEqual(str(exc), custom_msg)
 
+    def test_model_exception(self):
+        """Model exception class test"""
+        exc = ModelException()
+        self.assertEqual(str(exc), "An error occurred while loading the model")
+
+        custom_msg = "Custom model error"
+        exc = ModelException(custom_msg)
+        self.assertEqual(str(exc), custom_msg)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit tests for the compiled random forest evaluator
+"""
+
+import unittest
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from src.forest_compiler import CompiledForest
+from src.sign_language_model import BACKEND_COMPILED
+from tests.unit.helpers import load_model, train_forest
+
+
+class TestCompiledForest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.forest = train_forest()
+        cls.compiled = CompiledForest.from_sklearn(cls.forest)
+        rng = np.random.default_rng(1)
+        cls.samples = rng.random((300, 42)).astype(np.float32)
+
+    def test_probabilities_match_sklearn_exactly(self):
+        """Compiled probabilities are bit-identical to scikit-learn"""
+        expected = self.forest.predict_proba(self.samples)
+        np.testing.assert_array_equal(
+            self.compiled.predict_proba(self.samples), expected
+        )
+        np.testing.assert_array_equal(
+            self.compiled.predict(self.samples), self.forest.predict(self.samples)
+        )
+
+    def test_samples_on_thresholds(self):
+        """Values right at a split threshold take the same branch"""
+        used = self.compiled.left != np.arange(len(self.compiled.left))
+        samples = self.samples[:40].copy()
+        features = self.compiled.feature[used][:40]
+        thresholds = self.compiled.threshold[used][:40]
+        samples[np.arange(40), features] = thresholds
+
+        np.testing.assert_array_equal(
+            self.compiled.predict_proba(samples), self.forest.predict_proba(samples)
+        )
+
+    def test_node_array_types(self):
+        """Node arrays use compact dtypes"""
+        self.assertEqual(self.compiled.feature.dtype, np.int16)
+        self.assertEqual(self.compiled.threshold.dtype, np.float32)
+        self.assertEqual(self.compiled.left.dtype, np.int32)
+        self.assertEqual(self.compiled.n_trees, 25)
+
+    def test_anytime_stops_early_on_clear_samples(self):
+        """Settled votes need only part of the forest and keep the label"""
+        # Class centers of the training data
+        clear = np.random.default_rng(0).random((26, 42))[:1]
+
+        labels, trees_used = self.compiled.predict_anytime(clear, block_size=5)
+
+        self.assertLess(trees_used, self.compiled.n_trees)
+        np.testing.assert_array_equal(labels, self.forest.predict(clear))
+
+    def test_anytime_full_vote_matches_predict_proba(self):
+        """Without a settled vote all trees run and the result is exact"""
+        proba, trees_used = self.compiled.predict_proba_anytime(
+            self.samples, block_size=7
+        )
+
+        self.assertEqual(trees_used, self.compiled.n_trees)
+        np.testing.assert_array_equal(proba, self.forest.predict_proba(self.samples))
+
+    def test_anytime_early_exit_is_vote_of_evaluated_trees(self):
+        """An early exit returns the vote of the trees evaluated so far"""
+        clear = np.random.default_rng(0).random((26, 42)).astype(np.float32)[:3]
+
+        proba, trees_used = self.compiled.predict_proba_anytime(clear, block_size=5)
+
+        self.assertLess(trees_used, self.compiled.n_trees)
+        evaluated = np.mean(
+            [
+                tree.predict_proba(clear)
+                for tree in self.forest.estimators_[:trees_used]
+            ],
+            axis=0,
+        )
+        np.testing.assert_allclose(proba, evaluated, rtol=1e-6)
+
+        # The lead is larger than the remaining trees could overturn
+        top_two = np.sort(proba * trees_used, axis=1)[:, -2:]
+        remaining = self.compiled.n_trees - trees_used
+        self.assertTrue((top_two[:, 1] - top_two[:, 0] > remaining).all())
+        np.testing.assert_array_equal(
+            proba.argmax(axis=1), self.forest.predict_proba(clear).argmax(axis=1)
+        )
+
+    def test_anytime_margin_rule_keeps_predictions(self):
+        """Early exit never changes the predicted label"""
+        for sample in self.samples[:50]:
+            labels, _ = self.compiled.predict_anytime(sample[np.newaxis], 3)
+            np.testing.assert_array_equal(
+                labels, self.forest.predict(sample[np.newaxis])
+            )
+
+    def test_anytime_confidence_threshold(self):
+        """A reached confidence stops after the first block"""
+        _, trees_used = self.compiled.predict_anytime(
+            self.samples[:1], block_size=5, confidence=0.0
+        )
+        self.assertEqual(trees_used, 5)
+
+    def test_rejects_unfitted_model(self):
+        """Only fitted forests can be compiled"""
+        with self.assertRaises(ValueError):
+            CompiledForest.from_sklearn(RandomForestClassifier())
+
+
+class TestSignLanguageModelBackends(unittest.TestCase):
+    def test_compiled_backend_matches_sklearn(self):
+        """Both backends predict the same letters"""
+        forest = train_forest(n_estimators=10)
+        sklearn_model = load_model(forest)
+        compiled_model = load_model(forest, backend=BACKEND_COMPILED)
+
+        samples = np.random.default_rng(2).random((50, 42))
+        self.assertIsNotNone(compiled_model.compiled_forest)
+        self.assertEqual(
+            compiled_model.predict_batch(samples), sklearn_model.predict_batch(samples)
+        )
+        self.assertEqual(
+            compiled_model.predict(samples[0]), sklearn_model.predict(samples[0])
+        )
+
+    def test_confidence_is_vote_share(self):
+        """Confidence and top-k come from the forest probabilities"""
+        forest = train_forest(n_estimators=10)
+        model = load_model(forest, backend=BACKEND_COMPILED)
+
+        sample = np.random.default_rng(4).random(42)
+        proba = forest.predict_proba(sample.astype(np.float32).reshape(1, -1))[0]
+
+        letter, confidence = model.predict_with_confidence(sample)
+        top = model.predict_top_k(sample, k=3)
+
+        self.assertEqual(letter, model.predict(sample))
+        self.assertEqual(confidence, proba.max())
+        self.assertEqual(top[0], (letter, confidence))
+        self.assertEqual([p for _, p in top], sorted(proba, reverse=True)[:3])
+        self.assertEqual(model.predict_with_confidence([0.0] * 5), (None, 0.0))
+
+    def test_model_anytime_prediction_reports_trees(self):
+        """Anytime mode reports the trees used and keeps statistics"""
+        model = load_model(
+            train_forest(n_estimators=20),
+            backend=BACKEND_COMPILED,
+            anytime_block_size=5,
+        )
+
+        clear = np.random.default_rng(0).random((26, 42))
+        letter, trees_used = model.predict_anytime(clear[1])
+
+        self.assertEqual(letter, "B")
+        self.assertLess(trees_used, 20)
+        self.assertEqual(model.predict_batch(clear[:3]), ["A", "B", "C"])
+        self.assertEqual(model.get_anytime_stats()["predictions"], 2)
+
+    def test_anytime_model_reports_full_forest_confidence(self):
+        """Early exit only shortens letter-only predictions"""
+        forest = train_forest(n_estimators=40)
+        model = load_model(forest, backend=BACKEND_COMPILED, anytime_block_size=5)
+
+        samples = np.random.default_rng(7).random((50, 42)).astype(np.float32)
+        letters, confidences = model.predict_batch_with_confidence(samples)
+
+        np.testing.assert_array_equal(
+            confidences, forest.predict_proba(samples).max(axis=1)
+        )
+        self.assertEqual(model.get_anytime_stats()["predictions"], 0)
+        self.assertEqual(model.predict_batch(samples), letters)
+        self.assertEqual(model.get_anytime_stats()["predictions"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
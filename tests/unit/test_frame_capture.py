@@ -0,0 +1,84 @@
+"""
+Unit tests for the frame capture stage
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from src.frame_capture import FrameCapture, FrameRingBuffer
+
+
+class FakeCapture:
+    """Capture device returning a fixed number of numbered frames"""
+
+    def __init__(self, frame_count):
+        self.frame_count = frame_count
+        self.index = 0
+        self.done = threading.Event()
+
+    def read(self):
+        if self.index >= self.frame_count:
+            self.done.set()
+            return False, None
+        frame = np.full((4, 4, 3), self.index, dtype=np.uint8)
+        self.index += 1
+        return True, frame
+
+
+class TestFrameRingBuffer(unittest.TestCase):
+    def test_latest_frame_is_returned(self):
+        """Newest frame wins and older frames are counted as dropped"""
+        buffer = FrameRingBuffer(capacity=3)
+        for i in range(3):
+            buffer.put(i)
+
+        self.assertEqual(buffer.get_latest(timeout=0), 2)
+        self.assertEqual(buffer.dropped_frames, 2)
+        self.assertEqual(len(buffer), 0)
+
+    def test_overflow_drops_oldest(self):
+        """Full buffer discards the oldest frame"""
+        buffer = FrameRingBuffer(capacity=2)
+        for i in range(5):
+            buffer.put(i)
+
+        self.assertEqual(buffer.dropped_frames, 3)
+        self.assertEqual(buffer.get_latest(timeout=0), 4)
+        self.assertEqual(buffer.total_frames, 5)
+
+    def test_timeout_returns_none(self):
+        """Empty buffer returns None after timeout"""
+        buffer = FrameRingBuffer()
+        self.assertIsNone(buffer.get_latest(timeout=0.01))
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive"""
+        with self.assertRaises(ValueError):
+            FrameRingBuffer(capacity=0)
+
+
+class TestFrameCapture(unittest.TestCase):
+    def test_capture_stops_on_read_failure(self):
+        """Capture thread records the error when the device fails"""
+        device = FakeCapture(frame_count=10)
+        capture = FrameCapture(device).start()
+        self.assertTrue(device.done.wait(timeout=2))
+        capture.stop()
+
+        stats = capture.get_stats()
+        self.assertEqual(stats["captured_frames"], 10)
+        self.assertIsNotNone(capture.error)
+
+        ret, frame = capture.read(timeout=0.01)
+        self.assertTrue(ret)
+        self.assertEqual(frame[0, 0, 0], 9)
+
+        ret, frame = capture.read(timeout=0.01)
+        self.assertFalse(ret)
+        self.assertIsNone(frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
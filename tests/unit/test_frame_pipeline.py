@@ -0,0 +1,82 @@
+"""
+Unit tests for the frame pipeline
+"""
+
+import threading
+import time
+import unittest
+
+from src.frame_pipeline import (
+    BACKPRESSURE_BLOCK,
+    BACKPRESSURE_DROP_OLDEST,
+    FramePipeline,
+    PipelineStage,
+)
+
+
+class TestFramePipeline(unittest.TestCase):
+    def test_items_pass_through_all_stages_in_order(self):
+        """Every item is processed by each stage in submission order"""
+        results = []
+        stages = [
+            PipelineStage("add", lambda x: x + 1, backpressure=BACKPRESSURE_BLOCK),
+            PipelineStage("double", lambda x: x * 2, backpressure=BACKPRESSURE_BLOCK),
+        ]
+        pipeline = FramePipeline(stages, sink=results.append).start()
+
+        for i in range(20):
+            self.assertTrue(pipeline.submit(i))
+        pipeline.stop()
+
+        self.assertEqual(results, [(i + 1) * 2 for i in range(20)])
+        stats = pipeline.get_stats()
+        self.assertEqual(stats["add"]["processed"], 20)
+        self.assertEqual(stats["double"]["dropped"], 0)
+
+    def test_drop_oldest_backpressure(self):
+        """Full queue drops the oldest item instead of blocking"""
+        release = threading.Event()
+        results = []
+
+        def slow_stage(x):
+            release.wait(timeout=2)
+            return x
+
+        stage = PipelineStage(
+            "slow", slow_stage, queue_size=2, backpressure=BACKPRESSURE_DROP_OLDEST
+        )
+        pipeline = FramePipeline([stage], sink=results.append).start()
+
+        pipeline.submit(0)
+        time.sleep(0.05)  # Let the worker pick up the first item
+        for i in range(1, 6):
+            pipeline.submit(i)
+        release.set()
+        pipeline.stop()
+
+        self.assertEqual(results, [0, 4, 5])
+        self.assertEqual(pipeline.get_stats()["slow"]["dropped"], 3)
+
+    def test_failing_item_is_counted(self):
+        """Errors in a stage do not stop the pipeline"""
+        results = []
+        stage = PipelineStage(
+            "invert", lambda x: 1 / x, backpressure=BACKPRESSURE_BLOCK
+        )
+        pipeline = FramePipeline([stage], sink=results.append).start()
+
+        for value in (1, 0, 2):
+            pipeline.submit(value)
+        pipeline.stop()
+
+        self.assertEqual(results, [1.0, 0.5])
+        self.assertEqual(pipeline.get_stats()["invert"]["failed"], 1)
+
+    def test_invalid_backpressure(self):
+        """Unknown backpressure policy is rejected"""
+        with self.assertRaises(ValueError):
+            PipelineStage("stage", lambda x: x, backpressure="unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
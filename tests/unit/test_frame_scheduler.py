@@ -0,0 +1,79 @@
+"""
+Unit tests for the frame scheduler
+"""
+
+import unittest
+
+from src.frame_scheduler import FrameScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def work(self, seconds):
+        self.now += seconds
+
+
+class TestFrameScheduler(unittest.TestCase):
+    def setUp(self):
+        """Setup function to run before each test"""
+        self.clock = FakeClock()
+        self.scheduler = FrameScheduler(
+            target_fps=10, clock=self.clock, sleep=self.clock.sleep
+        )
+        self.scheduler.start()
+
+    def test_sleeps_only_leftover_budget(self):
+        """Fast frames sleep for the remainder of the frame slot"""
+        self.clock.work(0.03)
+        skipped = self.scheduler.wait()
+
+        self.assertEqual(skipped, 0)
+        self.assertAlmostEqual(self.clock.sleeps[-1], 0.07)
+        self.assertAlmostEqual(self.clock.now, 100.1)
+
+    def test_overrun_skips_frames(self):
+        """Overrunning frames skip missed slots instead of falling behind"""
+        self.clock.work(0.25)  # Misses the slots at 100.1 and 100.2
+        skipped = self.scheduler.wait()
+
+        self.assertEqual(skipped, 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+        # Next frame is aligned to the grid again
+        self.clock.work(0.01)
+        self.scheduler.wait()
+        self.assertAlmostEqual(self.clock.now, 100.3)
+        self.assertEqual(self.scheduler.get_stats()["skipped_frames"], 1)
+        self.assertEqual(self.scheduler.get_stats()["overruns"], 1)
+
+    def test_achieved_fps_and_jitter(self):
+        """Steady frames reach the target rate with no jitter"""
+        for _ in range(20):
+            self.clock.work(0.02)
+            self.scheduler.wait()
+
+        stats = self.scheduler.get_stats()
+        self.assertAlmostEqual(stats["achieved_fps"], 10.0, places=5)
+        self.assertAlmostEqual(stats["jitter_ms"], 0.0, places=5)
+        self.assertEqual(stats["frames"], 20)
+
+    def test_invalid_fps(self):
+        """Non-positive frame rate is rejected"""
+        with self.assertRaises(ValueError):
+            FrameScheduler(target_fps=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
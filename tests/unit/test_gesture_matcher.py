@@ -0,0 +1,111 @@
+"""
+Unit tests for the compiled gesture matcher
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.gesture_matcher import GestureMatcher
+
+
+def reference_match(gesture_map, landmarks):
+    """Linear scan with the mean landmark distance."""
+    best, best_distance = None, float("inf")
+    for name, data in gesture_map.items():
+        if len(data["landmarks"]) != len(landmarks):
+            continue
+        distance = np.mean(
+            np.linalg.norm(np.array(data["landmarks"]) - np.array(landmarks), axis=1)
+        )
+        if distance < best_distance:
+            best, best_distance = name, distance
+    return best
+
+
+def random_map(count, size=21, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        f"G{i}": {"landmarks": rng.random((size, 2)).tolist(), "confidence": 0.9}
+        for i in range(count)
+    }
+
+
+class TestGestureMatcher(unittest.TestCase):
+    def test_matches_closest_gesture(self):
+        """Dict and pair landmarks find the closest gesture"""
+        matcher = GestureMatcher(
+            {
+                "A": {"landmarks": [(0.4, 0.6), (0.5, 0.7)], "confidence": 0.9},
+                "B": {"landmarks": [(0.3, 0.5), (0.4, 0.6)], "confidence": 0.85},
+            }
+        )
+
+        name, confidence, distance = matcher.match(
+            [{"x": 0.31, "y": 0.5}, {"x": 0.4, "y": 0.61}]
+        )
+        self.assertEqual(name, "B")
+        self.assertEqual(confidence, 0.85)
+        self.assertLess(distance, 0.02)
+        self.assertEqual(matcher.match([(0.4, 0.6), (0.5, 0.7)])[0], "A")
+
+    def test_no_gesture_with_matching_size(self):
+        """Hands with a different landmark count match nothing"""
+        matcher = GestureMatcher(random_map(3, size=21))
+
+        self.assertEqual(matcher.match([(0.1, 0.2)] * 5), (None, 0.0, float("inf")))
+
+    def test_kd_tree_matches_linear_scan(self):
+        """The indexed search returns the exact nearest gesture"""
+        gesture_map = random_map(600)
+        indexed = GestureMatcher(gesture_map, index_threshold=100)
+        self.assertIsNotNone(indexed.groups[21].tree)
+
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            landmarks = rng.random((21, 2)).tolist()
+            self.assertEqual(
+                indexed.match(landmarks)[0], reference_match(gesture_map, landmarks)
+            )
+
+    def test_far_query_scans_linearly(self):
+        """A hand far from every gesture skips re-ranking the whole map"""
+        gesture_map = random_map(600)
+        indexed = GestureMatcher(gesture_map, index_threshold=100)
+        group = indexed.groups[21]
+        landmarks = (np.random.default_rng(2).random((21, 2)) + 3).tolist()
+
+        with patch.object(group, "_scan", wraps=group._scan) as scan:
+            name = indexed.match(landmarks)[0]
+
+        scan.assert_called_once()
+        self.assertEqual(name, reference_match(gesture_map, landmarks))
+
+    def test_binary_cache(self):
+        """The compiled map is cached next to the JSON file"""
+        gesture_map = random_map(5)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "gesture_map.json")
+            with open(json_path, "w") as f:
+                json.dump(gesture_map, f)
+
+            first = GestureMatcher.load(json_path)
+            cache_path = os.path.join(directory, "gesture_map.npz")
+            self.assertTrue(os.path.exists(cache_path))
+
+            # A valid cache is used without reading the JSON file
+            with patch("src.gesture_matcher.json.load") as json_load:
+                cached = GestureMatcher.load(json_path)
+            json_load.assert_not_called()
+
+            landmarks = gesture_map["G3"]["landmarks"]
+            self.assertEqual(cached.match(landmarks)[0], "G3")
+            self.assertEqual(len(cached), len(first))
+
+
+if __name__ == "__main__":
+    unittest.main()
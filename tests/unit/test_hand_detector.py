@@ -1,4 +1,5 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -7,6 +8,23 @@ from src.exceptions import HandDetectionError
 from src.hand_detector import HandDetector
 
 
+def fake_hand_results(image):
+    """Returns a fake "hand" spanning the bright pixels of the image"""
+    ys, xs = np.nonzero(image[:, :, 0] > 128)
+    if len(xs) == 0:
+        return SimpleNamespace(multi_hand_landmarks=None)
+
+    h, w = image.shape[:2]
+    landmarks = [
+        SimpleNamespace(x=x / w, y=y / h, z=0.0)
+        for x, y in zip(
+            np.linspace(xs.min(), xs.max() + 1, 21),
+            np.linspace(ys.min(), ys.max() + 1, 21),
+        )
+    ]
+    return SimpleNamespace(multi_hand_landmarks=[SimpleNamespace(landmark=landmarks)])
+
+
 class TestHandDetector(unittest.TestCase):
     def setUp(self):
         """Setup function to run before each test"""
@@ -39,6 +57,107 @@ class TestHandDetector(unittest.TestCase):
         with self.assertRaises(HandDetectionError):
             self.detector.find_hands(invalid_frame)
 
+    @patch("src.hand_detector.mp.solutions.hands.Hands")
+    def test_inference_size_downscales_input(self, mock_hands):
+        """Large frames are downscaled (keeping aspect) before detection"""
+        detector = HandDetector(inference_size=(320, 240))
+        frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+        detector.detect_hands(frame)
+
+        processed = mock_hands.return_value.process.call_args[0][0]
+        self.assertEqual(processed.shape, (180, 320, 3))
+        self.assertEqual(frame.shape, (1080, 1920, 3))
+
+    @patch("src.hand_detector.mp.solutions.hands.Hands")
+    def test_inference_size_keeps_small_frames(self, mock_hands):
+        """Frames already smaller than the inference size are not resized"""
+        detector = HandDetector(inference_size=(320, 240))
+        detector.detect_hands(np.zeros((120, 160, 3), dtype=np.uint8))
+
+        processed = mock_hands.return_value.process.call_args[0][0]
+        self.assertEqual(processed.shape, (120, 160, 3))
+
+    @patch("src.hand_detector.mp.solutions.hands.Hands")
+    def test_roi_tracking_crops_and_remaps(self, mock_hands):
+        """Second frame is searched in a crop; landmarks map to the full frame"""
+        mock_hands.return_value.process.side_effect = fake_hand_results
+        detector = HandDetector(roi_tracking=True)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[200:260, 300:360] = 255
+
+        first = detector.detect_hands(frame)
+        second = detector.detect_hands(frame)
+
+        crop = mock_hands.return_value.process.call_args[0][0]
+        self.assertLess(crop.shape[0], 480)
+        self.assertLess(crop.shape[1], 640)
+
+        for a, b in zip(
+            first.multi_hand_landmarks[0].landmark,
+            second.multi_hand_landmarks[0].landmark,
+        ):
+            self.assertAlmostEqual(a.x, b.x, places=6)
+            self.assertAlmostEqual(a.y, b.y, places=6)
+
+        stats = detector.get_roi_stats()
+        self.assertEqual(stats["roi_frames"], 1)
+        self.assertEqual(stats["full_frames"], 1)
+
+    @patch("src.hand_detector.mp.solutions.hands.Hands")
+    def test_roi_tracking_falls_back_to_full_frame(self, mock_hands):
+        """Hand lost in the crop triggers a full-frame search"""
+        mock_hands.return_value.process.side_effect = fake_hand_results
+        detector = HandDetector(roi_tracking=True)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[200:260, 300:360] = 255
+        detector.detect_hands(frame)
+
+        moved = np.zeros((480, 640, 3), dtype=np.uint8)
+        moved[20:80, 20:80] = 255
+        results = detector.detect_hands(moved)
+
+        self.assertIsNotNone(results.multi_hand_landmarks)
+        self.assertAlmostEqual(
+            results.multi_hand_landmarks[0].landmark[0].x, 20 / 640, places=6
+        )
+        self.assertEqual(detector.get_roi_stats()["full_frames"], 2)
+
+    def test_landmark_array_matches_list_output(self):
+        """Array features equal the list features after float32 conversion"""
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            # MediaPipe stores coordinates as float32
+            values = rng.random((21, 3)).astype(np.float32)
+            hand = SimpleNamespace(
+                landmark=[
+                    SimpleNamespace(x=float(x), y=float(y), z=float(z))
+                    for x, y, z in values
+                ]
+            )
+
+            data_aux, x_, y_ = self.detector.extract_landmarks(hand)
+            points = self.detector.extract_landmark_array(hand)
+            features = self.detector.landmarks_to_features(points)
+
+            self.assertEqual(points.shape, (21, 3))
+            self.assertEqual(points.dtype, np.float32)
+            np.testing.assert_array_equal(points[:, 0], np.float32(x_))
+            np.testing.assert_array_equal(points[:, 1], np.float32(y_))
+            np.testing.assert_array_equal(features, np.float32(data_aux))
+
+    def test_features_are_view_of_buffer(self):
+        """Feature vector is a view of the output buffer"""
+        points = np.random.default_rng(1).random((21, 3)).astype(np.float32)
+        buffer = np.empty((21, 2), dtype=np.float32)
+
+        features = self.detector.landmarks_to_features(points, out=buffer)
+
+        self.assertEqual(features.shape, (42,))
+        self.assertTrue(np.shares_memory(features, buffer))
+        self.assertEqual(features[::2].min(), 0.0)
+        self.assertEqual(features[1::2].min(), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
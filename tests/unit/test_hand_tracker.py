@@ -0,0 +1,62 @@
+"""
+Unit tests for hand identity tracking
+"""
+
+import unittest
+
+from src.hand_tracker import HandTracker, box_iou
+
+LEFT_BOX = (0.1, 0.3, 0.3, 0.6)
+RIGHT_BOX = (0.6, 0.3, 0.8, 0.6)
+
+
+def shifted(box, dx):
+    return (box[0] + dx, box[1], box[2] + dx, box[3])
+
+
+class TestHandTracker(unittest.TestCase):
+    def test_box_iou(self):
+        """Identical boxes overlap fully, disjoint ones not at all"""
+        self.assertAlmostEqual(box_iou(LEFT_BOX, LEFT_BOX), 1.0)
+        self.assertEqual(box_iou(LEFT_BOX, RIGHT_BOX), 0.0)
+
+    def test_identities_survive_order_swap(self):
+        """Hands keep their track when MediaPipe reorders them"""
+        tracker = HandTracker()
+        left, right = tracker.update([LEFT_BOX, RIGHT_BOX], ["Left", "Right"])
+
+        tracks = tracker.update(
+            [shifted(RIGHT_BOX, 0.02), shifted(LEFT_BOX, 0.02)], ["Right", "Left"]
+        )
+
+        self.assertIs(tracks[0], right)
+        self.assertIs(tracks[1], left)
+
+    def test_fast_motion_matched_by_handedness(self):
+        """A hand without box overlap is still matched by its handedness"""
+        tracker = HandTracker()
+        (track,) = tracker.update([LEFT_BOX], ["Left"])
+
+        (moved,) = tracker.update([shifted(LEFT_BOX, 0.4)], ["Left"])
+
+        self.assertIs(moved, track)
+
+    def test_lost_track_expires(self):
+        """Tracks are dropped after too many missed frames"""
+        tracker = HandTracker(max_missed_frames=2)
+        (track,) = tracker.update([LEFT_BOX], ["Left"])
+        track.stability.add("A")
+
+        for _ in range(2):
+            tracker.update([])
+        self.assertIs(tracker.get_track(track.track_id), track)
+
+        tracker.update([])
+        self.assertIsNone(tracker.get_track(track.track_id))
+        (new_track,) = tracker.update([LEFT_BOX], ["Left"])
+        self.assertNotEqual(new_track.track_id, track.track_id)
+        self.assertEqual(len(new_track.stability), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
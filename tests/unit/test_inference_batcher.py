@@ -0,0 +1,149 @@
+"""
+Unit tests for the micro-batching inference queue
+"""
+
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from src.inference_batcher import InferenceBatcher
+
+
+class FakeModel:
+    """Letter from the first feature, confidence from the second."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batch_sizes = []
+        self.threads = set()
+        self.gate = None
+        self.entered = threading.Event()
+
+    def predict_batch_with_confidence(self, batch):
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batch_sizes.append(len(batch))
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("model failed")
+        letters = [chr(65 + int(row[0])) for row in batch]
+        return letters, [float(row[1]) for row in batch]
+
+    def get_cache_stats(self):
+        return {"hits": 1}
+
+
+def vector(letter_index, confidence=0.5):
+    features = np.zeros(42, dtype=np.float32)
+    features[:2] = letter_index, confidence
+    return features
+
+
+class TestInferenceBatcher(unittest.TestCase):
+    def start(self, model, **options):
+        batcher = InferenceBatcher(model, **options).start()
+        self.addCleanup(batcher.stop)
+        return batcher
+
+    def test_flushes_at_max_batch_size(self):
+        """Queued vectors are split into full batches, results stay in order"""
+        model = FakeModel()
+        batcher = self.start(model, max_batch_size=4, max_wait=1.0)
+
+        futures = batcher.submit_many([vector(i % 26) for i in range(8)])
+        results = [future.result(timeout=0.5) for future in futures]
+
+        self.assertEqual([letter for letter, _ in results], list("ABCDEFGH"))
+        self.assertEqual(model.batch_sizes, [4, 4])
+        self.assertEqual(model.threads, {"InferenceBatcher"})
+
+    def test_flushes_after_max_wait(self):
+        """A lone vector is classified once the oldest has waited max_wait"""
+        batcher = self.start(FakeModel(), max_batch_size=32, max_wait=0.05)
+
+        start = time.perf_counter()
+        letter, confidence = batcher.submit(vector(2, 0.75)).result(timeout=1.0)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual((letter, confidence), ("C", 0.75))
+        self.assertGreaterEqual(elapsed, 0.045)
+        stats = batcher.get_stats()
+        self.assertEqual((stats["batches"], stats["items"]), (1, 1))
+        self.assertGreaterEqual(stats["max_queue_delay_ms"], 45)
+
+    def test_concurrent_callers_share_batches(self):
+        """Blocking predictions from many threads are batched together"""
+        model = FakeModel()
+        batcher = self.start(model, max_batch_size=8, max_wait=0.02)
+        results = {}
+
+        def call(i):
+            results[i] = batcher.predict_with_confidence(vector(i))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        letters = {i: letter for i, (letter, _) in results.items()}
+        self.assertEqual(letters, {i: chr(65 + i) for i in range(16)})
+        self.assertLess(len(model.batch_sizes), 16)
+        self.assertEqual(batcher.get_stats()["items"], 16)
+        self.assertGreater(batcher.get_stats()["avg_batch_size"], 1)
+
+    def test_invalid_vectors_and_model_errors(self):
+        model = FakeModel()
+        batcher = self.start(model, max_wait=0.001)
+        self.assertEqual(
+            batcher.predict_batch_with_confidence([[0.0] * 5]), ([None], [0.0])
+        )
+        self.assertEqual(model.batch_sizes, [])
+
+        model.fail = True
+        with self.assertRaises(RuntimeError):
+            batcher.predict(vector(0))
+
+    def test_stop_flushes_waiting_vectors(self):
+        """Vectors queued before stop are still classified"""
+        batcher = InferenceBatcher(FakeModel(), max_batch_size=32, max_wait=10).start()
+        future = batcher.submit(vector(1))
+        batcher.stop()
+
+        self.assertEqual(future.result(timeout=0)[0], "B")
+        with self.assertRaises(RuntimeError):
+            batcher.submit(vector(1))
+
+    def test_model_attributes_are_delegated(self):
+        batcher = InferenceBatcher(FakeModel())
+        self.assertEqual(batcher.get_cache_stats(), {"hits": 1})
+        with self.assertRaises(AttributeError):
+            batcher.missing_attribute
+
+    def test_delegated_calls_wait_for_the_running_batch(self):
+        """Forwarded model methods never run while a batch is classified"""
+        model = FakeModel()
+        model.gate = threading.Event()
+        batcher = self.start(model, max_batch_size=1)
+        future = batcher.submit(vector(0))
+        self.assertTrue(model.entered.wait(1))
+
+        stats = []
+        caller = threading.Thread(
+            target=lambda: stats.append(batcher.get_cache_stats())
+        )
+        caller.start()
+        caller.join(0.05)
+        self.assertEqual(stats, [])
+
+        model.gate.set()
+        caller.join(1)
+        self.assertEqual(stats, [{"hits": 1}])
+        self.assertEqual(future.result(timeout=1)[0], "A")
+
+
+if __name__ == "__main__":
+    unittest.main()
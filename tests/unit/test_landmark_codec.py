@@ -0,0 +1,92 @@
+"""
+Unit tests for the binary landmark encoding
+"""
+
+import unittest
+
+import numpy as np
+
+from src.landmark_codec import (
+    COORD_MAX,
+    COORD_MIN,
+    HEADER,
+    LandmarkDecoder,
+    LandmarkEncoder,
+    is_landmark_packet,
+)
+
+STEP = (COORD_MAX - COORD_MIN) / 65535
+
+
+def hands(count, seed=0):
+    return np.random.default_rng(seed).random((count, 21, 3)).astype(np.float32)
+
+
+class TestLandmarkCodec(unittest.TestCase):
+    def test_absolute_round_trip(self):
+        """Coordinates survive within half a quantization step; z is dropped"""
+        encoder, decoder = LandmarkEncoder(delta=False), LandmarkDecoder()
+        points = hands(2)
+
+        packet = encoder.encode(points)
+        decoded = decoder.decode(packet)
+
+        self.assertTrue(is_landmark_packet(packet))
+        self.assertEqual(len(packet), HEADER.size + 2 * 21 * 2 * 2)
+        self.assertEqual(decoded.shape, (2, 21, 2))
+        np.testing.assert_allclose(decoded, points[:, :, :2], atol=STEP / 2 + 1e-6)
+
+    def test_single_hand_and_no_hands(self):
+        encoder, decoder = LandmarkEncoder(), LandmarkDecoder()
+        self.assertEqual(decoder.decode(encoder.encode(hands(1)[0])).shape, (1, 21, 2))
+        self.assertEqual(decoder.decode(encoder.encode([])).shape, (0, 21, 2))
+
+    def test_delta_packets_are_half_size_and_exact(self):
+        """Small movements are delta-encoded without extra loss"""
+        encoder, decoder = LandmarkEncoder(), LandmarkDecoder()
+        absolute = LandmarkEncoder(delta=False)
+        points = hands(2)
+        decoder.decode(encoder.encode(points))
+
+        moved = points + 0.001
+        packet = encoder.encode(moved)
+        reference = LandmarkDecoder().decode(absolute.encode(moved))
+
+        self.assertEqual(len(packet), HEADER.size + 2 * 21 * 2)
+        np.testing.assert_array_equal(decoder.decode(packet), reference)
+
+    def test_large_movement_falls_back_to_absolute(self):
+        encoder, decoder = LandmarkEncoder(), LandmarkDecoder()
+        decoder.decode(encoder.encode(hands(1)))
+        packet = encoder.encode(hands(1, seed=1))
+        self.assertEqual(len(packet), HEADER.size + 21 * 2 * 2)
+        np.testing.assert_allclose(
+            decoder.decode(packet), hands(1, seed=1)[:, :, :2], atol=STEP
+        )
+
+    def test_out_of_range_coordinates_are_clipped(self):
+        points = np.full((1, 21, 2), 3.0, dtype=np.float32)
+        decoded = LandmarkDecoder().decode(LandmarkEncoder().encode(points))
+        self.assertAlmostEqual(float(decoded.max()), COORD_MAX, places=4)
+
+    def test_malformed_packets(self):
+        decoder = LandmarkDecoder()
+        packet = LandmarkEncoder().encode(hands(1))
+        with self.assertRaises(ValueError):
+            decoder.decode(packet[:-1])
+        with self.assertRaises(ValueError):
+            decoder.decode(b"\xff\xd8" + packet[2:])
+
+        # A delta packet needs its predecessor
+        encoder = LandmarkEncoder()
+        encoder.encode(hands(1))
+        with self.assertRaises(ValueError):
+            LandmarkDecoder().decode(encoder.encode(hands(1)))
+
+    def test_invalid_landmark_shape(self):
+        with self.assertRaises(ValueError):
+            LandmarkEncoder().encode(np.zeros((1, 20, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for optical flow landmark propagation
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from src.hand_detector import HandDetector
+from src.landmark_flow import LandmarkFlowPropagator
+
+
+def textured_frame(shift_x=0):
+    """Smooth random texture, optionally shifted horizontally"""
+    rng = np.random.default_rng(42)
+    noise = rng.integers(0, 255, (240, 320), dtype=np.uint8)
+    texture = cv2.GaussianBlur(noise, (7, 7), 2)
+    texture = np.roll(texture, shift_x, axis=1)
+    return cv2.cvtColor(texture, cv2.COLOR_GRAY2BGR)
+
+
+def fixed_hand_results(*_):
+    """Fake detection with 21 landmarks on a grid in the frame center"""
+    landmarks = [
+        SimpleNamespace(x=0.35 + 0.3 * (i % 5) / 4, y=0.35 + 0.3 * (i // 5) / 4, z=0.0)
+        for i in range(21)
+    ]
+    return SimpleNamespace(
+        multi_hand_landmarks=[SimpleNamespace(landmark=landmarks)],
+        multi_handedness=None,
+    )
+
+
+class TestLandmarkFlowPropagator(unittest.TestCase):
+    def test_landmarks_follow_motion(self):
+        """Landmarks move with the image content"""
+        propagator = LandmarkFlowPropagator()
+        gray = cv2.cvtColor(textured_frame(), cv2.COLOR_BGR2GRAY)
+        propagator.start(gray, fixed_hand_results())
+
+        moved = cv2.cvtColor(textured_frame(shift_x=3), cv2.COLOR_BGR2GRAY)
+        hands = propagator.propagate(moved)
+
+        self.assertIsNotNone(hands)
+        original = fixed_hand_results().multi_hand_landmarks[0].landmark
+        for before, after in zip(original, hands[0].landmark):
+            self.assertAlmostEqual((after.x - before.x) * 320, 3.0, delta=0.3)
+            self.assertAlmostEqual(after.y, before.y, delta=0.3 / 240)
+
+    def test_unreliable_flow_fails(self):
+        """A completely different frame cannot be tracked"""
+        propagator = LandmarkFlowPropagator()
+        gray = cv2.cvtColor(textured_frame(), cv2.COLOR_BGR2GRAY)
+        propagator.start(gray, fixed_hand_results())
+
+        self.assertIsNone(propagator.propagate(np.zeros_like(gray)))
+
+    def test_no_hands_nothing_to_track(self):
+        """Empty detections leave nothing to propagate"""
+        propagator = LandmarkFlowPropagator()
+        gray = cv2.cvtColor(textured_frame(), cv2.COLOR_BGR2GRAY)
+        propagator.start(gray, SimpleNamespace(multi_hand_landmarks=None))
+
+        self.assertFalse(propagator.has_landmarks())
+        self.assertIsNone(propagator.propagate(gray))
+
+
+class TestSparseDetection(unittest.TestCase):
+    @patch("src.hand_detector.mp.solutions.hands.Hands")
+    def test_detection_runs_every_nth_frame(self, mock_hands):
+        """MediaPipe runs once per detection interval"""
+        mock_hands.return_value.process.side_effect = fixed_hand_results
+        detector = HandDetector(detection_interval=3)
+
+        for shift in range(6):
+            results = detector.detect_hands(textured_frame(shift_x=shift))
+            self.assertEqual(len(results.multi_hand_landmarks), 1)
+
+        self.assertEqual(mock_hands.return_value.process.call_count, 2)
+        self.assertEqual(detector.get_flow_stats()["flow_frames"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
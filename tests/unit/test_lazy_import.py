@@ -0,0 +1,85 @@
+"""
+Unit tests for lazy imports and the startup report
+"""
+
+import subprocess
+import sys
+import unittest
+
+from src.lazy_import import LazyModule, get_import_times, lazy_import, preload
+from src.startup_report import OTHER_SUBSYSTEM, StartupReport, subsystem_of
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_module_is_imported_on_first_use(self):
+        """The proxy imports the real module on attribute access"""
+        module = lazy_import("json")
+
+        self.assertIsInstance(module, LazyModule)
+        self.assertEqual(module.dumps([1]), "[1]")
+        self.assertIn("loaded", repr(module))
+
+    def test_proxy_is_shared(self):
+        """The same proxy is returned for the same module name"""
+        self.assertIs(lazy_import("json"), lazy_import("json"))
+
+    def test_missing_module_fails_at_first_use(self):
+        """Import errors are raised on use, not when the proxy is created"""
+        module = lazy_import("src_missing_module_for_tests")
+
+        with self.assertRaises(ImportError):
+            module.anything
+
+    def test_preload_records_import_time(self):
+        """Preloaded modules report their import time"""
+        times = preload("colorsys")
+
+        self.assertIn("colorsys", times)
+        self.assertGreaterEqual(times["colorsys"], 0.0)
+        if times["colorsys"] > 0:
+            self.assertIn("colorsys", get_import_times())
+
+    def test_light_modules_do_not_import_heavy_dependencies(self):
+        """Morse service and app state start without OpenCV or MediaPipe"""
+        code = (
+            "import sys\n"
+            "import src.app_state, src.morse_service, src.main_app\n"
+            "heavy = {'cv2', 'mediapipe', 'googletrans', 'customtkinter', 'PIL'}\n"
+            "print(sorted(heavy & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        if result.returncode != 0:
+            self.skipTest(f"Application modules not importable: {result.stderr}")
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+class TestStartupReport(unittest.TestCase):
+    def test_modules_are_grouped_per_subsystem(self):
+        """Submodules are charged to the subsystem of their package"""
+        self.assertEqual(subsystem_of("cv2"), "OpenCV")
+        self.assertEqual(subsystem_of("PIL.Image"), "UI (customtkinter, PIL)")
+        self.assertEqual(subsystem_of("src.main_app"), "Application")
+        self.assertEqual(subsystem_of("json"), OTHER_SUBSYSTEM)
+
+    def test_format_lists_imports_and_services(self):
+        """The report contains subsystem totals and service timings"""
+        report = StartupReport()
+        report.add_import("cv2", 120.0)
+        report.add_import("src.main_app", 30.0)
+        report.add_import("src.hand_detector", 10.0)
+        report.add_services({"translation": {"init_ms": 5.0, "warmup_ms": 0.0}})
+
+        self.assertEqual(
+            report.get_subsystem_times(), {"OpenCV": 120.0, "Application": 40.0}
+        )
+        text = report.format()
+        self.assertIn("OpenCV", text)
+        self.assertIn("160.0 ms", text)
+        self.assertIn("translation", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
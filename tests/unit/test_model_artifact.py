@@ -0,0 +1,89 @@
+"""
+Unit tests for the memory-mappable model artifact
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.exceptions import ModelException
+from src.model_artifact import (
+    MANIFEST_FILE,
+    convert_pickle,
+    file_hash,
+    is_artifact,
+    load_artifact,
+    main,
+)
+from src.sign_language_model import BACKEND_SKLEARN, SignLanguageModel
+from tests.unit.helpers import train_forest, write_model
+
+
+class TestModelArtifact(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.forest = train_forest(n_estimators=10)
+
+    def setUp(self):
+        """Writes a pickled model and training data into a temp directory"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.pickle_path = os.path.join(tmp.name, "model.p")
+        self.data_path = os.path.join(tmp.name, "data.pickle")
+        self.artifact_path = os.path.join(tmp.name, "model.model")
+
+        write_model(self.pickle_path, self.forest)
+        with open(self.data_path, "wb") as f:
+            f.write(b"training data")
+
+    def test_round_trip_matches_sklearn(self):
+        """A converted and memory-mapped model predicts like the original"""
+        convert_pickle(
+            self.pickle_path,
+            self.artifact_path,
+            labels={0: "A", 1: "B"},
+            training_data_path=self.data_path,
+        )
+        forest, manifest = load_artifact(self.artifact_path)
+
+        samples = np.random.default_rng(6).random((100, 42))
+        np.testing.assert_array_equal(
+            forest.predict_proba(samples), self.forest.predict_proba(samples)
+        )
+        self.assertIsInstance(forest.leaf_values.base, np.memmap)
+        self.assertEqual(manifest["n_features"], 42)
+        self.assertEqual(manifest["labels"], {"0": "A", "1": "B"})
+        self.assertEqual(manifest["training_data_hash"], file_hash(self.data_path))
+
+    def test_unsupported_version_is_rejected(self):
+        """Artifacts of another format version are not loaded"""
+        convert_pickle(self.pickle_path, self.artifact_path)
+        manifest_path = os.path.join(self.artifact_path, MANIFEST_FILE)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest["version"] = 99
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+        with self.assertRaises(ModelException):
+            load_artifact(self.artifact_path)
+
+    def test_model_loads_artifact(self):
+        """SignLanguageModel uses the artifact and its labels"""
+        main([self.pickle_path, self.artifact_path])
+        self.assertTrue(is_artifact(self.artifact_path))
+
+        model = SignLanguageModel(self.artifact_path, backend=BACKEND_SKLEARN)
+        reference = SignLanguageModel(self.pickle_path)
+
+        samples = np.random.default_rng(7).random((20, 42))
+        self.assertIsNone(model.model)
+        self.assertEqual(model.labels_dict[25], "Z")
+        self.assertEqual(model.predict_batch(samples), reference.predict_batch(samples))
+
+
+if __name__ == "__main__":
+    unittest.main()
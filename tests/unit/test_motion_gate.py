@@ -0,0 +1,54 @@
+"""
+Unit tests for the motion gate
+"""
+
+import unittest
+
+import numpy as np
+
+from src.motion_gate import MotionGate
+
+
+class TestMotionGate(unittest.TestCase):
+    def setUp(self):
+        """Setup function to run before each test"""
+        self.gate = MotionGate(threshold=2.0, max_reuse_frames=3)
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 255, (120, 160, 3), dtype=np.uint8)
+
+    def test_first_frame_is_miss(self):
+        """Without a reference frame detection must run"""
+        self.assertFalse(self.gate.should_reuse(self.frame))
+        self.assertEqual(self.gate.get_stats()["misses"], 1)
+
+    def test_duplicate_frame_is_hit(self):
+        """Exact duplicate frames are reused"""
+        self.gate.should_reuse(self.frame)
+        self.assertTrue(self.gate.should_reuse(self.frame.copy()))
+        self.assertEqual(self.gate.get_stats()["duplicate_hits"], 1)
+
+    def test_small_noise_is_static(self):
+        """Sensor noise below the threshold counts as a static scene"""
+        self.gate.should_reuse(self.frame)
+        noisy = self.frame.copy()
+        noisy[0, 0, 0] ^= 1
+        self.assertTrue(self.gate.should_reuse(noisy))
+        self.assertEqual(self.gate.get_stats()["static_hits"], 1)
+
+    def test_motion_is_miss(self):
+        """Large changes force a new detection"""
+        self.gate.should_reuse(self.frame)
+        self.assertFalse(self.gate.should_reuse(255 - self.frame))
+
+    def test_max_reuse_forces_detection(self):
+        """Detection is forced after the maximum number of reused frames"""
+        self.gate.should_reuse(self.frame)
+        results = [self.gate.should_reuse(self.frame) for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+        stats = self.gate.get_stats()
+        self.assertAlmostEqual(stats["hit_rate"], 3 / 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
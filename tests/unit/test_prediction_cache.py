@@ -0,0 +1,68 @@
+"""
+Unit tests for the prediction cache
+"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.prediction_cache import PredictionCache
+from src.sign_language_model import BACKEND_COMPILED
+from tests.unit.helpers import load_model, train_forest
+
+
+class TestPredictionCache(unittest.TestCase):
+    def test_nearby_vectors_share_a_key(self):
+        """Noise below the grid step maps to the same key"""
+        cache = PredictionCache(grid=0.01)
+        features = np.arange(42) * 0.01
+
+        self.assertEqual(cache.make_key(features), cache.make_key(features + 0.002))
+        self.assertNotEqual(cache.make_key(features), cache.make_key(features + 0.02))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The oldest untouched entry leaves first"""
+        cache = PredictionCache(max_size=2)
+        cache.put(b"a", ("A", 1.0))
+        cache.put(b"b", ("B", 1.0))
+        cache.get(b"a")
+        cache.put(b"c", ("C", 1.0))
+
+        self.assertIsNone(cache.get(b"b"))
+        self.assertEqual(cache.get(b"a"), ("A", 1.0))
+        stats = cache.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_invalid_settings(self):
+        """Cache size and grid must be positive"""
+        with self.assertRaises(ValueError):
+            PredictionCache(max_size=0)
+        with self.assertRaises(ValueError):
+            PredictionCache(grid=0)
+
+
+class TestModelPredictionCache(unittest.TestCase):
+    def test_repeated_features_skip_the_forest(self):
+        """Cached vectors are answered without evaluating the forest"""
+        model = load_model(
+            train_forest(n_estimators=10), backend=BACKEND_COMPILED, cache_size=16
+        )
+
+        sample = np.random.default_rng(5).random(42)
+        expected = model.predict_with_confidence(sample)
+
+        with patch.object(
+            model, "_predict_proba", wraps=model._predict_proba
+        ) as mock_proba:
+            for _ in range(5):
+                self.assertEqual(model.predict_with_confidence(sample), expected)
+
+        mock_proba.assert_not_called()
+        self.assertEqual(model.get_cache_stats()["hits"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+"""
+Unit tests for the WebSocket recognition server
+"""
+
+import asyncio
+import json
+import os
+import threading
+import unittest
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from src.landmark_codec import LandmarkEncoder
+from src.recognition_server import (
+    OPCODE_BINARY,
+    OPCODE_CLOSE,
+    OPCODE_TEXT,
+    RecognitionServer,
+    encode_frame,
+    read_frame,
+)
+
+MASK = b"\x01\x02\x03\x04"
+
+
+class StubService:
+    """Reports "A" and becomes stable on the third frame."""
+
+    gate = None  # threading.Event that blocks process_frame when set
+    events = []  # Order of frame and release calls
+
+    def __init__(self, model=None, **options):
+        self.model = model
+        self.last_confidence = None
+        self.count = 0
+
+    @staticmethod
+    def load_model(**options):
+        return SimpleNamespace(options=options)
+
+    def process_frame(self, frame):
+        StubService.events.append("start")
+        if StubService.gate is not None:
+            StubService.gate.wait(5)
+        StubService.events.append("end")
+        self.last_confidence = 0.9
+        return frame, "A", 50.0
+
+    def process_landmarks(self, hands):
+        self.last_confidence = 0.8
+        return ("B" if len(hands) else ""), None
+
+    def update_prediction(self, letter, confidence=None):
+        self.count += 1
+        return letter, 1.0, float(self.count), self.count >= 3
+
+    def clear_predictions(self):
+        self.count = 0
+
+    def release_resources(self):
+        StubService.events.append("release")
+
+
+def jpeg():
+    return cv2.imencode(".jpg", np.zeros((16, 16, 3), dtype=np.uint8))[1].tobytes()
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            b"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+            b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+            b"Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        response = await reader.readuntil(b"\r\n\r\n")
+        return cls(reader, writer), response.decode("latin-1")
+
+    async def send_frame(self):
+        self.writer.write(encode_frame(OPCODE_BINARY, jpeg(), MASK))
+        await self.writer.drain()
+
+    async def send_bytes(self, data):
+        self.writer.write(encode_frame(OPCODE_BINARY, data, MASK))
+        await self.writer.drain()
+
+    async def send_json(self, message):
+        self.writer.write(encode_frame(OPCODE_TEXT, json.dumps(message), MASK))
+        await self.writer.drain()
+
+    async def receive(self):
+        _, opcode, payload = await asyncio.wait_for(read_frame(self.reader, 1 << 20), 5)
+        if opcode == OPCODE_CLOSE:
+            return {"type": "close"}
+        return json.loads(payload)
+
+    async def close(self):
+        self.writer.write(encode_frame(OPCODE_CLOSE, b"\x03\xe8", MASK))
+        self.writer.close()
+
+
+class TestFraming(unittest.IsolatedAsyncioTestCase):
+    async def test_masked_frames_round_trip(self):
+        """Masked frames of every length encoding decode to their payload"""
+        for size in (0, 5, 300, 70000):
+            payload = os.urandom(size)
+            reader = asyncio.StreamReader()
+            reader.feed_data(encode_frame(OPCODE_BINARY, payload, MASK))
+            final, opcode, data = await read_frame(reader, 1 << 20)
+            self.assertTrue(final)
+            self.assertEqual(opcode, OPCODE_BINARY)
+            self.assertEqual(data, payload)
+
+    async def test_oversized_frame_is_rejected(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame(OPCODE_BINARY, b"x" * 200))
+        with self.assertRaises(ValueError):
+            await read_frame(reader, 100)
+
+
+class TestRecognitionServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        StubService.gate = None
+        StubService.events = []
+        self.server = RecognitionServer(max_sessions=2, workers=1, max_queue=0)
+        await self.server.start("127.0.0.1", 0, service_class=StubService)
+        self.clients = []
+
+    async def asyncTearDown(self):
+        if StubService.gate is not None:
+            StubService.gate.set()
+        for client in self.clients:
+            await client.close()
+        await asyncio.sleep(0.05)
+        await self.server.stop()
+
+    async def connect(self):
+        client, response = await Client.connect(self.server.port)
+        self.clients.append(client)
+        return client, response
+
+    async def test_handshake_accept_key(self):
+        """The accept key follows RFC 6455 (sample key from the RFC)"""
+        client, response = await self.connect()
+        self.assertIn("101 Switching Protocols", response)
+        self.assertIn("s3pPLMBiTxaQ9kYGzzhZRbK+xOo=", response)
+        self.assertEqual((await client.receive())["type"], "session")
+
+    async def test_sessions_commit_text_independently(self):
+        """Every session has its own stability window and text"""
+        first, _ = await self.connect()
+        second, _ = await self.connect()
+        await first.receive()
+        await second.receive()
+
+        for _ in range(3):
+            await first.send_frame()
+            result = await first.receive()
+        self.assertEqual(result["committed"], "A")
+        self.assertEqual(result["text"], "A")
+
+        await second.send_frame()
+        result = await second.receive()
+        self.assertIsNone(result["committed"])
+        self.assertEqual(result["text"], "")
+
+        await first.send_json({"type": "space"})
+        self.assertEqual((await first.receive())["text"], "A ")
+        await first.send_json({"type": "dance"})
+        self.assertEqual((await first.receive())["type"], "error")
+
+    async def test_landmark_packets_skip_image_decoding(self):
+        """Landmark packets are decoded in order and rated without a frame"""
+        client, _ = await self.connect()
+        await client.receive()
+        encoder = LandmarkEncoder()
+        points = np.random.default_rng(0).random((1, 21, 2))
+
+        for step in range(3):
+            await client.send_bytes(encoder.encode(points + 0.001 * step))
+            result = await client.receive()
+        self.assertEqual((result["letter"], result["confidence"]), ("B", 0.8))
+        self.assertEqual(result["committed"], "B")
+
+        await client.send_bytes(encoder.encode(points)[:-1])
+        self.assertEqual((await client.receive())["type"], "error")
+
+    async def test_disconnect_waits_for_frame_in_flight(self):
+        """The service is released only after its pool thread finished"""
+        client, _ = await self.connect()
+        await client.receive()
+
+        StubService.gate = threading.Event()
+        await client.send_frame()
+        await asyncio.sleep(0.1)  # The frame is now in the detector
+        self.clients.remove(client)
+        client.writer.close()
+        await asyncio.sleep(0.1)
+
+        # The session is gone, but its frame still counts for load shedding
+        self.assertEqual(self.server.get_stats()["sessions"], 0)
+        self.assertEqual(self.server.in_flight, 1)
+        self.assertEqual(StubService.events, ["start"])
+
+        StubService.gate.set()
+        await asyncio.sleep(0.1)
+        self.assertEqual(StubService.events, ["start", "end", "release"])
+        self.assertEqual(self.server.in_flight, 0)
+
+    async def test_session_cap(self):
+        """Connections beyond the cap are refused"""
+        await self.connect()
+        await self.connect()
+        _, response = await self.connect()
+        self.assertIn("503", response)
+        self.assertEqual(self.server.get_stats()["refused_sessions"], 1)
+
+    async def test_frames_are_shed_when_detector_is_busy(self):
+        """While a frame is processed, newer frames replace or get shed"""
+        first, _ = await self.connect()
+        second, _ = await self.connect()
+        await first.receive()
+        await second.receive()
+
+        StubService.gate = threading.Event()
+        await first.send_frame()
+        await asyncio.sleep(0.1)  # First frame is now in the detector
+        for _ in range(3):
+            await first.send_frame()
+        await second.send_frame()
+        await asyncio.sleep(0.1)
+        StubService.gate.set()
+
+        # The in-flight frame and the newest waiting one are processed
+        results = [await first.receive(), await first.receive()]
+        self.assertEqual(results[-1]["dropped"], 2)
+
+        stats = self.server.get_stats()
+        self.assertEqual(stats["shed_frames"], 1)
+        self.assertEqual(stats["per_session"][2]["dropped_frames"], 1)
+
+    async def test_sessions_share_a_batched_model(self):
+        """With micro-batching every session gets the one shared batcher"""
+        server = RecognitionServer(
+            {"model_backend": "compiled", "roi_tracking": True}, max_batch_size=16
+        )
+        await server.start("127.0.0.1", 0, service_class=StubService)
+        self.addAsyncCleanup(server.stop)
+        self.assertEqual(server.batcher.model.options, {"model_backend": "compiled"})
+
+        clients = [await Client.connect(server.port) for _ in range(2)]
+        for client, _ in clients:
+            await client.receive()
+            self.clients.append(client)
+
+        services = [session.service for session in server.sessions.values()]
+        self.assertEqual([service.model for service in services], [server.batcher] * 2)
+        self.assertEqual(server.get_stats()["batching"]["batches"], 0)
+
+    async def test_health(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = (await reader.read()).decode("utf-8")
+        writer.close()
+        self.assertIn("200 OK", response)
+        body = json.loads(response.split("\r\n\r\n", 1)[1])
+        self.assertEqual(body["max_sessions"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the background service loader
+"""
+
+import threading
+import unittest
+from unittest.mock import Mock
+
+from src.service_loader import ServiceLoader
+
+
+class TestServiceLoader(unittest.TestCase):
+    def setUp(self):
+        self.loader = ServiceLoader()
+        self.addCleanup(self.loader.shutdown, True)
+
+    def test_services_are_built_concurrently(self):
+        """Both factories run at the same time on worker threads"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def factory(name):
+            barrier.wait()
+            return name
+
+        self.loader.submit("first", lambda: factory("first"))
+        self.loader.submit("second", lambda: factory("second"))
+
+        self.assertEqual(self.loader.get("first", timeout=5), "first")
+        self.assertEqual(self.loader.get("second", timeout=5), "second")
+        self.assertTrue(self.loader.all_ready())
+
+    def test_warm_up_runs_before_service_is_ready(self):
+        """The warm-up callback receives the new service and is timed"""
+        service = Mock()
+        warm_up = Mock()
+
+        self.loader.submit("model", lambda: service, warm_up=warm_up)
+
+        self.assertIs(self.loader.get("model", timeout=5), service)
+        warm_up.assert_called_once_with(service)
+        timings = self.loader.get_timings()["model"]
+        self.assertGreaterEqual(timings["init_ms"], 0)
+        self.assertGreaterEqual(timings["warmup_ms"], 0)
+
+    def test_service_waits_until_ready(self):
+        """A slow service is not ready before its factory returns"""
+        release = threading.Event()
+        self.loader.submit("slow", lambda: release.wait(5) and "slow")
+
+        self.assertFalse(self.loader.is_ready("slow"))
+        self.assertFalse(self.loader.all_ready())
+
+        release.set()
+        self.assertEqual(self.loader.get("slow", timeout=5), "slow")
+        self.assertTrue(self.loader.is_ready("slow"))
+
+    def test_build_error_is_raised_by_get(self):
+        """Errors of a factory reach the caller through the future"""
+
+        def failing_factory():
+            raise RuntimeError("model missing")
+
+        self.loader.submit("broken", failing_factory)
+
+        with self.assertRaises(RuntimeError):
+            self.loader.get("broken", timeout=5)
+        self.assertTrue(self.loader.is_ready("broken"))
+        self.assertNotIn("broken", self.loader.get_timings())
+
+
+if __name__ == "__main__":
+    unittest.main()
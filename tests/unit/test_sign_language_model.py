@@ -0,0 +1,43 @@
+"""
+Unit tests for the letter model
+"""
+
+import unittest
+
+import numpy as np
+
+from src.hand_detector import HandDetector
+from src.sign_language_model import BACKEND_COMPILED
+from tests.unit.helpers import load_model, train_forest
+
+
+class TestSignLanguageModelLandmarks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = load_model(train_forest(n_estimators=10), backend=BACKEND_COMPILED)
+
+    def test_landmark_prediction_matches_features(self):
+        """Landmark sets give the same predictions as their feature vectors"""
+        landmarks = np.random.default_rng(5).random((8, 21, 3)).astype(np.float32)
+        features = [HandDetector.landmarks_to_features(points) for points in landmarks]
+
+        self.assertEqual(
+            self.model.predict_landmarks_batch(landmarks),
+            self.model.predict_batch_with_confidence(features),
+        )
+        self.assertEqual(
+            self.model.predict_landmarks(landmarks[0][:, :2]),
+            self.model.predict_with_confidence(features[0]),
+        )
+
+    def test_empty_and_invalid_landmark_sets(self):
+        """No landmark sets give no predictions; wrong sizes give None"""
+        self.assertEqual(self.model.predict_landmarks_batch([]), ([], []))
+        self.assertEqual(
+            self.model.predict_landmarks_batch(np.zeros((2, 20, 2))),
+            ([None, None], [0.0, 0.0]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
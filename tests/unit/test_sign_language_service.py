@@ -1,4 +1,5 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -45,5 +46,194 @@ class TestSignLanguageService(unittest.TestCase):
             self.service.process_hand_data(empty_data)
 
 
+class TestSignLanguageServiceStages(unittest.TestCase):
+    def setUp(self):
+        """Setup with a mocked classifier (no model file required)"""
+        patcher = patch("src.sign_language_service.SignLanguageModel")
+        self.addCleanup(patcher.stop)
+        self.mock_model_class = patcher.start()
+        self.service = SignLanguageService()
+
+    def tearDown(self):
+        """Cleanup function to run after each test"""
+        self.service.release_resources()
+
+    def test_pipeline_matches_serial_processing(self):
+        """Pipelined stages give the same output as process_frame"""
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        outputs = []
+
+        pipeline = self.service.build_pipeline(sink=outputs.append).start()
+        pipeline.submit({"frame": frame.copy()})
+        pipeline.stop()
+
+        self.assertEqual(len(outputs), 1)
+        _, letter, stability = outputs[0]["output"]
+        _, serial_letter, serial_stability = self.service.process_frame(frame)
+        self.assertEqual(letter, serial_letter)
+        self.assertEqual(stability, serial_stability)
+
+    def test_motion_gate_skips_detection_on_static_frames(self):
+        """Static scenes reuse the previous detection"""
+        service = SignLanguageService(motion_threshold=2.0)
+        self.addCleanup(service.release_resources)
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+        with patch.object(service, "detect", wraps=service.detect) as mock_detect:
+            for _ in range(3):
+                service.process_frame(frame.copy())
+
+        self.assertEqual(mock_detect.call_count, 1)
+        self.assertEqual(service.get_detection_stats()["motion_gate"]["misses"], 1)
+
+    def test_hands_classified_in_one_batch_with_own_history(self):
+        """All hands share one model call and keep separate histories"""
+
+        def hand(x_offset, label):
+            landmarks = [
+                SimpleNamespace(x=x_offset + 0.01 * i, y=0.5, z=0.0) for i in range(21)
+            ]
+            handedness = SimpleNamespace(classification=[SimpleNamespace(label=label)])
+            return SimpleNamespace(landmark=landmarks), handedness
+
+        def results(*hands):
+            return SimpleNamespace(
+                multi_hand_landmarks=[h[0] for h in hands],
+                multi_handedness=[h[1] for h in hands],
+            )
+
+        model = self.mock_model_class.return_value
+        model.predict_batch_with_confidence.return_value = (["A", "B"], [0.9, 0.9])
+
+        left, right = hand(0.1, "Left"), hand(0.6, "Right")
+        hands = self.service.classify(results(left, right))
+        predict = model.predict_batch_with_confidence
+        self.assertEqual(predict.call_count, 1)
+        self.assertEqual(predict.call_args[0][0].shape, (2, 42))
+        self.service.update_prediction(hands[0]["letter"])
+
+        # Reordered hands keep their tracks; the active hand stays the same
+        predict.return_value = (["B", "A"], [0.9, 0.9])
+        hands = self.service.classify(results(right, left))
+        self.assertEqual(hands[1]["track"].track_id, self.service.active_track_id)
+        self.service.update_prediction(hands[1]["letter"])
+
+        self.assertEqual(list(self.service.last_predictions), ["A", "A"])
+        self.assertEqual(len(hands[0]["track"].stability), 0)
+
+    def test_still_hand_reuses_prediction(self):
+        """A hand that has not moved is not classified again"""
+        service = SignLanguageService(temporal_epsilon=0.01)
+        self.addCleanup(service.release_resources)
+        model = self.mock_model_class.return_value
+        model.predict_batch_with_confidence.return_value = (["A"], [0.9])
+
+        def results(offset):
+            landmarks = [
+                SimpleNamespace(x=0.3 + 0.01 * i + offset, y=0.4 + 0.01 * i, z=0.0)
+                for i in range(21)
+            ]
+            return SimpleNamespace(
+                multi_hand_landmarks=[SimpleNamespace(landmark=landmarks)]
+            )
+
+        for offset in (0.0, 0.002, 0.004, 0.05):
+            hands = service.classify(results(offset))
+            self.assertEqual((hands[0]["letter"], hands[0]["confidence"]), ("A", 0.9))
+
+        self.assertEqual(model.predict_batch_with_confidence.call_count, 2)
+        self.assertEqual(
+            service.get_detection_stats()["temporal_reuse"], {"hits": 2, "misses": 1}
+        )
+
+    def test_landmarks_skip_detection(self):
+        """Precomputed landmarks are tracked and classified without a frame"""
+        model = self.mock_model_class.return_value
+        model.predict_batch_with_confidence.return_value = (["A", "B"], [0.9, 0.8])
+        steps = 0.01 * np.arange(21)
+        points = np.stack(
+            [
+                np.column_stack([0.1 + steps, 0.4 + steps]),
+                np.column_stack([0.6 + steps, 0.4 + steps]),
+            ]
+        )
+
+        with patch.object(self.service, "detect") as mock_detect:
+            letter, stability = self.service.process_landmarks(points)
+            self.assertEqual((letter, self.service.last_confidence), ("A", 0.9))
+            self.assertIsNone(stability)
+
+            # The active hand keeps its track when the order changes
+            letter, _ = self.service.process_landmarks(points[::-1])
+            self.assertEqual((letter, self.service.last_confidence), ("B", 0.8))
+
+        mock_detect.assert_not_called()
+        self.assertEqual(model.predict_batch_with_confidence.call_count, 2)
+        self.assertEqual(
+            model.predict_batch_with_confidence.call_args[0][0].shape, (2, 42)
+        )
+        self.assertEqual(len(self.service.hand_tracker.tracks), 2)
+
+    def test_inactive_hands_use_the_frame_clock(self):
+        """Video timestamps reach the stability windows of every hand"""
+        service = SignLanguageService(stability_window_seconds=1.0)
+        self.addCleanup(service.release_resources)
+        model = self.mock_model_class.return_value
+        model.predict_batch_with_confidence.return_value = (["A", "B"], [0.9, 0.9])
+        steps = 0.01 * np.arange(21)
+        points = np.stack(
+            [
+                np.column_stack([0.1 + steps, 0.4 + steps]),
+                np.column_stack([0.6 + steps, 0.4 + steps]),
+            ]
+        )
+
+        for frame in range(90):  # 3 seconds of video at 30 fps
+            service.process_landmarks(points, timestamp=frame / 30)
+
+        inactive = [
+            track
+            for track in service.hand_tracker.tracks
+            if track.track_id != service.active_track_id
+        ][0]
+        # Only the last second is kept, and every frame has a weight
+        self.assertLessEqual(len(inactive.stability), 32)
+        self.assertGreater(inactive.stability.vote()[2], 0)
+
+    def test_shared_model_is_not_loaded_again(self):
+        """A model passed in (e.g. an InferenceBatcher) is used as is"""
+        self.mock_model_class.reset_mock()
+        shared = MagicMock()
+        service = SignLanguageService(model=shared)
+        self.addCleanup(service.release_resources)
+
+        self.assertIs(service.english_model, shared)
+        self.mock_model_class.assert_not_called()
+
+    def frames_until_stable(self, confidence):
+        self.service.clear_predictions()
+        for frame in range(1, 100):
+            if self.service.update_prediction("A", confidence)[3]:
+                return frame
+        return None
+
+    def test_confidence_weighted_commit(self):
+        """Confident letters commit sooner, borderline ones later"""
+        self.assertEqual(self.frames_until_stable(None), 20)
+        self.assertEqual(self.frames_until_stable(1.0), 5)
+        self.assertEqual(self.frames_until_stable(0.7), 20)
+        self.assertLess(self.frames_until_stable(0.9), 20)
+        self.assertGreater(self.frames_until_stable(0.5), 20)
+
+    def test_weighted_stability_favors_confident_letter(self):
+        """A confidently predicted letter outweighs an unsure one"""
+        for _ in range(5):
+            self.service.update_prediction("A", 1.0)
+            letter, stability, _, _ = self.service.update_prediction("B", 0.3)
+
+        self.assertEqual(letter, "A")
+        self.assertGreater(stability, 0.9)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the incremental stability tracker
+"""
+
+import random
+import unittest
+
+from src.stability_tracker import StabilityTracker
+
+
+def recount(letters, weights):
+    """Reference vote over the whole window."""
+    scores = {}
+    for letter, weight in zip(letters, weights):
+        scores[letter] = scores.get(letter, 0.0) + weight
+    leader = max(scores, key=scores.get)
+    return scores[leader], sum(scores.values())
+
+
+class TestStabilityTracker(unittest.TestCase):
+    def test_empty_window(self):
+        """An empty window has no leading letter and no stability"""
+        tracker = StabilityTracker()
+
+        self.assertEqual(tracker.vote(), (None, 0.0, 0.0))
+        self.assertIsNone(tracker.get_stability())
+        self.assertEqual(len(tracker), 0)
+
+    def test_frame_window_slides(self):
+        """Only the last max_frames frames are counted"""
+        tracker = StabilityTracker(max_frames=3)
+        for letter in "AABBB":
+            tracker.add(letter)
+
+        self.assertEqual(list(tracker), ["B", "B", "B"])
+        self.assertEqual(tracker.vote(), ("B", 3.0, 3.0))
+        self.assertEqual(tracker.get_stability(), 1.0)
+
+    def test_incremental_vote_matches_recount(self):
+        """Scores updated per frame match a full recount of the window"""
+        rng = random.Random(0)
+        tracker = StabilityTracker(max_frames=30)
+        letters, weights = [], []
+
+        for _ in range(500):
+            letter = rng.choice("ABC")
+            weight = rng.uniform(0.2, 4.0)
+            tracker.add(letter, weight)
+            letters, weights = (letters + [letter])[-30:], (weights + [weight])[-30:]
+
+            _, score, total = tracker.vote()
+            expected_score, expected_total = recount(letters, weights)
+            self.assertAlmostEqual(score, expected_score)
+            self.assertAlmostEqual(total, expected_total)
+
+    def test_time_window_is_independent_of_frame_rate(self):
+        """The same second of video gives the same scores at 15 and 60 fps"""
+        results = []
+        for fps in (15, 60):
+            tracker = StabilityTracker(max_frames=None, window_seconds=1.0)
+            for i in range(fps * 2):
+                letter = "A" if i < fps * 7 // 5 else "B"
+                tracker.add(letter, timestamp=i / fps)
+            results.append(tracker.vote())
+
+        (letter_15, score_15, total_15), (letter_60, score_60, total_60) = results
+        self.assertEqual(letter_15, letter_60)
+        self.assertAlmostEqual(score_15, score_60, places=6)
+        self.assertAlmostEqual(total_15, total_60, places=6)
+        self.assertAlmostEqual(total_60, 30.0, places=6)
+
+    def test_clear(self):
+        """Clearing empties the window"""
+        tracker = StabilityTracker()
+        tracker.add("A")
+        tracker.clear()
+
+        self.assertEqual(len(tracker), 0)
+        self.assertEqual(tracker.vote(), (None, 0.0, 0.0))
+
+    def test_invalid_window(self):
+        """A window needs a frame or time limit"""
+        with self.assertRaises(ValueError):
+            StabilityTracker(max_frames=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for multi-stream processing with a worker pool
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+import cv2
+import numpy as np
+
+from src.stream_pool import StreamPool
+from tests.unit.helpers import FakeService
+
+
+def write_video(path, frames=20, fps=100, size=(64, 48)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i * 10 % 255, dtype=np.uint8))
+    writer.release()
+
+
+class TestStreamPool(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.sources = []
+        for name in ("first.avi", "second.avi", "third.avi"):
+            path = os.path.join(self.directory.name, name)
+            write_video(path)
+            self.sources.append(path)
+
+    def test_streams_are_processed_with_separate_state(self):
+        """Every stream is processed and commits letters to its own text"""
+        pool = StreamPool(self.sources, pool_size=2, frame_size=(64, 48))
+        pool.start(FakeService)
+        self.addCleanup(pool.stop)
+
+        deadline = time.monotonic() + 30
+        while pool.is_running() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        stats = pool.get_stats()
+        self.assertEqual(len(stats), 3)
+        for stream_stats in stats.values():
+            self.assertGreater(stream_stats["processed_frames"], 0)
+        self.assertEqual(
+            [stream.worker for stream in pool.streams],
+            [pool.workers[0], pool.workers[1], pool.workers[0]],
+        )
+
+        # FakeService becomes stable on the third frame of a stream
+        for stream in pool.streams:
+            if stream.processed_frames >= 3:
+                self.assertTrue(stream.state.get_display_text().startswith("A"))
+
+    def test_mosaic_layout(self):
+        """Tiles are laid out in a square-ish grid"""
+        pool = StreamPool(self.sources, pool_size=1, frame_size=(64, 48))
+        pool.start(FakeService)
+        self.addCleanup(pool.stop)
+
+        mosaic = pool.get_mosaic(tile_size=(32, 24))
+        self.assertEqual(mosaic.shape, (48, 64, 3))
+
+    def test_missing_source(self):
+        """Sources that cannot be opened fail the start"""
+        pool = StreamPool([os.path.join(self.directory.name, "missing.avi")])
+
+        with self.assertRaises(IOError):
+            pool.start(FakeService)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,12 @@
 import tkinter as tk
 from tkinter import messagebox
 
-import customtkinter as ctk
-import cv2
-from PIL import Image
+from src.lazy_import import lazy_import
 
-# Modern görünüm için customtkinter ayarları
-ctk.set_appearance_mode("dark")  # "dark" veya "light"
-ctk.set_default_color_theme(
-    "blue"
-)  # "blue" (mavi), "green" (yeşil), "dark-blue" (koyu mavi)
+# Ağır kütüphaneler ilk kullanımda yüklenir
+ctk = lazy_import("customtkinter")
+cv2 = lazy_import("cv2")
+PIL_Image = lazy_import("PIL.Image")
 
 
 class AppUI:
@@ -30,6 +27,11 @@ class AppUI:
         self.root.bind("<Configure>", self.on_window_resize)
 
     def configure_theme(self):
+        # Modern görünüm için customtkinter ayarları
+        ctk.set_appearance_mode("dark")  # "dark" veya "light"
+        ctk.set_default_color_theme(
+            "blue"
+        )  # "blue" (mavi), "green" (yeşil), "dark-blue" (koyu mavi)
         # Ana pencere ayarları
         self.root.configure(bg="#1A1A1A")
         # Renk paleti
@@ -488,7 +490,7 @@ class AppUI:
             # OpenCV BGR'dan RGB'ye dönüştür
             img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
             # RGB'yi PIL Image'a çevir
-            img_pil = Image.fromarray(img)
+            img_pil = PIL_Image.fromarray(img)
             # PIL Image'ı CTkImage'a çevir
             ctk_img = ctk.CTkImage(
                 light_image=img_pil, dark_image=img_pil, size=(640, 480)